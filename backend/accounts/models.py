@@ -25,6 +25,7 @@ class User(AbstractUser):
     is_email_verified = models.BooleanField(default=False)
     email_notifications = models.BooleanField(default=True)
     sms_notifications = models.BooleanField(default=False)
+    calendar_feed_token = models.CharField(max_length=64, unique=True, null=True, blank=True)
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
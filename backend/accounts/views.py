@@ -88,30 +88,19 @@ def dashboard_stats(request):
     user = request.user
     
     # Import here to avoid circular imports
-    from meetings.models import Meeting
+    from meetings.stats import get_meeting_stats
     from events.models import EventType
     
-    # Get meeting statistics
-    meetings = Meeting.objects.filter(organizer=user)
-    confirmed_meetings = meetings.filter(status='confirmed').count()
-    pending_meetings = meetings.filter(status='pending').count()
-    cancelled_meetings = meetings.filter(status='cancelled').count()
-    
-    # Today's meetings
-    from django.utils import timezone
-    today = timezone.now().date()
-    todays_meetings = meetings.filter(
-        start_time__date=today,
-        status__in=['confirmed', 'pending']
-    ).count()
+    # Meeting counters share one cached aggregate query with meeting_stats
+    stats = get_meeting_stats(user)
     
     # Event types count
     event_types_count = EventType.objects.filter(user=user).count()
     
     return Response({
-        'confirmed_meetings': confirmed_meetings,
-        'pending_meetings': pending_meetings,
-        'cancelled_meetings': cancelled_meetings,
-        'todays_meetings': todays_meetings,
+        'confirmed_meetings': stats['confirmed_meetings'],
+        'pending_meetings': stats['pending_meetings'],
+        'cancelled_meetings': stats['cancelled_meetings'],
+        'todays_meetings': stats['todays_meetings'],
         'event_types_count': event_types_count,
     })
\ No newline at end of file
@@ -1,7 +1,7 @@
 from django.contrib import admin
 from .models import (
     WeeklyAvailability, DateOverride, BufferTime, 
-    TimeZoneSettings, CalendarIntegration, AvailabilityRule
+    TimeZoneSettings, CalendarIntegration, AvailabilityRule, MaterializedSlotDay
 )
 
 
@@ -46,4 +46,12 @@ class CalendarIntegrationAdmin(admin.ModelAdmin):
 class AvailabilityRuleAdmin(admin.ModelAdmin):
     list_display = ('user', 'rule_type', 'is_active', 'created_at')
     list_filter = ('rule_type', 'is_active', 'created_at')
-    search_fields = ('user__email', 'user__first_name', 'user__last_name')
\ No newline at end of file
+    search_fields = ('user__email', 'user__first_name', 'user__last_name')
+
+
+@admin.register(MaterializedSlotDay)
+class MaterializedSlotDayAdmin(admin.ModelAdmin):
+    list_display = ('event_type', 'day', 'duration', 'is_complete', 'computed_at', 'invalidated_at')
+    list_filter = ('is_complete', 'day')
+    search_fields = ('event_type__name', 'event_type__user__email')
+    readonly_fields = ('slot_offsets', 'computed_at', 'invalidated_at')
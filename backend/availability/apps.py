@@ -3,4 +3,7 @@ from django.apps import AppConfig
 
 class AvailabilityConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'availability'
\ No newline at end of file
+    name = 'availability'
+
+    def ready(self):
+        import availability.signals
\ No newline at end of file
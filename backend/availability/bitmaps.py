@@ -0,0 +1,282 @@
+"""
+Compact per-organizer availability bitmaps.
+
+Each UTC day is stored as two integers used as fixed-width bitsets with one
+bit per BIN_MINUTES bin: the open bitmap (availability rules and overrides)
+and the busy bitmap (confirmed/pending meetings). Slot search is then done
+with bitwise AND and shift operations over the whole horizon at once.
+
+Bitmaps live in the Django cache. Meeting writes update the busy bitmaps of
+the affected days in place, while availability writes bump a per-organizer
+generation so open bitmaps are rebuilt lazily on the next read.
+"""
+import math
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+
+from django.core.cache import cache
+
+from .slots import (
+    BUSY_MEETING_STATUSES, SLOT_GRANULARITY, build_free_intervals,
+    date_range, get_booking_window, get_event_type_buffers, group_weekly,
+    load_availability_sources, load_busy_intervals,
+)
+from utils.timezones import get_zone
+
+BIN_MINUTES = 5
+BINS_PER_DAY = 24 * 60 // BIN_MINUTES
+
+# Cached bitmaps expire so that any lost concurrent update heals itself
+BITMAP_TIMEOUT = 60 * 60
+
+
+def _generation_key(user_id):
+    return f'availability_bitmap:gen:{user_id}'
+
+
+def _open_key(user_id, generation, tz, schedule_id, day):
+    return f'availability_bitmap:open:{user_id}:{generation}:{tz}:{schedule_id}:{day.isoformat()}'
+
+
+def _busy_key(user_id, day):
+    return f'availability_bitmap:busy:{user_id}:{day.isoformat()}'
+
+
+def _day_origin(day):
+    return datetime.combine(day, time.min, tzinfo=dt_timezone.utc)
+
+
+def utc_days(start, end):
+    """UTC dates touched by the [start, end) instant range"""
+    last = (end - timedelta(microseconds=1)).astimezone(dt_timezone.utc).date()
+    return list(date_range(start.astimezone(dt_timezone.utc).date(), last))
+
+
+def intervals_to_bits(intervals, origin, bins, inward):
+    """
+    Set the bins covered by intervals, counted from origin.
+
+    Open time is rounded inward (only whole free bins are set), busy time is
+    rounded outward (any touched bin is set).
+    """
+    bits = 0
+    for start, end in intervals:
+        first = (start - origin).total_seconds() / 60 / BIN_MINUTES
+        last = (end - origin).total_seconds() / 60 / BIN_MINUTES
+        if inward:
+            first, last = math.ceil(first), math.floor(last)
+        else:
+            first, last = math.floor(first), math.ceil(last)
+        first, last = max(first, 0), min(last, bins)
+        if first < last:
+            bits |= ((1 << (last - first)) - 1) << first
+    return bits
+
+
+def reach(bits, length):
+    """Bit i is set when any of bits i .. i + length - 1 is set"""
+    result = bits
+    span = 1
+    while span < length:
+        shift = min(span, length - span)
+        result |= result >> shift
+        span += shift
+    return result
+
+
+def bit_runs(bits):
+    """(first, end) bin indexes of every run of consecutive set bits, in order"""
+    while bits:
+        first = (bits & -bits).bit_length() - 1
+        shifted = bits >> first
+        length = (~shifted & (shifted + 1)).bit_length() - 1
+        yield first, first + length
+        bits &= ~(((1 << length) - 1) << first)
+
+
+def build_open_bitmaps(user, days, custom_weekly=None, schedule_id=0, generation=0):
+    """Build and cache open bitmaps for a set of UTC days"""
+    tz = get_zone(user.timezone)
+    start_date = min(days) - timedelta(days=1)
+    end_date = max(days) + timedelta(days=1)
+    sources = load_availability_sources([user.id], start_date, end_date)[user.id]
+    free = build_free_intervals(tz, start_date, end_date, sources, custom_weekly)
+
+    bitmaps = {
+        day: intervals_to_bits(free, _day_origin(day), BINS_PER_DAY, inward=True)
+        for day in days
+    }
+    cache.set_many(
+        {_open_key(user.id, generation, tz, schedule_id, day): bits for day, bits in bitmaps.items()},
+        BITMAP_TIMEOUT
+    )
+    return bitmaps, sources['buffer']
+
+
+def build_busy_bitmaps(user_id, days):
+    """Build and cache busy bitmaps for a set of UTC days with one meeting query"""
+    start = _day_origin(min(days))
+    end = _day_origin(max(days) + timedelta(days=1))
+    busy = load_busy_intervals([user_id], start, end)[user_id]
+
+    bitmaps = {
+        day: intervals_to_bits(busy, _day_origin(day), BINS_PER_DAY, inward=False)
+        for day in days
+    }
+    cache.set_many(
+        {_busy_key(user_id, day): bits for day, bits in bitmaps.items()},
+        BITMAP_TIMEOUT
+    )
+    return bitmaps
+
+
+def get_horizon_bitmaps(event_type, days):
+    """
+    Return (open, busy) bitsets spanning the given contiguous UTC days.
+
+    Day n occupies bits n * BINS_PER_DAY onwards. Missing days are built in
+    bulk; fully cached horizons cost two cache round trips.
+    """
+    user = event_type.user
+    tz = get_zone(user.timezone)
+    generation = cache.get(_generation_key(user.id), 0)
+    # Event types with their own weekly hours get a separate open bitmap
+    custom_rows = list(event_type.custom_availability.all())
+    schedule_id = event_type.id if custom_rows else 0
+
+    open_keys = {day: _open_key(user.id, generation, tz, schedule_id, day) for day in days}
+    busy_keys = {day: _busy_key(user.id, day) for day in days}
+    cached = cache.get_many(list(open_keys.values()) + list(busy_keys.values()))
+
+    open_bitmaps = {day: cached[key] for day, key in open_keys.items() if key in cached}
+    busy_bitmaps = {day: cached[key] for day, key in busy_keys.items() if key in cached}
+
+    buffer_time = None
+    missing_open = [day for day in days if day not in open_bitmaps]
+    if missing_open:
+        built, buffer_time = build_open_bitmaps(
+            user, missing_open, group_weekly(custom_rows), schedule_id, generation
+        )
+        open_bitmaps.update(built)
+    missing_busy = [day for day in days if day not in busy_bitmaps]
+    if missing_busy:
+        busy_bitmaps.update(build_busy_bitmaps(user.id, missing_busy))
+
+    open_bits = 0
+    busy_bits = 0
+    for index, day in enumerate(days):
+        open_bits |= open_bitmaps[day] << (index * BINS_PER_DAY)
+        busy_bits |= busy_bitmaps[day] << (index * BINS_PER_DAY)
+
+    if buffer_time is None:
+        from .models import BufferTime
+        buffer_time = BufferTime.objects.filter(user_id=user.id).first()
+
+    return open_bits, busy_bits, buffer_time
+
+
+def get_bitmap_slots(event_type, start_date, end_date, now=None):
+    """
+    Bookable (start, end) slots for an event type using the bitmap store.
+
+    Free time is found with bitwise operations, then cut into slots like
+    split_into_slots does: from the first SLOT_GRANULARITY boundary of each
+    free run, one event duration after another. Availability is rounded
+    inward and meetings and buffers outward to BIN_MINUTES, so the slots
+    match the interval engine whenever those fall on bin boundaries.
+    """
+    tz = get_zone(event_type.user.timezone)
+    earliest, latest = get_booking_window(event_type, now)
+    range_start = max(datetime.combine(start_date, time.min, tzinfo=tz), earliest)
+    range_end = min(datetime.combine(end_date + timedelta(days=1), time.min, tzinfo=tz), latest)
+    if range_start >= range_end:
+        return []
+
+    # One extra day on each side keeps meeting buffers across the edges
+    days = utc_days(range_start - timedelta(days=1), range_end + timedelta(days=1))
+    origin = _day_origin(days[0])
+    total_bins = len(days) * BINS_PER_DAY
+
+    open_bits, busy_bits, buffer_time = get_horizon_bitmaps(event_type, days)
+    before, after = get_event_type_buffers(event_type, buffer_time)
+    before_bins = math.ceil(before / BIN_MINUTES)
+    after_bins = math.ceil(after / BIN_MINUTES)
+
+    window = intervals_to_bits([(range_start, range_end)], origin, total_bins, inward=True)
+    # A bin is blocked when a meeting lies within the buffers around it
+    blocked = reach(busy_bits, after_bins + 1 + before_bins) << before_bins
+    free_bits = open_bits & window & ~blocked & ((1 << total_bins) - 1)
+
+    slots = []
+    duration = event_type.duration
+    length = timedelta(minutes=duration)
+    for first, end in bit_runs(free_bits):
+        # origin is midnight UTC, so minute offsets share the slot grid
+        cursor = -(-first * BIN_MINUTES // SLOT_GRANULARITY) * SLOT_GRANULARITY
+        while cursor + duration <= end * BIN_MINUTES:
+            start = origin + timedelta(minutes=cursor)
+            slots.append((start, start + length))
+            cursor += duration
+    return slots
+
+
+def bump_generation(user_id):
+    """Invalidate every open bitmap of an organizer"""
+    key = _generation_key(user_id)
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, None)
+
+
+def invalidate_busy_days(user_id, start, end):
+    """Drop cached busy bitmaps touched by [start, end) so they are rebuilt"""
+    if start is None or end is None:
+        return
+    cache.delete_many([_busy_key(user_id, day) for day in utc_days(start, end)])
+
+
+def mark_busy(user_id, start, end):
+    """Set busy bins for a new meeting in the cached bitmaps that exist"""
+    days = utc_days(start, end)
+    keys = {day: _busy_key(user_id, day) for day in days}
+    cached = cache.get_many(list(keys.values()))
+    updates = {}
+    for day, key in keys.items():
+        if key in cached:
+            updates[key] = cached[key] | intervals_to_bits(
+                [(start, end)], _day_origin(day), BINS_PER_DAY, inward=False
+            )
+    if updates:
+        cache.set_many(updates, BITMAP_TIMEOUT)
+
+
+def meeting_snapshot(meeting):
+    """The meeting fields that affect busy time"""
+    return {
+        'organizer_id': meeting.organizer_id,
+        'status': meeting.status,
+        'start_time': meeting.start_time,
+        'end_time': meeting.end_time,
+    }
+
+
+def apply_meeting_change(current, previous=None):
+    """
+    Update busy bitmaps after a meeting write.
+
+    current and previous are meeting snapshots; current is None for deletes.
+    New busy time is OR-ed in place. Freed time cannot simply be cleared
+    because meetings may overlap, so those days are rebuilt on next read.
+    """
+    previous = previous or {}
+    current = current or {}
+    was_busy = previous.get('status') in BUSY_MEETING_STATUSES
+    is_busy = current.get('status') in BUSY_MEETING_STATUSES
+    old_range = (previous.get('start_time'), previous.get('end_time'))
+    new_range = (current.get('start_time'), current.get('end_time'))
+
+    if was_busy and (not is_busy or old_range != new_range):
+        invalidate_busy_days(previous['organizer_id'], *old_range)
+    if is_busy and (not was_busy or old_range != new_range):
+        mark_busy(current['organizer_id'], *new_range)
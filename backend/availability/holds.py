@@ -0,0 +1,125 @@
+"""
+Short-lived slot holds.
+
+While an invitee fills in the booking form the picked slot is held in the
+cache for SLOT_HOLD_SECONDS. Exclusivity comes from one cache.add per lock
+bucket the slot covers, so two invitees cannot hold overlapping time. The
+bucket keys are the only record of held time: they expire with the hold, so
+nothing needs sweeping, and slot listings treat a slot as held by reading
+the bucket keys of all listed slots with a single get_many.
+"""
+import secrets
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+
+def _hold_key(token):
+    return f'slot_holds:hold:{token}'
+
+
+def _bucket_key(organizer_id, bucket):
+    return f'slot_holds:bucket:{organizer_id}:{int(bucket.timestamp())}'
+
+
+def hold_seconds():
+    return getattr(settings, 'SLOT_HOLD_SECONDS', 5 * 60)
+
+
+def _buckets(start, end):
+    from meetings.reservations import lock_buckets
+    return lock_buckets(start, end)
+
+
+def place_hold(organizer_id, event_type_id, start, end, now=None):
+    """Hold [start, end) for an organizer, or return None if any of it is held"""
+    now = now or timezone.now()
+    ttl = hold_seconds()
+    token = secrets.token_urlsafe(16)
+
+    acquired = []
+    for bucket in _buckets(start, end):
+        key = _bucket_key(organizer_id, bucket)
+        if not cache.add(key, token, ttl):
+            cache.delete_many(acquired)
+            return None
+        acquired.append(key)
+
+    hold = {
+        'token': token,
+        'organizer_id': organizer_id,
+        'event_type_id': event_type_id,
+        'start_time': start.isoformat(),
+        'end_time': end.isoformat(),
+        'expires_at': datetime.fromtimestamp(now.timestamp() + ttl, dt_timezone.utc).isoformat(),
+    }
+    cache.set(_hold_key(token), hold, ttl)
+    return hold
+
+
+def get_hold(token):
+    """The live hold for a token, or None once it has expired or been released"""
+    return cache.get(_hold_key(token)) if token else None
+
+
+def release_hold(token):
+    """Release a hold before it expires"""
+    hold = get_hold(token)
+    if hold is None:
+        return False
+
+    start = datetime.fromisoformat(hold['start_time'])
+    end = datetime.fromisoformat(hold['end_time'])
+    keys = [_bucket_key(hold['organizer_id'], bucket) for bucket in _buckets(start, end)]
+    owned = [key for key, value in cache.get_many(keys).items() if value == token]
+    cache.delete_many(owned + [_hold_key(token)])
+    return True
+
+
+def is_held(organizer_id, start, end, except_token=None):
+    """Whether any part of [start, end) is held by someone other than except_token"""
+    keys = [_bucket_key(organizer_id, bucket) for bucket in _buckets(start, end)]
+    return any(value != except_token for value in cache.get_many(keys).values())
+
+
+def held_organizers(organizer_ids, start, end):
+    """Organizers with any part of [start, end) held, in one cache round trip"""
+    keys = {
+        _bucket_key(organizer_id, bucket): organizer_id
+        for organizer_id in organizer_ids
+        for bucket in _buckets(start, end)
+    }
+    return {keys[key] for key in cache.get_many(list(keys))}
+
+
+def exclude_held_slots(slots, organizer_ids):
+    """
+    Drop {'start_time', 'end_time'} slots that are held for every organizer.
+
+    With several organizers (a round-robin pool) a slot stays listed while at
+    least one of them has not been held at that time.
+    """
+    if not slots or not organizer_ids:
+        return slots
+
+    slot_keys = []
+    for slot in slots:
+        buckets = _buckets(
+            datetime.fromisoformat(slot['start_time']),
+            datetime.fromisoformat(slot['end_time'])
+        )
+        slot_keys.append([
+            [_bucket_key(organizer_id, bucket) for bucket in buckets]
+            for organizer_id in organizer_ids
+        ])
+
+    held = cache.get_many([key for per_organizer in slot_keys for keys in per_organizer for key in keys])
+    if not held:
+        return slots
+
+    return [
+        slot for slot, per_organizer in zip(slots, slot_keys)
+        if not all(any(key in held for key in keys) for keys in per_organizer)
+    ]
@@ -0,0 +1,202 @@
+"""
+Materialized free-slot horizon.
+
+The busiest event types get their next SLOT_MATERIALIZATION_DAYS of bookable
+slots written to MaterializedSlotDay, one row per local day holding packed
+slot start offsets. Writes that can change slots only mark the affected rows
+as invalidated; the periodic refresh recomputes just those, plus missing and
+incomplete days. Public reads use the rows when every requested day is fresh
+and fall back to live computation otherwise.
+"""
+from collections import defaultdict
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from utils.timezones import get_zone
+from .models import AvailabilityRule, MaterializedSlotDay
+from .slots import date_range, find_slots, get_booking_window, get_event_type_hosts
+
+MATERIALIZED_EVENT_TYPES_KEY = 'materialized_slots:event_types'
+
+# Rules relative to the current time cannot be precomputed
+NOW_RELATIVE_RULES = ['minimum_notice', 'maximum_advance']
+
+# Bookings counted when picking the busiest event types
+POPULARITY_WINDOW_DAYS = 30
+
+
+def _midnight(day, tz):
+    return datetime.combine(day, time.min, tzinfo=tz).astimezone(dt_timezone.utc)
+
+
+def pack_slots(slots, day, tz):
+    """Slot start times as minutes after local midnight"""
+    midnight = _midnight(day, tz)
+    return [int((start - midnight).total_seconds() // 60) for start, end in slots]
+
+
+def unpack_slots(offsets, day, tz, duration):
+    """(start, end) UTC slots from packed minute offsets"""
+    midnight = _midnight(day, tz)
+    length = timedelta(minutes=duration)
+    slots = []
+    for offset in offsets:
+        start = midnight + timedelta(minutes=offset)
+        slots.append((start, start + length))
+    return slots
+
+
+def select_event_types(limit, now=None):
+    """Active event types with the most recent bookings that can be materialized"""
+    from events.models import EventType
+
+    now = now or timezone.now()
+    candidates = list(
+        EventType.objects.filter(
+            is_active=True,
+            meetings__created_at__gte=now - timedelta(days=POPULARITY_WINDOW_DAYS)
+        ).annotate(
+            recent_bookings=Count('meetings')
+        ).select_related('user').order_by('-recent_bookings')[:limit]
+    )
+
+    excluded_users = set(AvailabilityRule.objects.filter(
+        is_active=True,
+        rule_type__in=NOW_RELATIVE_RULES
+    ).values_list('user_id', flat=True))
+
+    selected = []
+    for event_type in candidates:
+        user_ids = {host.id for host in get_event_type_hosts(event_type)} | {event_type.user_id}
+        if not user_ids & excluded_users:
+            selected.append(event_type)
+    return selected
+
+
+def _needs_refresh(row, event_type):
+    return (
+        row is None
+        or not row.is_fresh
+        or not row.is_complete
+        or row.duration != event_type.duration
+    )
+
+
+def _runs(days):
+    """Group sorted dates into runs of consecutive days"""
+    runs = []
+    for day in days:
+        if runs and day == runs[-1][1] + timedelta(days=1):
+            runs[-1][1] = day
+        else:
+            runs.append([day, day])
+    return runs
+
+
+def refresh_event_type(event_type, now=None):
+    """
+    Recompute the invalidated, incomplete and missing days of an event type.
+
+    Consecutive days are computed together so each run costs one slot search.
+    Returns the number of days written.
+    """
+    now = now or timezone.now()
+    tz = get_zone(event_type.user.timezone)
+    today = now.astimezone(tz).date()
+    latest = get_booking_window(event_type, now)[1]
+    horizon = getattr(settings, 'SLOT_MATERIALIZATION_DAYS', 60)
+    last_day = min(today + timedelta(days=horizon - 1), latest.astimezone(tz).date())
+
+    event_type.materialized_slot_days.filter(Q(day__lt=today) | Q(day__gt=last_day)).delete()
+    rows = {row.day: row for row in event_type.materialized_slot_days.all()}
+    pending = [day for day in date_range(today, last_day) if _needs_refresh(rows.get(day), event_type)]
+
+    from events.day_counts import get_full_days
+
+    refreshed = []
+    for first, last in _runs(pending):
+        by_day = defaultdict(list)
+        for slot in find_slots(event_type, first, last, now):
+            by_day[slot[0].astimezone(tz).date()].append(slot)
+        for day in get_full_days(event_type, first, last):
+            by_day.pop(day, None)
+        for day in date_range(first, last):
+            refreshed.append(MaterializedSlotDay(
+                event_type=event_type,
+                day=day,
+                slot_offsets=pack_slots(by_day.get(day, []), day, tz),
+                duration=event_type.duration,
+                is_complete=_midnight(day + timedelta(days=1), tz) <= latest,
+                computed_at=now,
+            ))
+
+    MaterializedSlotDay.objects.bulk_create(
+        refreshed,
+        update_conflicts=True,
+        unique_fields=['event_type', 'day'],
+        update_fields=['slot_offsets', 'duration', 'is_complete', 'computed_at'],
+    )
+    return len(refreshed)
+
+
+def refresh_materialized_slots(now=None):
+    """Refresh the horizon of the busiest event types and drop the rest"""
+    now = now or timezone.now()
+    limit = getattr(settings, 'SLOT_MATERIALIZATION_EVENT_TYPES', 50)
+    event_types = select_event_types(limit, now) if limit else []
+    event_type_ids = [event_type.id for event_type in event_types]
+
+    MaterializedSlotDay.objects.exclude(event_type_id__in=event_type_ids).delete()
+    refreshed = sum(refresh_event_type(event_type, now) for event_type in event_types)
+    cache.set(MATERIALIZED_EVENT_TYPES_KEY, event_type_ids, None)
+    return refreshed
+
+
+def invalidate_days(user_ids, first_day=None, last_day=None):
+    """Mark rows of every event type owned or hosted by these users as invalidated"""
+    rows = MaterializedSlotDay.objects.filter(
+        Q(event_type__user_id__in=user_ids)
+        | Q(
+            event_type__hosts__host_id__in=user_ids,
+            event_type__hosts__is_active=True,
+            event_type__hosts__accepted_at__isnull=False
+        )
+    )
+    if first_day is not None:
+        rows = rows.filter(day__gte=first_day)
+    if last_day is not None:
+        rows = rows.filter(day__lte=last_day)
+    return MaterializedSlotDay.objects.filter(
+        id__in=rows.values('id')
+    ).update(invalidated_at=timezone.now())
+
+
+def get_materialized_slots(event_type, start_date, end_date, now=None):
+    """
+    Bookable slots read from the materialized table with one indexed query.
+
+    Returns None unless every requested day is present, fresh and complete,
+    so callers can fall back to computing the slots.
+    """
+    if event_type.id not in (cache.get(MATERIALIZED_EVENT_TYPES_KEY) or []):
+        return None
+
+    rows = list(event_type.materialized_slot_days.filter(day__gte=start_date, day__lte=end_date))
+    if len(rows) != (end_date - start_date).days + 1:
+        return None
+    if any(_needs_refresh(row, event_type) for row in rows):
+        return None
+
+    now = now or timezone.now()
+    tz = get_zone(event_type.user.timezone)
+    earliest, latest = get_booking_window(event_type, now)
+    slots = []
+    for row in rows:
+        for start, end in unpack_slots(row.slot_offsets, row.day, tz, row.duration):
+            if start >= earliest and end <= latest:
+                slots.append({'start_time': start.isoformat(), 'end_time': end.isoformat()})
+    return slots
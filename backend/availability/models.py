@@ -179,4 +179,30 @@ class AvailabilityRule(models.Model):
         ordering = ['rule_type']
 
     def __str__(self):
-        return f"{self.user.full_name} - {self.get_rule_type_display()}"
\ No newline at end of file
+        return f"{self.user.full_name} - {self.get_rule_type_display()}"
+
+class MaterializedSlotDay(models.Model):
+    """Precomputed bookable slots for one event type on one local day"""
+
+    event_type = models.ForeignKey('events.EventType', on_delete=models.CASCADE, related_name='materialized_slot_days')
+    day = models.DateField()
+
+    # Slot start times in minutes after local midnight
+    slot_offsets = models.JSONField(default=list)
+    duration = models.IntegerField()
+
+    # False when the booking horizon ended inside this day at compute time
+    is_complete = models.BooleanField(default=True)
+    computed_at = models.DateTimeField()
+    invalidated_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        unique_together = ['event_type', 'day']
+        ordering = ['event_type', 'day']
+
+    def __str__(self):
+        return f"{self.event_type.name} - {self.day} ({len(self.slot_offsets)} slots)"
+
+    @property
+    def is_fresh(self):
+        return self.invalidated_at is None or self.invalidated_at < self.computed_at
@@ -0,0 +1,239 @@
+"""
+Compiled availability rules.
+
+Active AvailabilityRule rows are compiled once per organizer and request into
+a pipeline of slot predicates. Daily and weekly limits are fed by a single
+grouped COUNT over meetings per local date, so evaluating a slot never runs
+a query.
+"""
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+
+from django.db.models import Count, Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from utils.timezones import get_zone
+from .models import AvailabilityRule
+from .slots import BUSY_MEETING_STATUSES, load_busy_intervals
+
+
+# Upper bounds keep compiled rules within datetime range
+MAX_RULE_MINUTES = 365 * 24 * 60
+MAX_RULE_LIMIT = 1000
+
+
+def _count_parameter(parameters, name, maximum):
+    """A whole-number parameter between 0 and maximum, or None when it is not set"""
+    if not isinstance(parameters, dict):
+        raise ValueError('Rule parameters must be an object')
+    value = parameters.get(name)
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        raise ValueError(f"'{name}' must be a number")
+    try:
+        value = int(value)
+    except (ValueError, OverflowError):
+        # Non-finite floats such as 1e400 cannot be converted either
+        raise ValueError(f"'{name}' must be a number")
+    if value < 0:
+        raise ValueError(f"'{name}' cannot be negative")
+    if value > maximum:
+        raise ValueError(f"'{name}' cannot exceed {maximum}")
+    return value
+
+
+def rule_minutes(parameters):
+    """Duration of a rule in minutes from 'minutes', 'hours' and 'days' parameters, at most a year"""
+    minutes = (
+        (_count_parameter(parameters, 'minutes', MAX_RULE_MINUTES) or 0)
+        + (_count_parameter(parameters, 'hours', MAX_RULE_MINUTES // 60) or 0) * 60
+        + (_count_parameter(parameters, 'days', MAX_RULE_MINUTES // (24 * 60)) or 0) * 24 * 60
+    )
+    if minutes > MAX_RULE_MINUTES:
+        raise ValueError('Rule durations cannot exceed 365 days')
+    return minutes
+
+
+def rule_limit(parameters):
+    """Meeting limit of a daily or weekly rule, or None when the rule sets none"""
+    limit = _count_parameter(parameters, 'limit', MAX_RULE_LIMIT)
+    if limit is None:
+        limit = _count_parameter(parameters, 'max_meetings', MAX_RULE_LIMIT)
+    return limit
+
+
+LIMIT_RULES = ['daily_limit', 'weekly_limit']
+
+
+def validate_rule_parameters(rule_type, parameters):
+    """Raise ValueError when a rule's parameters cannot be compiled"""
+    if rule_type in LIMIT_RULES:
+        if rule_limit(parameters) is None:
+            raise ValueError("Limit rules need a 'limit' parameter")
+    else:
+        rule_minutes(parameters)
+
+
+def week_start(day):
+    return day - timedelta(days=day.weekday())
+
+
+class RulePipeline:
+    """Slot predicates compiled from one organizer's rules"""
+
+    def __init__(self, predicates=None):
+        self.predicates = predicates or []
+
+    def __bool__(self):
+        return bool(self.predicates)
+
+    def allows(self, start, end):
+        return all(predicate(start, end) for predicate in self.predicates)
+
+    def filter(self, slots):
+        if not self.predicates:
+            return list(slots)
+        return [slot for slot in slots if self.allows(*slot)]
+
+
+def load_rules(user_ids, event_type):
+    """Active rules for several organizers that apply to an event type, in one query"""
+    rules = defaultdict(list)
+    queryset = AvailabilityRule.objects.filter(
+        user_id__in=user_ids,
+        is_active=True
+    ).filter(
+        Q(applies_to_event_types__isnull=True) | Q(applies_to_event_types=event_type)
+    ).distinct()
+    for rule in queryset:
+        rules[rule.user_id].append(rule)
+    return rules
+
+
+def count_meetings_by_day(user_ids, tz, start, end):
+    """Busy meetings per (organizer, local date) with one grouped query"""
+    from meetings.models import Meeting
+
+    rows = Meeting.objects.filter(
+        organizer_id__in=user_ids,
+        status__in=BUSY_MEETING_STATUSES,
+        start_time__gte=start,
+        start_time__lt=end
+    ).annotate(
+        day=TruncDate('start_time', tzinfo=tz)
+    ).values('organizer_id', 'day').annotate(count=Count('id')).order_by()
+
+    counts = defaultdict(dict)
+    for row in rows:
+        counts[row['organizer_id']][row['day']] = row['count']
+    return counts
+
+
+def _applies_on(rule, tz):
+    """Predicate wrapper honouring a rule's weekday restriction"""
+    weekdays = set(rule.applies_to_weekdays or [])
+    if not weekdays:
+        return lambda start: True
+    return lambda start: start.astimezone(tz).weekday() in weekdays
+
+
+def _compile_rule(rule, tz, now, daily_counts, busy):
+    applies = _applies_on(rule, tz)
+    parameters = rule.parameters or {}
+    try:
+        validate_rule_parameters(rule.rule_type, parameters)
+    except (ValueError, TypeError, OverflowError):
+        # Rules saved before parameters were validated are ignored, not fatal
+        return None
+
+    if rule.rule_type == 'minimum_notice':
+        earliest = now + timedelta(minutes=rule_minutes(parameters))
+        return lambda start, end: not applies(start) or start >= earliest
+
+    if rule.rule_type == 'maximum_advance':
+        latest = now + timedelta(minutes=rule_minutes(parameters))
+        return lambda start, end: not applies(start) or start <= latest
+
+    if rule.rule_type == 'daily_limit':
+        limit = rule_limit(parameters)
+
+        def within_daily_limit(start, end):
+            if not applies(start):
+                return True
+            return daily_counts.get(start.astimezone(tz).date(), 0) < limit
+        return within_daily_limit
+
+    if rule.rule_type == 'weekly_limit':
+        limit = rule_limit(parameters)
+        weekly_counts = defaultdict(int)
+        for day, count in daily_counts.items():
+            weekly_counts[week_start(day)] += count
+
+        def within_weekly_limit(start, end):
+            if not applies(start):
+                return True
+            return weekly_counts[week_start(start.astimezone(tz).date())] < limit
+        return within_weekly_limit
+
+    if rule.rule_type == 'time_between_meetings':
+        gap = timedelta(minutes=rule_minutes(parameters))
+        ends = [busy_end for busy_start, busy_end in busy]
+
+        def keeps_gap(start, end):
+            if not applies(start):
+                return True
+            # busy is merged, so ends are sorted too
+            index = bisect_right(ends, start - gap)
+            return index >= len(busy) or busy[index][0] >= end + gap
+        return keeps_gap
+
+    return None
+
+
+def compile_rules(event_type, hosts, start_date, end_date, now=None):
+    """
+    Compile rule pipelines for each host of an event type.
+
+    Runs one query for the rules, and only when needed one grouped COUNT per
+    distinct host timezone and one query for meetings.
+    """
+    now = now or timezone.now()
+    user_ids = [host.id for host in hosts]
+    rules = load_rules(user_ids, event_type)
+    if not rules:
+        return {host.id: RulePipeline() for host in hosts}
+
+    rule_types = {rule.rule_type for host_rules in rules.values() for rule in host_rules}
+    # Whole weeks around the range, widened by a day for timezone differences
+    first_day = week_start(start_date) - timedelta(days=1)
+    last_day = week_start(end_date) + timedelta(days=8)
+    range_start = datetime.combine(first_day, time.min, tzinfo=dt_timezone.utc)
+    range_end = datetime.combine(last_day, time.min, tzinfo=dt_timezone.utc)
+
+    counts = {}
+    if rule_types & {'daily_limit', 'weekly_limit'}:
+        hosts_by_zone = defaultdict(list)
+        for host in hosts:
+            if host.id in rules:
+                hosts_by_zone[str(host.timezone)].append(host.id)
+        for zone_name, zone_user_ids in hosts_by_zone.items():
+            counts.update(count_meetings_by_day(
+                zone_user_ids, get_zone(zone_name), range_start, range_end
+            ))
+
+    busy = {}
+    if 'time_between_meetings' in rule_types:
+        busy = load_busy_intervals(list(rules), range_start, range_end)
+
+    pipelines = {}
+    for host in hosts:
+        tz = get_zone(host.timezone)
+        predicates = [
+            _compile_rule(rule, tz, now, counts.get(host.id, {}), busy.get(host.id, []))
+            for rule in rules.get(host.id, [])
+        ]
+        pipelines[host.id] = RulePipeline([p for p in predicates if p is not None])
+    return pipelines
@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 from rest_framework import serializers
 from .models import (
     WeeklyAvailability, DateOverride, BufferTime, 
@@ -71,6 +73,17 @@ class AvailabilityRuleSerializer(serializers.ModelSerializer):
         fields = '__all__'
         read_only_fields = ('user', 'created_at', 'updated_at')
 
+    def validate(self, attrs):
+        from .rules import validate_rule_parameters
+        
+        rule_type = attrs.get('rule_type', getattr(self.instance, 'rule_type', None))
+        parameters = attrs.get('parameters', getattr(self.instance, 'parameters', {}))
+        try:
+            validate_rule_parameters(rule_type, parameters)
+        except (ValueError, TypeError, OverflowError) as e:
+            raise serializers.ValidationError({'parameters': str(e)})
+        return attrs
+
 
 class AvailabilityOverviewSerializer(serializers.Serializer):
     """Serializer for availability overview"""
@@ -124,4 +137,79 @@ class BulkWeeklyAvailabilitySerializer(serializers.Serializer):
             )
         
         WeeklyAvailability.objects.bulk_create(availability_objects)
-        return {'message': 'Availability updated successfully'}
\ No newline at end of file
+        return {'message': 'Availability updated successfully'}
+
+
+class AvailabilityCheckRangeSerializer(serializers.Serializer):
+    """A single local date and time range to check"""
+    date = serializers.DateField()
+    start_time = serializers.TimeField()
+    end_time = serializers.TimeField()
+
+    def validate(self, attrs):
+        if attrs['start_time'] >= attrs['end_time']:
+            raise serializers.ValidationError("End time must be after start time")
+        return attrs
+
+
+class BatchAvailabilityCheckSerializer(serializers.Serializer):
+    """Serializer for checking many candidate ranges in one request"""
+    MAX_RANGES = 500
+
+    ranges = AvailabilityCheckRangeSerializer(many=True)
+
+    def validate_ranges(self, value):
+        if not value:
+            raise serializers.ValidationError("At least one range is required")
+        if len(value) > self.MAX_RANGES:
+            raise serializers.ValidationError(
+                f"A maximum of {self.MAX_RANGES} ranges can be checked at once"
+            )
+        return value
+
+
+class CollectiveAvailabilitySerializer(serializers.Serializer):
+    """Serializer for finding times when several hosts are all free"""
+    MAX_HOSTS = 100
+    MAX_DAYS = 62
+
+    host_ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False)
+    start_date = serializers.DateField()
+    end_date = serializers.DateField()
+    duration = serializers.IntegerField(required=False, min_value=5, max_value=480)
+
+    def validate_host_ids(self, value):
+        value = list(dict.fromkeys(value))
+        if len(value) > self.MAX_HOSTS:
+            raise serializers.ValidationError(f"A maximum of {self.MAX_HOSTS} hosts is supported")
+        return value
+
+    def validate(self, attrs):
+        if attrs['end_date'] < attrs['start_date']:
+            raise serializers.ValidationError("End date must not be before start date")
+        if (attrs['end_date'] - attrs['start_date']).days >= self.MAX_DAYS:
+            raise serializers.ValidationError(f"Date range cannot exceed {self.MAX_DAYS} days")
+        return attrs
+
+
+class FreeBusySerializer(serializers.Serializer):
+    """Serializer for exporting busy time of many users"""
+    MAX_USERS = 500
+    MAX_DAYS = 62
+
+    user_ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False)
+    start = serializers.DateTimeField()
+    end = serializers.DateTimeField()
+
+    def validate_user_ids(self, value):
+        value = list(dict.fromkeys(value))
+        if len(value) > self.MAX_USERS:
+            raise serializers.ValidationError(f"A maximum of {self.MAX_USERS} users is supported")
+        return value
+
+    def validate(self, attrs):
+        if attrs['end'] <= attrs['start']:
+            raise serializers.ValidationError("End must be after start")
+        if attrs['end'] - attrs['start'] > timedelta(days=self.MAX_DAYS):
+            raise serializers.ValidationError(f"Time window cannot exceed {self.MAX_DAYS} days")
+        return attrs
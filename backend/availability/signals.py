@@ -0,0 +1,97 @@
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+from .models import WeeklyAvailability, DateOverride, BufferTime, AvailabilityRule
+from .bitmaps import bump_generation, apply_meeting_change, meeting_snapshot
+from .slot_cache import bump_version
+from .materialized import invalidate_days
+
+
+@receiver(post_save, sender=WeeklyAvailability)
+@receiver(post_delete, sender=WeeklyAvailability)
+@receiver(post_save, sender=DateOverride)
+@receiver(post_delete, sender=DateOverride)
+@receiver(post_save, sender=BufferTime)
+@receiver(post_delete, sender=BufferTime)
+def invalidate_open_bitmaps(sender, instance, **kwargs):
+    """Rebuild an organizer's open bitmaps after their availability changes"""
+    transaction.on_commit(lambda: bump_generation(instance.user_id))
+
+
+@receiver(post_save, sender='events.EventTypeAvailability')
+@receiver(post_delete, sender='events.EventTypeAvailability')
+def invalidate_event_type_bitmaps(sender, instance, **kwargs):
+    """Rebuild open bitmaps after an event type's own hours change"""
+    user_id = instance.event_type.user_id
+    transaction.on_commit(lambda: bump_generation(user_id))
+
+
+@receiver(post_save, sender='meetings.Meeting')
+def update_busy_bitmaps(sender, instance, **kwargs):
+    """Mask new busy time into the cached busy bitmaps"""
+    previous = getattr(instance, '_loaded_values', None)
+    current = meeting_snapshot(instance)
+    transaction.on_commit(lambda: apply_meeting_change(current, previous))
+
+
+@receiver(post_delete, sender='meetings.Meeting')
+def release_busy_bitmaps(sender, instance, **kwargs):
+    """Rebuild busy bitmaps for the days a deleted meeting occupied"""
+    previous = meeting_snapshot(instance)
+    transaction.on_commit(lambda: apply_meeting_change(None, previous))
+
+
+def _organizer_ids(sender, instance):
+    """Organizers whose slots can change when this instance is written"""
+    if hasattr(instance, 'organizer_id'):
+        previous = getattr(instance, '_loaded_values', None) or {}
+        return {instance.organizer_id, previous.get('organizer_id', instance.organizer_id)}
+    if hasattr(instance, 'event_type_id'):
+        return {instance.event_type.user_id}
+    return {instance.user_id}
+
+
+def _affected_days(instance):
+    """
+    First and last day whose slots a meeting write can change, or (None, None).
+
+    A week either side covers timezone offsets, buffers and weekly limits.
+    """
+    if not hasattr(instance, 'organizer_id'):
+        return None, None
+    previous = getattr(instance, '_loaded_values', None) or {}
+    starts = [instance.start_time, previous.get('start_time') or instance.start_time]
+    ends = [instance.end_time, previous.get('end_time') or instance.end_time]
+    return min(starts).date() - timedelta(days=7), max(ends).date() + timedelta(days=7)
+
+
+@receiver(post_save, sender=WeeklyAvailability)
+@receiver(post_delete, sender=WeeklyAvailability)
+@receiver(post_save, sender=DateOverride)
+@receiver(post_delete, sender=DateOverride)
+@receiver(post_save, sender=BufferTime)
+@receiver(post_delete, sender=BufferTime)
+@receiver(post_save, sender=AvailabilityRule)
+@receiver(post_delete, sender=AvailabilityRule)
+@receiver(m2m_changed, sender=AvailabilityRule.applies_to_event_types.through)
+@receiver(post_save, sender='events.EventType')
+@receiver(post_delete, sender='events.EventType')
+@receiver(post_save, sender='events.EventTypeAvailability')
+@receiver(post_delete, sender='events.EventTypeAvailability')
+@receiver(post_save, sender='events.EventTypeHost')
+@receiver(post_delete, sender='events.EventTypeHost')
+@receiver(post_save, sender='meetings.Meeting')
+@receiver(post_delete, sender='meetings.Meeting')
+def invalidate_slot_cache(sender, instance, **kwargs):
+    """Bump slot cache versions and invalidate materialized days affected by a write"""
+    user_ids = _organizer_ids(sender, instance)
+    days = _affected_days(instance)
+
+    def bump_versions():
+        for user_id in user_ids:
+            bump_version(user_id)
+        invalidate_days(user_ids, *days)
+
+    transaction.on_commit(bump_versions)
@@ -0,0 +1,124 @@
+"""
+Versioned cache for computed booking slots.
+
+Cache keys embed a per-organizer version counter. Signals bump the counter on
+every write that can change an organizer's slots, which orphans the old
+entries instead of deleting them one by one.
+"""
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from utils.timezones import get_zone
+from .holds import exclude_held_slots
+from .materialized import get_materialized_slots
+from .slots import get_available_slots, get_booking_window, get_event_type_hosts
+
+SLOT_CACHE_TIMEOUT = 5 * 60
+
+# Days computed per step when streaming a long horizon
+STREAM_CHUNK_DAYS = 7
+
+HITS_KEY = 'slot_cache:hits'
+MISSES_KEY = 'slot_cache:misses'
+
+
+def _version_key(user_id):
+    return f'slot_cache:version:{user_id}'
+
+
+def _incr(key, delta=1):
+    """Increment a counter, creating it if it does not exist yet"""
+    cache.add(key, 0, None)
+    try:
+        return cache.incr(key, delta)
+    except ValueError:
+        cache.set(key, delta, None)
+        return delta
+
+
+def bump_version(user_id):
+    """Invalidate every cached slot list that depends on this organizer"""
+    return _incr(_version_key(user_id))
+
+
+def get_versions(user_ids):
+    """Current version for each organizer in one cache round trip"""
+    versions = cache.get_many([_version_key(user_id) for user_id in user_ids])
+    return [versions.get(_version_key(user_id), 0) for user_id in user_ids]
+
+
+def get_cached_slots(event_type, start_date, end_date, now=None):
+    """
+    Bookable slots for an event type, served from the cache when possible.
+
+    Cached lists are trimmed to the current minimum notice on every read, so
+    a hit never offers a slot that has become too close to book. Held slots
+    are removed on every read as well.
+    """
+    now = now or timezone.now()
+    if event_type.is_round_robin:
+        user_ids = sorted({event_type.user_id} | {host.id for host in get_event_type_hosts(event_type)})
+    else:
+        user_ids = [event_type.user_id]
+
+    version = '.'.join(str(v) for v in get_versions(user_ids))
+    key = (
+        f'slot_cache:slots:{event_type.id}:{"-".join(map(str, user_ids))}:{version}:'
+        f'{start_date.isoformat()}:{end_date.isoformat()}'
+    )
+
+    slots = cache.get(key)
+    if slots is None:
+        _incr(MISSES_KEY)
+        slots = get_materialized_slots(event_type, start_date, end_date, now)
+        if slots is None:
+            slots = get_available_slots(event_type, start_date, end_date, now)
+        cache.set(key, slots, SLOT_CACHE_TIMEOUT)
+    else:
+        _incr(HITS_KEY)
+        earliest = get_booking_window(event_type, now)[0]
+        slots = [slot for slot in slots if datetime.fromisoformat(slot['start_time']) >= earliest]
+
+    # Holds are short-lived, so they are applied on every read instead of cached
+    host_ids = [host.id for host in get_event_type_hosts(event_type)]
+    return exclude_held_slots(slots, host_ids)
+
+
+def get_cache_stats():
+    """Hit and miss counters for the slot cache"""
+    counters = cache.get_many([HITS_KEY, MISSES_KEY])
+    hits = counters.get(HITS_KEY, 0)
+    misses = counters.get(MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': round(hits / total * 100, 2) if total else 0,
+    }
+
+
+def iter_daily_slots(event_type, start_date, end_date, now=None, chunk_days=STREAM_CHUNK_DAYS):
+    """
+    Yield (date, slots) for every day between two dates in the organizer's timezone.
+
+    The range is computed a chunk at a time through the slot cache, so early
+    days can be sent before later ones are computed and only one chunk is held
+    in memory. Days without slots are yielded with an empty list.
+    """
+    now = now or timezone.now()
+    tz = get_zone(event_type.user.timezone)
+    chunk_start = start_date
+    while chunk_start <= end_date:
+        chunk_end = min(chunk_start + timedelta(days=chunk_days - 1), end_date)
+        by_day = defaultdict(list)
+        for slot in get_cached_slots(event_type, chunk_start, chunk_end, now):
+            by_day[datetime.fromisoformat(slot['start_time']).astimezone(tz).date()].append(slot)
+
+        day = chunk_start
+        while day <= chunk_end:
+            yield day, by_day.get(day, [])
+            day += timedelta(days=1)
+        chunk_start = chunk_end + timedelta(days=1)
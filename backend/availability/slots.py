@@ -0,0 +1,552 @@
+"""
+Slot engine for public booking pages.
+
+Free time is built from weekly availability, event type availability, date
+overrides and buffer settings, then busy meeting time is removed using
+sorted interval arithmetic. All sources are loaded with one query per table,
+so the cost of a request does not depend on the size of the date range.
+"""
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.utils import timezone
+
+from utils.timezones import get_zone
+from .models import WeeklyAvailability, DateOverride, BufferTime
+
+# Meetings in these states occupy the organizer's calendar
+BUSY_MEETING_STATUSES = ['confirmed', 'pending']
+
+# Slot start times are aligned to this grid (minutes)
+SLOT_GRANULARITY = 15
+
+
+def merge_intervals(intervals):
+    """Sort and merge overlapping or touching (start, end) intervals"""
+    merged = []
+    for start, end in sorted(intervals):
+        if start >= end:
+            continue
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def subtract_intervals(free, busy):
+    """Remove busy intervals from free intervals (both sorted and merged)"""
+    result = []
+    j = 0
+    for start, end in free:
+        while j < len(busy) and busy[j][1] <= start:
+            j += 1
+        cursor = start
+        k = j
+        while k < len(busy) and busy[k][0] < end:
+            if busy[k][0] > cursor:
+                result.append((cursor, busy[k][0]))
+            cursor = max(cursor, busy[k][1])
+            k += 1
+        if cursor < end:
+            result.append((cursor, end))
+    return result
+
+
+def clip_intervals(intervals, lower, upper):
+    """Restrict sorted intervals to the [lower, upper) window"""
+    clipped = []
+    for start, end in intervals:
+        start = max(start, lower)
+        end = min(end, upper)
+        if start < end:
+            clipped.append((start, end))
+    return clipped
+
+
+def local_window(day, start, end, tz):
+    """Convert a local (day, start, end) window to an aware UTC interval"""
+    start_dt = datetime.combine(day, start or time.min, tzinfo=tz)
+    if end is None or (start is not None and end <= start):
+        end_dt = datetime.combine(day + timedelta(days=1), time.min, tzinfo=tz)
+    else:
+        end_dt = datetime.combine(day, end, tzinfo=tz)
+    return start_dt.astimezone(dt_timezone.utc), end_dt.astimezone(dt_timezone.utc)
+
+
+def date_range(start_date, end_date):
+    """Yield every date from start_date to end_date inclusive"""
+    day = start_date
+    while day <= end_date:
+        yield day
+        day += timedelta(days=1)
+
+
+def group_weekly(rows):
+    """Group weekly availability rows by weekday"""
+    weekly = defaultdict(list)
+    for row in rows:
+        weekly[row.weekday].append(row)
+    return weekly
+
+
+def load_availability_sources(user_ids, start_date, end_date):
+    """
+    Load weekly rules, date overrides and buffer settings for several users.
+
+    Runs one query per table regardless of the number of users or days.
+    """
+    sources = {
+        user_id: {'weekly': defaultdict(list), 'overrides': defaultdict(list), 'buffer': None}
+        for user_id in user_ids
+    }
+
+    for row in WeeklyAvailability.objects.filter(user_id__in=user_ids):
+        sources[row.user_id]['weekly'][row.weekday].append(row)
+
+    overrides = DateOverride.objects.filter(
+        user_id__in=user_ids,
+        date__gte=start_date,
+        date__lte=end_date
+    )
+    for override in overrides:
+        sources[override.user_id]['overrides'][override.date].append(override)
+
+    for buffer_time in BufferTime.objects.filter(user_id__in=user_ids):
+        sources[buffer_time.user_id]['buffer'] = buffer_time
+
+    return sources
+
+
+def load_busy_intervals(user_ids, start, end):
+    """Load merged busy meeting intervals per organizer in a single query"""
+    from meetings.models import Meeting
+
+    busy = {user_id: [] for user_id in user_ids}
+    meetings = Meeting.objects.filter(
+        organizer_id__in=user_ids,
+        status__in=BUSY_MEETING_STATUSES,
+        start_time__lt=end,
+        end_time__gt=start
+    ).values_list('organizer_id', 'start_time', 'end_time')
+
+    for organizer_id, start_time, end_time in meetings:
+        busy[organizer_id].append((start_time, end_time))
+
+    return {user_id: merge_intervals(intervals) for user_id, intervals in busy.items()}
+
+
+def build_free_intervals(tz, start_date, end_date, sources, custom_weekly=None):
+    """
+    Build merged free UTC intervals for a date range from availability sources.
+
+    Event type availability (custom_weekly) replaces the weekly schedule when
+    present. Available date overrides replace the schedule for their date,
+    unavailable overrides and the lunch break are removed from it.
+    """
+    weekly = custom_weekly if custom_weekly else sources['weekly']
+    buffer_time = sources['buffer']
+    free = []
+    blocked = []
+
+    for day in date_range(start_date, end_date):
+        day_overrides = sources['overrides'].get(day, [])
+        open_overrides = [o for o in day_overrides if o.is_available]
+
+        if open_overrides:
+            windows = [(o.start_time, o.end_time) for o in open_overrides]
+            closed = []
+        else:
+            rows = weekly.get(day.weekday(), [])
+            windows = [(r.start_time, r.end_time) for r in rows if r.is_available]
+            closed = [(r.start_time, r.end_time) for r in rows if not r.is_available]
+
+        for override in day_overrides:
+            if override.is_available:
+                continue
+            if override.start_time is None and override.end_time is None:
+                windows = []
+            else:
+                closed.append((override.start_time, override.end_time))
+
+        if (buffer_time and buffer_time.lunch_break_enabled
+                and buffer_time.lunch_start_time and buffer_time.lunch_end_time):
+            closed.append((buffer_time.lunch_start_time, buffer_time.lunch_end_time))
+
+        free.extend(local_window(day, start, end, tz) for start, end in windows)
+        blocked.extend(local_window(day, start, end, tz) for start, end in closed)
+
+    return subtract_intervals(merge_intervals(free), merge_intervals(blocked))
+
+
+def expand_busy_intervals(busy, before, after):
+    """
+    Widen busy intervals so that slots keep the required buffer around meetings.
+
+    A slot needs `before` free minutes ahead of it and `after` minutes behind
+    it, which is the same as widening each meeting by `after` at its start and
+    `before` at its end.
+    """
+    if not before and not after:
+        return busy
+    before = timedelta(minutes=before)
+    after = timedelta(minutes=after)
+    return merge_intervals((start - after, end + before) for start, end in busy)
+
+
+def align_up(value, minutes=SLOT_GRANULARITY):
+    """Round an aware datetime up to the next slot grid boundary"""
+    step = minutes * 60
+    seconds = value.timestamp()
+    remainder = seconds % step
+    if remainder == 0:
+        return value
+    return value + timedelta(seconds=step - remainder)
+
+
+def split_into_slots(intervals, duration_minutes, step_minutes=None):
+    """Cut free intervals into fixed-length (start, end) slots"""
+    length = timedelta(minutes=duration_minutes)
+    step = timedelta(minutes=step_minutes or duration_minutes)
+    slots = []
+    for start, end in intervals:
+        cursor = align_up(start)
+        while cursor + length <= end:
+            slots.append((cursor, cursor + length))
+            cursor += step
+    return slots
+
+
+def get_booking_window(event_type, now=None):
+    """Earliest and latest bookable instants for an event type"""
+    now = now or timezone.now()
+    return (
+        now + timedelta(minutes=event_type.min_notice_time),
+        now + timedelta(minutes=event_type.max_advance_time),
+    )
+
+
+def get_event_type_buffers(event_type, buffer_time):
+    """Effective (before, after) buffer minutes for an event type"""
+    before = event_type.buffer_time_before
+    after = event_type.buffer_time_after
+    if buffer_time:
+        before = max(before, buffer_time.before_meeting)
+        after = max(after, buffer_time.after_meeting)
+    return before, after
+
+
+def get_event_type_hosts(event_type):
+    """Users whose calendars serve an event type: its active, accepted hosts, or its owner"""
+    if event_type.is_round_robin:
+        hosts = [
+            row.host for row in
+            event_type.hosts.filter(is_active=True, accepted_at__isnull=False).select_related('host')
+        ]
+        if hosts:
+            return hosts
+    return [event_type.user]
+
+
+def get_related_user_ids(user):
+    """
+    Users whose availability a user may read: themselves, plus the owners
+    and hosts of every event type they own or host.
+
+    Only accepted host rows count. An owner can add anyone to a pool, so a
+    pending invitation must not expose the invitee's calendar, nor the
+    owner's to the invitee.
+    """
+    from django.db.models import Q
+    from events.models import EventType, EventTypeHost
+
+    event_types = EventType.objects.filter(
+        Q(user=user) | Q(hosts__host=user, hosts__is_active=True, hosts__accepted_at__isnull=False)
+    ).values('id')
+    related = {user.id}
+    related.update(EventType.objects.filter(id__in=event_types).values_list('user_id', flat=True))
+    related.update(EventTypeHost.objects.filter(
+        event_type_id__in=event_types,
+        is_active=True,
+        accepted_at__isnull=False
+    ).values_list('host_id', flat=True))
+    return related
+
+
+def get_host_free_intervals(event_type, hosts, start_date, end_date, now=None):
+    """
+    Free UTC intervals per host for an event type between two local dates.
+
+    Dates are in the event type owner's timezone; each host's schedule is
+    evaluated in their own timezone. Issues a fixed number of queries for
+    any number of hosts: weekly rules, date overrides, buffer settings,
+    event type availability and meetings.
+    """
+    tz = get_zone(event_type.user.timezone)
+    earliest, latest = get_booking_window(event_type, now)
+    lower = max(datetime.combine(start_date, time.min, tzinfo=tz), earliest)
+    upper = min(datetime.combine(end_date + timedelta(days=1), time.min, tzinfo=tz), latest)
+
+    user_ids = [host.id for host in hosts]
+    first_day = start_date - timedelta(days=1)
+    last_day = end_date + timedelta(days=1)
+    sources = load_availability_sources(user_ids, first_day, last_day)
+    custom_weekly = group_weekly(event_type.custom_availability.all())
+
+    free = {}
+    buffers = {}
+    for host in hosts:
+        host_sources = sources[host.id]
+        intervals = build_free_intervals(
+            get_zone(host.timezone), first_day, last_day, host_sources, custom_weekly
+        )
+        free[host.id] = clip_intervals(intervals, lower, upper)
+        buffers[host.id] = get_event_type_buffers(event_type, host_sources['buffer'])
+
+    if not any(free.values()):
+        return free
+
+    # One meeting query covers every host and the widest buffer
+    widest_before = max(before for before, after in buffers.values())
+    widest_after = max(after for before, after in buffers.values())
+    busy = load_busy_intervals(
+        user_ids,
+        lower - timedelta(minutes=widest_before),
+        upper + timedelta(minutes=widest_after)
+    )
+
+    return {
+        host_id: subtract_intervals(
+            intervals, expand_busy_intervals(busy[host_id], *buffers[host_id])
+        )
+        for host_id, intervals in free.items()
+    }
+
+
+def find_slots(event_type, start_date, end_date, now=None):
+    """
+    Bookable (start, end) slots for an event type between two local dates.
+
+    Slots are cut per host, filtered through that host's compiled
+    availability rules and then combined, so for round-robin event types
+    every slot is bookable with at least one host.
+    """
+    from .rules import compile_rules
+
+    hosts = get_event_type_hosts(event_type)
+    per_host = get_host_free_intervals(event_type, hosts, start_date, end_date, now)
+    pipelines = compile_rules(event_type, hosts, start_date, end_date, now)
+    slots = set()
+    for host_id, intervals in per_host.items():
+        slots.update(pipelines[host_id].filter(split_into_slots(intervals, event_type.duration)))
+    return sorted(slots)
+
+
+def get_available_slots(event_type, start_date, end_date, now=None):
+    """Bookable slots for an event type between two dates in the organizer's timezone"""
+    # Bitmaps are stored per organizer, so pooled event types use intervals
+    if getattr(settings, 'AVAILABILITY_BITMAPS_ENABLED', False) and not event_type.is_round_robin:
+        from .bitmaps import get_bitmap_slots
+        from .rules import compile_rules
+        pipeline = compile_rules(event_type, [event_type.user], start_date, end_date, now)
+        slots = pipeline[event_type.user_id].filter(
+            get_bitmap_slots(event_type, start_date, end_date, now)
+        )
+    else:
+        slots = find_slots(event_type, start_date, end_date, now)
+
+    # Days that reached max_bookings_per_day are hidden with one lookup
+    from events.day_counts import get_full_days
+    full_days = get_full_days(event_type, start_date, end_date)
+    if full_days:
+        tz = get_zone(event_type.user.timezone)
+        slots = [slot for slot in slots if slot[0].astimezone(tz).date() not in full_days]
+
+    return [
+        {'start_time': start.isoformat(), 'end_time': end.isoformat()}
+        for start, end in slots
+    ]
+
+
+def to_minute_offsets(intervals, origin):
+    """Convert datetime intervals to whole-minute (start, end) offsets from origin"""
+    offsets = []
+    for start, end in intervals:
+        first = -int((origin - start).total_seconds() // 60)
+        last = int((end - origin).total_seconds() // 60)
+        if first < last:
+            offsets.append((first, last))
+    return offsets
+
+
+def intersect_offsets(per_host):
+    """
+    Minute ranges in which every host is free.
+
+    Each host's intervals must be disjoint. All boundaries are sorted once and
+    swept with a counter; the range is open while the counter equals the
+    number of hosts.
+    """
+    hosts = len(per_host)
+    if not hosts:
+        return []
+
+    events = []
+    for intervals in per_host:
+        for start, end in intervals:
+            events.append((start, 1))
+            events.append((end, -1))
+    # Ends sort before starts at the same minute, so touching ranges never overlap
+    events.sort()
+
+    result = []
+    count = 0
+    opened = None
+    for position, delta in events:
+        count += delta
+        if count == hosts:
+            opened = position
+        elif opened is not None:
+            if position > opened:
+                result.append((opened, position))
+            opened = None
+    return result
+
+
+def get_collective_free_intervals(hosts, start, end):
+    """
+    Minute offsets from start at which all hosts are free within [start, end).
+
+    Availability and meetings for every host are loaded in bulk, so the
+    number of queries does not grow with the number of hosts.
+    """
+    user_ids = [host.id for host in hosts]
+    # Each host's local dates that can overlap the UTC window
+    start_date = start.date() - timedelta(days=1)
+    end_date = end.date() + timedelta(days=1)
+
+    sources = load_availability_sources(user_ids, start_date, end_date)
+    buffers = {}
+    for host in hosts:
+        buffer_time = sources[host.id]['buffer']
+        buffers[host.id] = (
+            (buffer_time.before_meeting, buffer_time.after_meeting) if buffer_time else (0, 0)
+        )
+
+    # Meetings just outside the window still reach into it through their buffers
+    margin = timedelta(minutes=max(max(pair) for pair in buffers.values()))
+    busy = load_busy_intervals(user_ids, start - margin, end + margin)
+
+    per_host = []
+    for host in hosts:
+        free = build_free_intervals(get_zone(host.timezone), start_date, end_date, sources[host.id])
+        free = subtract_intervals(free, expand_busy_intervals(busy[host.id], *buffers[host.id]))
+        per_host.append(to_minute_offsets(clip_intervals(free, start, end), start))
+
+    return intersect_offsets(per_host)
+
+
+def get_free_busy(users, start, end):
+    """
+    Merged busy minute offsets from start for each user within [start, end).
+
+    Busy time is confirmed or pending meetings plus unavailable date
+    overrides, loaded with one query each for all users.
+    """
+    user_ids = [user.id for user in users]
+    busy = load_busy_intervals(user_ids, start, end)
+
+    blocked = DateOverride.objects.filter(
+        user_id__in=user_ids,
+        is_available=False,
+        date__gte=start.date() - timedelta(days=1),
+        date__lte=end.date() + timedelta(days=1)
+    ).values_list('user_id', 'date', 'start_time', 'end_time')
+
+    zones = {user.id: get_zone(user.timezone) for user in users}
+    for user_id, day, start_time, end_time in blocked:
+        busy[user_id].append(local_window(day, start_time, end_time, zones[user_id]))
+
+    return {
+        user_id: to_minute_offsets(clip_intervals(merge_intervals(intervals), start, end), start)
+        for user_id, intervals in busy.items()
+    }
+
+
+def check_availability_ranges(user, ranges):
+    """
+    Check many local (date, start_time, end_time) ranges for one user at once.
+
+    Loads weekly rules, overrides, buffer settings and meetings with one query
+    each, then answers every range with binary searches over the sorted free
+    intervals and meetings. Returns one result dict per range, in input order.
+    """
+    from meetings.models import Meeting
+
+    if not ranges:
+        return []
+
+    tz = get_zone(user.timezone)
+    candidates = [local_window(r['date'], r['start_time'], r['end_time'], tz) for r in ranges]
+    start_date = min(r['date'] for r in ranges)
+    end_date = max(r['date'] for r in ranges)
+
+    sources = load_availability_sources([user.id], start_date, end_date)[user.id]
+    free = build_free_intervals(tz, start_date, end_date, sources)
+    free_starts = [start for start, end in free]
+
+    before, after = 0, 0
+    if sources['buffer']:
+        before = sources['buffer'].before_meeting
+        after = sources['buffer'].after_meeting
+    before, after = timedelta(minutes=before), timedelta(minutes=after)
+
+    window_start = min(start for start, end in candidates) - before
+    window_end = max(end for start, end in candidates) + after
+    meetings = list(Meeting.objects.filter(
+        organizer=user,
+        status__in=BUSY_MEETING_STATUSES,
+        start_time__lt=window_end,
+        end_time__gt=window_start
+    ).order_by('start_time').values('id', 'title', 'start_time', 'end_time'))
+
+    # Widened meeting starts, sorted, plus the longest widened meeting bound
+    # the slice of meetings that can overlap a candidate
+    busy_starts = [m['start_time'] - after for m in meetings]
+    longest = max(
+        ((m['end_time'] + before) - (m['start_time'] - after) for m in meetings),
+        default=timedelta(0)
+    )
+
+    results = []
+    for item, (start, end) in zip(ranges, candidates):
+        conflicts = []
+
+        index = bisect_right(free_starts, start) - 1
+        if index < 0 or free[index][1] < end:
+            conflicts.append({'type': 'outside_availability'})
+
+        first = bisect_left(busy_starts, start - longest)
+        last = bisect_left(busy_starts, end)
+        for meeting in meetings[first:last]:
+            if meeting['end_time'] + before > start:
+                conflicts.append({
+                    'type': 'meeting',
+                    'meeting_id': meeting['id'],
+                    'title': meeting['title'],
+                    'start_time': meeting['start_time'],
+                    'end_time': meeting['end_time'],
+                })
+
+        results.append({
+            'date': item['date'],
+            'start_time': item['start_time'],
+            'end_time': item['end_time'],
+            'is_available': not conflicts,
+            'conflicts': conflicts,
+        })
+
+    return results
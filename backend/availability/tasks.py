@@ -0,0 +1,11 @@
+from celery import shared_task
+
+
+@shared_task
+def refresh_materialized_slots():
+    """Recompute invalidated and missing days of the materialized slot horizon"""
+    from .materialized import refresh_materialized_slots as refresh
+
+    refreshed = refresh()
+    return f"Refreshed {refreshed} materialized slot days"
+
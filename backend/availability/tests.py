@@ -0,0 +1,205 @@
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from events.models import EventType, EventTypeHost
+from meetings.models import Meeting
+from .bitmaps import get_bitmap_slots
+from .models import AvailabilityRule, WeeklyAvailability
+from .rules import compile_rules
+from .slots import find_slots
+
+User = get_user_model()
+
+
+class RelatedUserScopeTests(APITestCase):
+    """Availability of other users is only readable once they accepted a shared host pool"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(
+            username='owner',
+            email='owner@example.com',
+            password='password',
+            first_name='Olive',
+            last_name='Owner'
+        )
+        cls.invitee = User.objects.create_user(
+            username='invitee',
+            email='invitee@example.com',
+            password='password',
+            first_name='Hal',
+            last_name='Host'
+        )
+        event_type = EventType.objects.create(
+            user=cls.owner,
+            name='Sales call',
+            scheduling_type='round_robin'
+        )
+        cls.membership = EventTypeHost.objects.create(event_type=event_type, host=cls.invitee)
+
+    def setUp(self):
+        self.client.force_login(self.owner)
+
+    def accept(self):
+        self.membership.accepted_at = timezone.now()
+        self.membership.save()
+
+    def collective(self):
+        today = timezone.localdate()
+        return self.client.post(
+            reverse('collective-availability'),
+            {
+                'host_ids': [self.owner.pk, self.invitee.pk],
+                'start_date': today.isoformat(),
+                'end_date': (today + timedelta(days=1)).isoformat()
+            },
+            format='json'
+        )
+
+    def test_collective_availability_of_pending_host_is_forbidden(self):
+        self.assertEqual(self.collective().status_code, 403)
+
+    def test_collective_availability_of_accepted_host(self):
+        self.accept()
+        self.assertEqual(self.collective().status_code, 200)
+
+    def free_busy(self):
+        start = timezone.now()
+        return self.client.post(
+            reverse('free-busy'),
+            {
+                'user_ids': [self.invitee.pk],
+                'start': start.isoformat(),
+                'end': (start + timedelta(days=1)).isoformat()
+            },
+            format='json'
+        )
+
+    def test_free_busy_of_pending_host_is_forbidden(self):
+        self.assertEqual(self.free_busy().status_code, 403)
+
+    def test_free_busy_of_accepted_host(self):
+        self.accept()
+        response = self.free_busy()
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(str(self.invitee.pk), response.data['busy'])
+
+
+class AvailabilityRuleParameterTests(APITestCase):
+    """Rule parameters are bounded so compiling a rule never leaves datetime range"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username='ruled',
+            email='ruled@example.com',
+            password='password',
+            first_name='Rae',
+            last_name='Ruled'
+        )
+        cls.event_type = EventType.objects.create(user=cls.user, name='Intro call')
+
+    def create_rule(self, rule_type, parameters):
+        self.client.force_login(self.user)
+        return self.client.post(
+            reverse('availability-rule-list'),
+            {'rule_type': rule_type, 'parameters': parameters},
+            format='json'
+        )
+
+    def test_out_of_range_parameters_are_rejected(self):
+        for rule_type, parameters in [
+            ('maximum_advance', {'days': 10000000}),
+            ('maximum_advance', {'days': 200, 'hours': 5000}),
+            ('minimum_notice', {'hours': 'nan'}),
+            ('daily_limit', {'limit': 10 ** 9}),
+        ]:
+            with self.subTest(rule_type=rule_type, parameters=parameters):
+                response = self.create_rule(rule_type, parameters)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('parameters', response.data)
+
+    def test_non_finite_parameters_are_rejected(self):
+        self.client.force_login(self.user)
+        response = self.client.post(
+            reverse('availability-rule-list'),
+            '{"rule_type": "minimum_notice", "parameters": {"minutes": 1e400}}',
+            content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('parameters', response.data)
+
+    def test_parameters_within_range_are_accepted(self):
+        response = self.create_rule('maximum_advance', {'days': 365})
+        self.assertEqual(response.status_code, 201)
+
+    def test_stored_out_of_range_rule_is_skipped(self):
+        AvailabilityRule.objects.create(
+            user=self.user,
+            rule_type='maximum_advance',
+            parameters={'days': 10000000}
+        )
+        today = timezone.localdate()
+        pipelines = compile_rules(self.event_type, [self.user], today, today)
+        self.assertFalse(pipelines[self.user.id])
+
+
+class BitmapSlotTests(TestCase):
+    """The bitmap engine cuts the same slots as the interval engine"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username='mapped',
+            email='mapped@example.com',
+            password='password',
+            first_name='Bea',
+            last_name='Mapped',
+            timezone='UTC'
+        )
+        for weekday in range(7):
+            WeeklyAvailability.objects.create(
+                user=cls.user,
+                weekday=weekday,
+                start_time=time(9, 0),
+                end_time=time(12, 0)
+            )
+        cls.day = timezone.localdate() + timedelta(days=2)
+        cls.now = datetime.combine(cls.day - timedelta(days=1), time(12, 0), tzinfo=dt_timezone.utc)
+        start = datetime.combine(cls.day, time(10, 10), tzinfo=dt_timezone.utc)
+        cls.event_type = EventType.objects.create(user=cls.user, name='Intro call', duration=20)
+        Meeting.objects.create(
+            event_type=cls.event_type,
+            organizer=cls.user,
+            title='Existing call',
+            start_time=start,
+            end_time=start + timedelta(minutes=30),
+            invitee_name='Ivy Invitee',
+            invitee_email='ivy@example.com'
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def slots(self, duration):
+        self.event_type.duration = duration
+        interval_slots = find_slots(self.event_type, self.day, self.day, self.now)
+        bitmap_slots = get_bitmap_slots(self.event_type, self.day, self.day, self.now)
+        self.assertEqual(bitmap_slots, interval_slots)
+        return [start.time() for start, end in bitmap_slots]
+
+    def test_durations_off_the_slot_grid_step_by_duration(self):
+        self.assertEqual(self.slots(20), [
+            time(9, 0), time(9, 20), time(9, 40),
+            time(10, 45), time(11, 5), time(11, 25),
+        ])
+        self.assertEqual(self.slots(50), [time(9, 0), time(10, 45)])
+
+    def test_durations_on_the_slot_grid(self):
+        self.assertEqual(self.slots(30), [time(9, 0), time(9, 30), time(10, 45), time(11, 15)])
@@ -29,5 +29,9 @@ urlpatterns = [
     # Overview and utilities
     path('overview/', views.availability_overview, name='availability-overview'),
     path('check/', views.check_availability, name='check-availability'),
+    path('check/batch/', views.check_availability_batch, name='check-availability-batch'),
+    path('collective/', views.collective_availability, name='collective-availability'),
+    path('free-busy/', views.free_busy, name='free-busy'),
     path('stats/', views.availability_stats, name='availability-stats'),
+    path('slot-cache/stats/', views.slot_cache_stats, name='slot-cache-stats'),
 ]
\ No newline at end of file
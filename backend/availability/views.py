@@ -12,8 +12,16 @@ from .serializers import (
     WeeklyAvailabilitySerializer, DateOverrideSerializer, BufferTimeSerializer,
     TimeZoneSettingsSerializer, CalendarIntegrationSerializer, 
     CalendarIntegrationCreateSerializer, AvailabilityRuleSerializer,
-    AvailabilityOverviewSerializer, BulkWeeklyAvailabilitySerializer
+    AvailabilityOverviewSerializer, BulkWeeklyAvailabilitySerializer,
+    BatchAvailabilityCheckSerializer, CollectiveAvailabilitySerializer,
+    FreeBusySerializer
 )
+from .slot_cache import get_cache_stats
+from .slots import (
+    check_availability_ranges, get_collective_free_intervals, get_free_busy,
+    get_related_user_ids, split_into_slots
+)
+from utils.timezones import get_zone
 
 
 class WeeklyAvailabilityListCreateView(generics.ListCreateAPIView):
@@ -230,11 +238,13 @@ def check_availability(request):
         start_time = datetime.strptime(start_time_str, '%H:%M').time()
         end_time = datetime.strptime(end_time_str, '%H:%M').time()
         
-        # TODO: Implement availability checking logic
-        # This would check weekly availability, date overrides, existing meetings, etc.
-        
-        is_available = True  # Placeholder
-        conflicts = []  # Placeholder
+        result = check_availability_ranges(request.user, [{
+            'date': check_date,
+            'start_time': start_time,
+            'end_time': end_time,
+        }])[0]
+        is_available = result['is_available']
+        conflicts = result['conflicts']
         
         return Response({
             'is_available': is_available,
@@ -251,6 +261,112 @@ def check_availability(request):
         )
 
 
+@api_view(['POST'])
+@permission_classes([permissions.IsAuthenticated])
+def check_availability_batch(request):
+    """Check availability for many date and time ranges in one request"""
+    serializer = BatchAvailabilityCheckSerializer(data=request.data)
+    
+    if serializer.is_valid():
+        results = check_availability_ranges(
+            request.user, serializer.validated_data['ranges']
+        )
+        return Response({
+            'results': results,
+            'available_count': sum(1 for result in results if result['is_available']),
+        })
+    
+    return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+@api_view(['POST'])
+@permission_classes([permissions.IsAuthenticated])
+def collective_availability(request):
+    """Find times when all of the given hosts are free"""
+    serializer = CollectiveAvailabilitySerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    
+    from datetime import datetime, time, timedelta
+    from django.contrib.auth import get_user_model
+    
+    data = serializer.validated_data
+    if not set(data['host_ids']) <= get_related_user_ids(request.user):
+        return Response(
+            {'error': 'You can only check availability of users who share an event type with you'},
+            status=status.HTTP_403_FORBIDDEN
+        )
+    
+    hosts = list(get_user_model().objects.filter(id__in=data['host_ids']))
+    if len(hosts) != len(data['host_ids']):
+        return Response(
+            {'error': 'Some hosts were not found'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    # The date range is interpreted in the requesting user's timezone
+    tz = get_zone(request.user.timezone)
+    start = datetime.combine(data['start_date'], time.min, tzinfo=tz)
+    end = datetime.combine(data['end_date'] + timedelta(days=1), time.min, tzinfo=tz)
+    
+    free_intervals = get_collective_free_intervals(hosts, start, end)
+    
+    response = {
+        'origin': start,
+        'timezone': str(tz),
+        'host_ids': data['host_ids'],
+        'free_intervals': [[first, last] for first, last in free_intervals],
+    }
+    
+    if data.get('duration'):
+        intervals = [
+            (start + timedelta(minutes=first), start + timedelta(minutes=last))
+            for first, last in free_intervals
+        ]
+        response['available_slots'] = [
+            {'start_time': slot_start, 'end_time': slot_end}
+            for slot_start, slot_end in split_into_slots(intervals, data['duration'])
+        ]
+    
+    return Response(response)
+
+
+@api_view(['POST'])
+@permission_classes([permissions.IsAuthenticated])
+def free_busy(request):
+    """Export merged busy intervals for many users without meeting details"""
+    serializer = FreeBusySerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    
+    from django.contrib.auth import get_user_model
+    
+    data = serializer.validated_data
+    if not set(data['user_ids']) <= get_related_user_ids(request.user):
+        return Response(
+            {'error': 'You can only read free/busy time of users who share an event type with you'},
+            status=status.HTTP_403_FORBIDDEN
+        )
+    
+    users = list(get_user_model().objects.filter(id__in=data['user_ids']).only('id', 'timezone'))
+    if len(users) != len(data['user_ids']):
+        return Response(
+            {'error': 'Some users were not found'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    busy = get_free_busy(users, data['start'], data['end'])
+    
+    return Response({
+        'origin': data['start'],
+        'end': data['end'],
+        'busy': {
+            str(user_id): [[first, last] for first, last in intervals]
+            for user_id, intervals in busy.items()
+        },
+    })
+
+
 @api_view(['GET'])
 @permission_classes([permissions.IsAuthenticated])
 def availability_stats(request):
@@ -285,4 +401,11 @@ def availability_stats(request):
         'future_overrides': future_overrides,
         'active_integrations': active_integrations,
         'active_rules': active_rules,
-    })
\ No newline at end of file
+    })
+
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAdminUser])
+def slot_cache_stats(request):
+    """Get hit/miss counters for the public slot cache"""
+    return Response(get_cache_stats())
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import EventType, EventTypeAvailability, BookingPage
+from .models import EventType, EventTypeAvailability, EventTypeHost, EventTypeDayCount, BookingPage
 
 
 class EventTypeAvailabilityInline(admin.TabularInline):
@@ -7,6 +7,12 @@ class EventTypeAvailabilityInline(admin.TabularInline):
     extra = 0
 
 
+class EventTypeHostInline(admin.TabularInline):
+    model = EventTypeHost
+    extra = 0
+    readonly_fields = ('window_start', 'meeting_count', 'last_assigned_at')
+
+
 class BookingPageInline(admin.StackedInline):
     model = BookingPage
     extra = 0
@@ -18,7 +24,7 @@ class EventTypeAdmin(admin.ModelAdmin):
     list_filter = ('duration', 'location_type', 'is_active', 'created_at')
     search_fields = ('name', 'description', 'user__email', 'user__first_name', 'user__last_name')
     readonly_fields = ('created_at', 'updated_at')
-    inlines = [EventTypeAvailabilityInline, BookingPageInline]
+    inlines = [EventTypeAvailabilityInline, EventTypeHostInline, BookingPageInline]
     
     fieldsets = (
         ('Basic Information', {
@@ -28,7 +34,7 @@ class EventTypeAdmin(admin.ModelAdmin):
             'fields': ('location_type', 'location_details')
         }),
         ('Scheduling Settings', {
-            'fields': ('buffer_time_before', 'buffer_time_after', 'max_bookings_per_day', 'min_notice_time', 'max_advance_time')
+            'fields': ('scheduling_type', 'buffer_time_before', 'buffer_time_after', 'max_bookings_per_day', 'min_notice_time', 'max_advance_time')
         }),
         ('Customization', {
             'fields': ('color', 'image', 'custom_questions')
@@ -47,6 +53,21 @@ class EventTypeAvailabilityAdmin(admin.ModelAdmin):
     search_fields = ('event_type__name', 'event_type__user__email')
 
 
+@admin.register(EventTypeHost)
+class EventTypeHostAdmin(admin.ModelAdmin):
+    list_display = ('event_type', 'host', 'is_active', 'accepted_at', 'meeting_count', 'window_start', 'last_assigned_at')
+    list_filter = ('is_active', 'window_start', 'accepted_at')
+    search_fields = ('event_type__name', 'host__email', 'host__first_name', 'host__last_name')
+    readonly_fields = ('window_start', 'meeting_count', 'last_assigned_at', 'created_at', 'updated_at')
+
+
+@admin.register(EventTypeDayCount)
+class EventTypeDayCountAdmin(admin.ModelAdmin):
+    list_display = ('event_type', 'day', 'count')
+    list_filter = ('day',)
+    search_fields = ('event_type__name', 'event_type__user__email')
+
+
 @admin.register(BookingPage)
 class BookingPageAdmin(admin.ModelAdmin):
     list_display = ('event_type', 'page_title', 'show_event_details', 'require_confirmation', 'created_at')
@@ -3,4 +3,7 @@ from django.apps import AppConfig
 
 class EventsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'events'
\ No newline at end of file
+    name = 'events'
+
+    def ready(self):
+        import events.signals
\ No newline at end of file
@@ -0,0 +1,146 @@
+"""
+Per-day booking counters for max_bookings_per_day.
+
+Meeting signals keep one EventTypeDayCount row per event type and local day
+in step with confirmed and pending bookings using F() updates. Bookings lock
+the row of their day, so the limit is enforced without counting meetings,
+and the slot engine finds full days with one indexed query.
+"""
+from datetime import datetime, time, timedelta
+
+from django.db import transaction
+from django.db.models import Count, F
+from django.db.models.functions import Greatest, TruncDate
+from django.utils import timezone
+
+from availability.slots import BUSY_MEETING_STATUSES
+from utils.timezones import get_zone
+from .models import EventType, EventTypeDayCount
+
+
+def booking_day(event_type, start_time):
+    """The day a booking counts against, in the event type owner's timezone"""
+    return start_time.astimezone(get_zone(event_type.user.timezone)).date()
+
+
+def _ensure_row(event_type_id, day):
+    EventTypeDayCount.objects.bulk_create(
+        [EventTypeDayCount(event_type_id=event_type_id, day=day)],
+        ignore_conflicts=True
+    )
+
+
+def increment_day_count(event_type_id, day):
+    _ensure_row(event_type_id, day)
+    EventTypeDayCount.objects.filter(
+        event_type_id=event_type_id, day=day
+    ).update(count=F('count') + 1)
+
+
+def decrement_day_count(event_type_id, day):
+    EventTypeDayCount.objects.filter(
+        event_type_id=event_type_id, day=day, count__gt=0
+    ).update(count=F('count') - 1)
+
+
+def adjust_day_counts(deltas):
+    """Apply summed {(event_type_id, day): delta} changes with one UPDATE per day"""
+    EventTypeDayCount.objects.bulk_create(
+        [
+            EventTypeDayCount(event_type_id=event_type_id, day=day)
+            for (event_type_id, day), delta in deltas.items() if delta > 0
+        ],
+        ignore_conflicts=True
+    )
+    for (event_type_id, day), delta in sorted(deltas.items()):
+        if delta:
+            EventTypeDayCount.objects.filter(
+                event_type_id=event_type_id, day=day
+            ).update(count=Greatest(F('count') + delta, 0))
+
+
+def lock_day_count(event_type_id, day):
+    """Current count for a day, locked until the transaction ends"""
+    _ensure_row(event_type_id, day)
+    return EventTypeDayCount.objects.select_for_update().get(
+        event_type_id=event_type_id, day=day
+    ).count
+
+
+def get_full_days(event_type, start_date, end_date):
+    """Days in the range on which the event type has reached its daily limit"""
+    return set(EventTypeDayCount.objects.filter(
+        event_type=event_type,
+        day__gte=start_date,
+        day__lte=end_date,
+        count__gte=event_type.max_bookings_per_day
+    ).values_list('day', flat=True))
+
+
+def count_day_bookings(event_type, day):
+    """Busy bookings of an event type on one of its owner's local days"""
+    from meetings.models import Meeting
+
+    tz = get_zone(event_type.user.timezone)
+    return Meeting.objects.filter(
+        event_type=event_type,
+        status__in=BUSY_MEETING_STATUSES,
+        start_time__gte=datetime.combine(day, time.min, tzinfo=tz),
+        start_time__lt=datetime.combine(day + timedelta(days=1), time.min, tzinfo=tz)
+    ).count()
+
+
+def rebuild_day_counts(now=None):
+    """
+    Fix per-day counters of upcoming days that drifted from the meetings and
+    drop counters for past days. Returns the number of rows corrected.
+
+    One grouped COUNT per distinct owner timezone finds the rows that look
+    wrong. Each of those is then recounted while its row is locked, the same
+    lock bookings take, so a booking committed during the rebuild is never
+    overwritten by a stale count.
+    """
+    now = now or timezone.now()
+    since = now - timedelta(days=1)
+    first_day = since.date() - timedelta(days=1)
+    EventTypeDayCount.objects.filter(day__lt=first_day).delete()
+
+    from meetings.models import Meeting
+
+    counts = {}
+    zone_names = {str(name) for name in EventType.objects.values_list('user__timezone', flat=True).distinct()}
+    for zone_name in zone_names:
+        rows = Meeting.objects.filter(
+            event_type__user__timezone=zone_name,
+            status__in=BUSY_MEETING_STATUSES,
+            start_time__gte=since
+        ).annotate(
+            day=TruncDate('start_time', tzinfo=get_zone(zone_name))
+        ).values('event_type_id', 'day').annotate(count=Count('id')).order_by()
+        for row in rows:
+            counts[(row['event_type_id'], row['day'])] = row['count']
+
+    stored = {
+        (event_type_id, day): count
+        for event_type_id, day, count in EventTypeDayCount.objects.filter(
+            day__gte=first_day
+        ).values_list('event_type_id', 'day', 'count')
+    }
+    suspects = sorted(
+        key for key in counts.keys() | stored.keys()
+        if key[1] >= first_day and counts.get(key, 0) != stored.get(key, 0)
+    )
+    event_types = EventType.objects.select_related('user').in_bulk({event_type_id for event_type_id, day in suspects})
+
+    fixed = 0
+    for event_type_id, day in suspects:
+        event_type = event_types.get(event_type_id)
+        if event_type is None:
+            continue
+        with transaction.atomic():
+            lock_day_count(event_type_id, day)
+            count = count_day_bookings(event_type, day)
+            fixed += EventTypeDayCount.objects.filter(
+                event_type_id=event_type_id, day=day
+            ).exclude(count=count).update(count=count)
+    return fixed
@@ -27,6 +27,11 @@ class EventType(models.Model):
         ('custom', 'Custom'),
     ]
     
+    SCHEDULING_TYPE_CHOICES = [
+        ('single', 'Single Host'),
+        ('round_robin', 'Round Robin'),
+    ]
+    
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='event_types')
     name = models.CharField(max_length=100)
     description = models.TextField(blank=True)
@@ -38,6 +43,10 @@ class EventType(models.Model):
     buffer_time_before = models.IntegerField(default=0, help_text="Buffer time before meeting (minutes)")
     buffer_time_after = models.IntegerField(default=0, help_text="Buffer time after meeting (minutes)")
     max_bookings_per_day = models.IntegerField(default=10, validators=[MinValueValidator(1), MaxValueValidator(50)])
+    scheduling_type = models.CharField(
+        max_length=20, choices=SCHEDULING_TYPE_CHOICES, default='single',
+        help_text="Round robin event types assign each booking to one host from the pool"
+    )
     
     # Booking settings
     min_notice_time = models.IntegerField(default=60, help_text="Minimum notice time in minutes")
@@ -68,6 +77,10 @@ class EventType(models.Model):
         """Total duration including buffer times"""
         return self.duration + self.buffer_time_before + self.buffer_time_after
 
+    @property
+    def is_round_robin(self):
+        return self.scheduling_type == 'round_robin'
+
 
 class EventTypeAvailability(models.Model):
     """Custom availability for specific event types"""
@@ -100,6 +113,53 @@ class EventTypeAvailability(models.Model):
         return f"{self.event_type.name} - {weekday_name} {self.start_time}-{self.end_time}"
 
 
+class EventTypeHost(models.Model):
+    """
+    Host in the pool of a round-robin event type, with its booking load.
+
+    Adding a host invites them; they only take bookings, and only share
+    their availability with the pool, once they have accepted.
+    """
+    
+    event_type = models.ForeignKey(EventType, on_delete=models.CASCADE, related_name='hosts')
+    host = models.ForeignKey(User, on_delete=models.CASCADE, related_name='hosted_event_types')
+    is_active = models.BooleanField(default=True)
+    accepted_at = models.DateTimeField(blank=True, null=True, help_text="When the host accepted the invitation; null while pending")
+    
+    # Load index, maintained by meeting signals
+    window_start = models.DateField(blank=True, null=True, help_text="Start of the window meeting_count covers")
+    meeting_count = models.PositiveIntegerField(default=0, help_text="Bookings assigned in the current window")
+    last_assigned_at = models.DateTimeField(blank=True, null=True)
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ['event_type', 'host']
+        ordering = ['meeting_count', 'last_assigned_at']
+        indexes = [
+            models.Index(fields=['event_type', 'is_active', 'meeting_count', 'last_assigned_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.host.full_name} - {self.event_type.name} ({self.meeting_count})"
+
+
+class EventTypeDayCount(models.Model):
+    """Confirmed and pending bookings of an event type on one day in the owner's timezone"""
+    
+    event_type = models.ForeignKey(EventType, on_delete=models.CASCADE, related_name='day_counts')
+    day = models.DateField()
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ['event_type', 'day']
+        ordering = ['day']
+
+    def __str__(self):
+        return f"{self.event_type.name} - {self.day} ({self.count})"
+
+
 class BookingPage(models.Model):
     """Customizable booking page for event types"""
     
@@ -0,0 +1,85 @@
+"""
+Round-robin host assignment.
+
+Every EventTypeHost row keeps the number of bookings its host received in
+the current window. Meeting signals keep those counts up to date, so picking
+a host is one indexed lookup rather than a COUNT per host per booking.
+"""
+from django.db.models import F
+from django.utils import timezone
+from .models import EventTypeHost
+
+
+def current_window_start(now=None):
+    """Bookings are balanced per calendar month"""
+    now = now or timezone.now()
+    return now.date().replace(day=1)
+
+
+def roll_window(event_type, window_start):
+    """Reset counters left over from a previous window"""
+    EventTypeHost.objects.filter(event_type=event_type).exclude(
+        window_start=window_start
+    ).update(window_start=window_start, meeting_count=0)
+
+
+def select_host(event_type, start_time, end_time, now=None):
+    """Least-loaded active host who is free for [start_time, end_time), or None"""
+    from availability.holds import held_organizers
+    from availability.rules import compile_rules
+    from availability.slots import get_event_type_hosts, get_host_free_intervals
+    from utils.timezones import get_zone
+
+    window_start = current_window_start(now)
+    roll_window(event_type, window_start)
+
+    hosts = get_event_type_hosts(event_type)
+    tz = get_zone(event_type.user.timezone)
+    start_date = start_time.astimezone(tz).date()
+    end_date = end_time.astimezone(tz).date()
+    free = get_host_free_intervals(event_type, hosts, start_date, end_date, now)
+    pipelines = compile_rules(event_type, hosts, start_date, end_date, now)
+    held = held_organizers([host.id for host in hosts], start_time, end_time)
+    available_ids = [
+        host_id for host_id, intervals in free.items()
+        if any(start <= start_time and end_time <= end for start, end in intervals)
+        and pipelines[host_id].allows(start_time, end_time)
+        and host_id not in held
+    ]
+    if not available_ids:
+        return None
+
+    assignment = EventTypeHost.objects.filter(
+        event_type=event_type,
+        is_active=True,
+        accepted_at__isnull=False,
+        host_id__in=available_ids
+    ).select_related('host').order_by('meeting_count', 'last_assigned_at').first()
+    return assignment.host if assignment else None
+
+
+def record_assignment(event_type_id, host_id, now=None):
+    """Count a new booking against a host's load"""
+    now = now or timezone.now()
+    window_start = current_window_start(now)
+    updated = EventTypeHost.objects.filter(
+        event_type_id=event_type_id, host_id=host_id, window_start=window_start
+    ).update(meeting_count=F('meeting_count') + 1, last_assigned_at=now)
+    if not updated:
+        # First booking of the window for this host
+        EventTypeHost.objects.filter(
+            event_type_id=event_type_id, host_id=host_id
+        ).update(window_start=window_start, meeting_count=1, last_assigned_at=now)
+
+
+def release_assignment(event_type_id, host_id, booked_at, now=None):
+    """Remove a cancelled or deleted booking from a host's load"""
+    window_start = current_window_start(now)
+    if booked_at is None or booked_at.date() < window_start:
+        return
+    EventTypeHost.objects.filter(
+        event_type_id=event_type_id,
+        host_id=host_id,
+        window_start=window_start,
+        meeting_count__gt=0
+    ).update(meeting_count=F('meeting_count') - 1)
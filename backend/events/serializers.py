@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from .models import EventType, EventTypeAvailability, BookingPage
+from .models import EventType, EventTypeAvailability, EventTypeHost, BookingPage
 
 
 class EventTypeAvailabilitySerializer(serializers.ModelSerializer):
@@ -11,6 +11,34 @@ class EventTypeAvailabilitySerializer(serializers.ModelSerializer):
         read_only_fields = ('created_at', 'updated_at')
 
 
+class EventTypeHostSerializer(serializers.ModelSerializer):
+    host_name = serializers.CharField(source='host.full_name', read_only=True)
+    event_type_name = serializers.CharField(source='event_type.name', read_only=True)
+    
+    class Meta:
+        model = EventTypeHost
+        fields = [
+            'id', 'event_type', 'event_type_name', 'host', 'host_name', 'is_active',
+            'accepted_at', 'window_start', 'meeting_count', 'last_assigned_at',
+            'created_at', 'updated_at'
+        ]
+        read_only_fields = (
+            'event_type', 'accepted_at', 'window_start', 'meeting_count',
+            'last_assigned_at', 'created_at', 'updated_at'
+        )
+
+    def validate_host(self, value):
+        """Hosts are invited, so an existing row can never be moved to another user"""
+        if self.instance is not None and value != self.instance.host:
+            raise serializers.ValidationError("A host cannot be changed; invite the new host instead")
+        if not value.is_active:
+            raise serializers.ValidationError("This user cannot be invited as a host")
+        event_type = self.context.get('event_type')
+        if event_type is not None and event_type.hosts.filter(host=value).exists():
+            raise serializers.ValidationError("This user is already in the host pool")
+        return value
+
+
 class BookingPageSerializer(serializers.ModelSerializer):
     class Meta:
         model = BookingPage
@@ -41,7 +69,8 @@ class EventTypeCreateSerializer(serializers.ModelSerializer):
         fields = [
             'name', 'description', 'duration', 'location_type', 'location_details',
             'buffer_time_before', 'buffer_time_after', 'max_bookings_per_day',
-            'min_notice_time', 'max_advance_time', 'color', 'image', 'custom_questions'
+            'scheduling_type', 'min_notice_time', 'max_advance_time', 'color', 'image',
+            'custom_questions'
         ]
 
     def create(self, validated_data):
@@ -65,8 +94,8 @@ class EventTypeUpdateSerializer(serializers.ModelSerializer):
         fields = [
             'name', 'description', 'duration', 'location_type', 'location_details',
             'buffer_time_before', 'buffer_time_after', 'max_bookings_per_day',
-            'min_notice_time', 'max_advance_time', 'color', 'image', 'custom_questions',
-            'is_active'
+            'scheduling_type', 'min_notice_time', 'max_advance_time', 'color', 'image',
+            'custom_questions', 'is_active'
         ]
 
 
@@ -79,6 +108,6 @@ class EventTypeListSerializer(serializers.ModelSerializer):
         model = EventType
         fields = [
             'id', 'name', 'description', 'duration', 'duration_display',
-            'location_type', 'location_type_display', 'color', 'image',
+            'location_type', 'location_type_display', 'scheduling_type', 'color', 'image',
             'is_active', 'created_at', 'updated_at'
         ]
\ No newline at end of file
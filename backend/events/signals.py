@@ -0,0 +1,67 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from availability.slots import BUSY_MEETING_STATUSES
+from .day_counts import booking_day, decrement_day_count, increment_day_count
+from .models import EventType
+from .round_robin import record_assignment, release_assignment
+
+
+@receiver(post_save, sender='meetings.Meeting')
+def update_host_load(sender, instance, created, **kwargs):
+    """Keep the round-robin load index in step with bookings"""
+    if not instance.event_type.is_round_robin:
+        return
+    
+    previous = getattr(instance, '_loaded_values', None) or {}
+    was_busy = not created and previous.get('status') in BUSY_MEETING_STATUSES
+    is_busy = instance.status in BUSY_MEETING_STATUSES
+    
+    if is_busy and not was_busy:
+        record_assignment(instance.event_type_id, instance.organizer_id)
+    elif was_busy and not is_busy:
+        release_assignment(instance.event_type_id, instance.organizer_id, instance.created_at)
+
+
+@receiver(post_delete, sender='meetings.Meeting')
+def release_host_load(sender, instance, **kwargs):
+    """Give back the load of a deleted booking"""
+    if instance.status not in BUSY_MEETING_STATUSES:
+        return
+    if not instance.event_type.is_round_robin:
+        return
+    release_assignment(instance.event_type_id, instance.organizer_id, instance.created_at)
+
+
+@receiver(post_save, sender='meetings.Meeting')
+def update_day_count(sender, instance, created, **kwargs):
+    """Move a booking between per-day counters when its status, day or event type changes"""
+    previous = getattr(instance, '_loaded_values', None) or {}
+    was_busy = not created and previous.get('status') in BUSY_MEETING_STATUSES
+    is_busy = instance.status in BUSY_MEETING_STATUSES
+    if not was_busy and not is_busy:
+        return
+    
+    current = (instance.event_type_id, booking_day(instance.event_type, instance.start_time)) if is_busy else None
+    old = None
+    if was_busy:
+        previous_event_type_id = previous.get('event_type_id', instance.event_type_id)
+        previous_event_type = (
+            instance.event_type if previous_event_type_id == instance.event_type_id
+            else EventType.objects.select_related('user').get(id=previous_event_type_id)
+        )
+        old = (previous_event_type_id, booking_day(previous_event_type, previous.get('start_time', instance.start_time)))
+    
+    if old == current:
+        return
+    if old:
+        decrement_day_count(*old)
+    if current:
+        increment_day_count(*current)
+
+
+@receiver(post_delete, sender='meetings.Meeting')
+def release_day_count(sender, instance, **kwargs):
+    """Give back the day count of a deleted booking"""
+    if instance.status not in BUSY_MEETING_STATUSES:
+        return
+    decrement_day_count(instance.event_type_id, booking_day(instance.event_type, instance.start_time))
@@ -0,0 +1,10 @@
+from celery import shared_task
+
+
+@shared_task
+def rebuild_event_type_day_counts():
+    """Recount upcoming per-day booking counters from meetings"""
+    from .day_counts import rebuild_day_counts
+
+    rebuilt = rebuild_day_counts()
+    return f"Corrected {rebuilt} event type day counts"
@@ -0,0 +1,81 @@
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from availability.slots import get_event_type_hosts
+from .models import EventType, EventTypeHost
+
+User = get_user_model()
+
+
+class HostInvitationTests(APITestCase):
+    """Users only serve a round-robin event type after accepting its invitation"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(
+            username='owner',
+            email='owner@example.com',
+            password='password',
+            first_name='Olive',
+            last_name='Owner'
+        )
+        cls.invitee = User.objects.create_user(
+            username='invitee',
+            email='invitee@example.com',
+            password='password',
+            first_name='Hal',
+            last_name='Host'
+        )
+        cls.event_type = EventType.objects.create(
+            user=cls.owner,
+            name='Sales call',
+            scheduling_type='round_robin'
+        )
+
+    def invite(self, user):
+        self.client.force_login(self.owner)
+        return self.client.post(
+            reverse('event-type-host-list', args=[self.event_type.pk]),
+            {'host': user.pk},
+            format='json'
+        )
+
+    def test_invited_host_serves_only_after_accepting(self):
+        response = self.invite(self.invitee)
+        self.assertEqual(response.status_code, 201)
+        self.assertIsNone(response.data['accepted_at'])
+        self.assertEqual(get_event_type_hosts(self.event_type), [self.owner])
+
+        self.client.force_login(self.invitee)
+        response = self.client.post(reverse('event-type-host-accept', args=[response.data['id']]))
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNotNone(response.data['accepted_at'])
+        self.assertEqual(get_event_type_hosts(self.event_type), [self.invitee])
+
+    def test_owner_joins_own_pool_directly(self):
+        response = self.invite(self.owner)
+        self.assertEqual(response.status_code, 201)
+        self.assertIsNotNone(response.data['accepted_at'])
+
+    def test_only_the_invitee_can_accept(self):
+        membership_id = self.invite(self.invitee).data['id']
+        response = self.client.post(reverse('event-type-host-accept', args=[membership_id]))
+        self.assertEqual(response.status_code, 404)
+        self.assertIsNone(EventTypeHost.objects.get(pk=membership_id).accepted_at)
+
+    def test_host_cannot_be_swapped_on_an_accepted_row(self):
+        membership = EventTypeHost.objects.create(
+            event_type=self.event_type,
+            host=self.owner,
+            accepted_at=self.event_type.created_at
+        )
+        self.client.force_login(self.owner)
+        response = self.client.patch(
+            reverse('event-type-host-detail', args=[membership.pk]),
+            {'host': self.invitee.pk},
+            format='json'
+        )
+        self.assertEqual(response.status_code, 400)
+        membership.refresh_from_db()
+        self.assertEqual(membership.host, self.owner)
@@ -12,6 +12,13 @@ urlpatterns = [
     path('<int:event_type_id>/availability/', views.EventTypeAvailabilityListCreateView.as_view(), name='event-type-availability-list'),
     path('availability/<int:pk>/', views.EventTypeAvailabilityDetailView.as_view(), name='event-type-availability-detail'),
     
+    # Round-robin Hosts
+    path('<int:event_type_id>/hosts/', views.EventTypeHostListCreateView.as_view(), name='event-type-host-list'),
+    path('hosts/<int:pk>/', views.EventTypeHostDetailView.as_view(), name='event-type-host-detail'),
+    path('hosts/invitations/', views.HostInvitationListView.as_view(), name='event-type-host-invitations'),
+    path('hosts/<int:pk>/accept/', views.accept_host_invitation, name='event-type-host-accept'),
+    path('hosts/<int:pk>/decline/', views.decline_host_invitation, name='event-type-host-decline'),
+    
     # Booking Pages
     path('<int:event_type_id>/booking-page/', views.BookingPageDetailView.as_view(), name='booking-page-detail'),
 ]
\ No newline at end of file
@@ -3,10 +3,12 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
-from .models import EventType, EventTypeAvailability, BookingPage
+from django.utils import timezone
+from .models import EventType, EventTypeAvailability, EventTypeHost, BookingPage
 from .serializers import (
     EventTypeSerializer, EventTypeCreateSerializer, EventTypeUpdateSerializer,
-    EventTypeListSerializer, EventTypeAvailabilitySerializer, BookingPageSerializer
+    EventTypeListSerializer, EventTypeAvailabilitySerializer, EventTypeHostSerializer,
+    BookingPageSerializer
 )
 
 
@@ -66,6 +68,85 @@ class EventTypeAvailabilityDetailView(generics.RetrieveUpdateDestroyAPIView):
         )
 
 
+class EventTypeHostListCreateView(generics.ListCreateAPIView):
+    serializer_class = EventTypeHostSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        event_type_id = self.kwargs.get('event_type_id')
+        return EventTypeHost.objects.filter(
+            event_type_id=event_type_id,
+            event_type__user=self.request.user
+        ).select_related('host')
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['event_type'] = EventType.objects.filter(
+            id=self.kwargs.get('event_type_id'),
+            user=self.request.user
+        ).first()
+        return context
+
+    def perform_create(self, serializer):
+        event_type_id = self.kwargs.get('event_type_id')
+        event_type = EventType.objects.get(id=event_type_id, user=self.request.user)
+        # Other users are invited and join the pool once they accept
+        accepted_at = timezone.now() if serializer.validated_data['host'] == self.request.user else None
+        serializer.save(event_type=event_type, accepted_at=accepted_at)
+
+
+class EventTypeHostDetailView(generics.RetrieveUpdateDestroyAPIView):
+    serializer_class = EventTypeHostSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        return EventTypeHost.objects.filter(
+            event_type__user=self.request.user
+        ).select_related('host')
+
+
+class HostInvitationListView(generics.ListAPIView):
+    """Host pools the current user has been invited to"""
+    serializer_class = EventTypeHostSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        return EventTypeHost.objects.filter(
+            host=self.request.user
+        ).select_related('host', 'event_type')
+
+
+@api_view(['POST'])
+@permission_classes([permissions.IsAuthenticated])
+def accept_host_invitation(request, pk):
+    """Join the host pool of an event type the current user was invited to"""
+    try:
+        membership = EventTypeHost.objects.select_related('host', 'event_type').get(pk=pk, host=request.user)
+    except EventTypeHost.DoesNotExist:
+        return Response(
+            {'error': 'Invitation not found'}, 
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    if membership.accepted_at is None:
+        membership.accepted_at = timezone.now()
+        membership.save(update_fields=['accepted_at', 'updated_at'])
+    return Response(EventTypeHostSerializer(membership).data)
+
+
+@api_view(['POST'])
+@permission_classes([permissions.IsAuthenticated])
+def decline_host_invitation(request, pk):
+    """Decline an invitation, or leave a host pool the current user joined"""
+    deleted, _ = EventTypeHost.objects.filter(pk=pk, host=request.user).delete()
+    if not deleted:
+        return Response(
+            {'error': 'Invitation not found'}, 
+            status=status.HTTP_404_NOT_FOUND
+        )
+    return Response(status=status.HTTP_204_NO_CONTENT)
+
+
 class BookingPageDetailView(generics.RetrieveUpdateAPIView):
     serializer_class = BookingPageSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -148,13 +229,11 @@ def event_type_stats(request):
     total_event_types = event_types.count()
     active_event_types = event_types.filter(is_active=True).count()
     
-    # Get booking statistics
-    from meetings.models import Meeting
-    total_bookings = Meeting.objects.filter(event_type__user=user).count()
-    confirmed_bookings = Meeting.objects.filter(
-        event_type__user=user, 
-        status='confirmed'
-    ).count()
+    # Get booking statistics from the per-event-type counters
+    from meetings.counters import get_event_type_counters
+    counters = get_event_type_counters(list(event_types.values_list('id', flat=True)))
+    total_bookings = sum(row.total for row in counters)
+    confirmed_bookings = sum(row.confirmed for row in counters)
     
     return Response({
         'total_event_types': total_event_types,
@@ -167,6 +167,9 @@ class IntegrationLog(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['integration', '-created_at']),
+        ]
 
     def __str__(self):
         return f"{self.integration} - {self.get_log_type_display()}"
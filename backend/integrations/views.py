@@ -15,6 +15,7 @@ from .serializers import (
     IntegrationConnectSerializer, IntegrationDisconnectSerializer,
     IntegrationSyncTriggerSerializer
 )
+from utils.pagination import CreatedAtCursorPagination
 
 
 class IntegrationProviderListView(generics.ListAPIView):
@@ -67,9 +68,9 @@ class IntegrationTemplateListView(generics.ListAPIView):
 class IntegrationLogListView(generics.ListAPIView):
     serializer_class = IntegrationLogSerializer
     permission_classes = [permissions.IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    pagination_class = CreatedAtCursorPagination
+    filter_backends = [DjangoFilterBackend]
     filterset_fields = ['log_type', 'is_error']
-    ordering = ['-created_at']
 
     def get_queryset(self):
         integration_id = self.kwargs.get('integration_id')
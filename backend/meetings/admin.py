@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Meeting, MeetingNote, MeetingAttachment, MeetingRescheduleRequest
+from .models import Meeting, MeetingNote, MeetingAttachment, MeetingRescheduleRequest, AttachmentBlob
 
 
 class MeetingNoteInline(admin.TabularInline):
@@ -63,6 +63,13 @@ class MeetingAttachmentAdmin(admin.ModelAdmin):
     search_fields = ('filename', 'meeting__title', 'uploaded_by__email')
 
 
+@admin.register(AttachmentBlob)
+class AttachmentBlobAdmin(admin.ModelAdmin):
+    list_display = ('sha256', 'size', 'ref_count', 'created_at')
+    search_fields = ('sha256',)
+    readonly_fields = ('sha256', 'file', 'size', 'ref_count', 'created_at')
+
+
 @admin.register(MeetingRescheduleRequest)
 class MeetingRescheduleRequestAdmin(admin.ModelAdmin):
     list_display = ('meeting', 'requested_by', 'new_start_time', 'status', 'created_at')
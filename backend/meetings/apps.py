@@ -3,4 +3,7 @@ from django.apps import AppConfig
 
 class MeetingsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'meetings'
\ No newline at end of file
+    name = 'meetings'
+
+    def ready(self):
+        import meetings.signals
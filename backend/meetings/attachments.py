@@ -0,0 +1,198 @@
+"""
+Content-addressed attachment storage.
+
+Attachment content is stored once per SHA-256 digest as an AttachmentBlob
+and shared by every MeetingAttachment with the same bytes; blobs count
+their references and the cleanup task removes the ones nobody uses.
+Large files arrive as resumable chunked uploads appended to a staging file
+on disk, so neither the upload nor the hashing holds a whole file in
+memory. When the digest is already stored the staged copy is dropped
+instead of being written to storage again.
+"""
+import hashlib
+import os
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import AttachmentBlob, AttachmentUpload, MeetingAttachment
+
+HASH_BLOCK_SIZE = 1024 * 1024
+
+# Unfinished uploads are dropped after this long without a chunk
+STALE_UPLOAD_HOURS = 24
+
+
+class UploadOffsetMismatch(Exception):
+    """A chunk does not start where the upload left off"""
+
+
+def max_attachment_bytes():
+    return getattr(settings, 'ATTACHMENT_MAX_BYTES', 100 * 1024 * 1024)
+
+
+def max_chunk_bytes():
+    return getattr(settings, 'ATTACHMENT_MAX_CHUNK_BYTES', 8 * 1024 * 1024)
+
+
+def _staging_path(upload_id):
+    directory = getattr(settings, 'ATTACHMENT_UPLOAD_DIR', os.path.join(settings.MEDIA_ROOT, 'attachment_uploads'))
+    return os.path.join(directory, str(upload_id))
+
+
+def _blob_name(digest):
+    return f'meeting_attachments/blobs/{digest[:2]}/{digest}'
+
+
+def hash_file(fileobj):
+    """SHA-256 hex digest and size of a file, read block by block"""
+    digest = hashlib.sha256()
+    size = 0
+    fileobj.seek(0)
+    for block in iter(lambda: fileobj.read(HASH_BLOCK_SIZE), b''):
+        digest.update(block)
+        size += len(block)
+    fileobj.seek(0)
+    return digest.hexdigest(), size
+
+
+def store_attachment(meeting, uploaded_by, fileobj, filename, content_type=''):
+    """
+    Attach a file to a meeting, storing its content only if it is new.
+
+    The digest is computed from the content itself, never taken from the
+    client, so sharing a blob requires having uploaded the same bytes.
+    """
+    digest, size = hash_file(fileobj)
+    with transaction.atomic():
+        blob = AttachmentBlob.objects.select_for_update().filter(sha256=digest).first()
+        if blob is None:
+            name = default_storage.save(_blob_name(digest), File(fileobj))
+            AttachmentBlob.objects.bulk_create(
+                [AttachmentBlob(sha256=digest, file=name, size=size)],
+                ignore_conflicts=True
+            )
+            blob = AttachmentBlob.objects.select_for_update().get(sha256=digest)
+            if blob.file.name != name:
+                # Another upload stored the same content first
+                transaction.on_commit(lambda: default_storage.delete(name))
+
+        AttachmentBlob.objects.filter(sha256=digest).update(ref_count=F('ref_count') + 1)
+        return MeetingAttachment.objects.create(
+            meeting=meeting,
+            uploaded_by=uploaded_by,
+            blob=blob,
+            filename=os.path.basename(filename)[:255],
+            content_type=content_type or '',
+        )
+
+
+def release_blob(sha256):
+    """Drop one reference to a blob; unused blobs are removed by the cleanup task"""
+    AttachmentBlob.objects.filter(sha256=sha256, ref_count__gt=0).update(ref_count=F('ref_count') - 1)
+
+
+def start_upload(meeting, uploaded_by, filename, total_size, content_type=''):
+    upload = AttachmentUpload.objects.create(
+        meeting=meeting,
+        uploaded_by=uploaded_by,
+        filename=os.path.basename(filename)[:255],
+        content_type=content_type or '',
+        total_size=total_size,
+    )
+    path = _staging_path(upload.id)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    open(path, 'wb').close()
+    return upload
+
+
+def append_chunk(upload, offset, chunk):
+    """
+    Append an uploaded chunk at offset and return the new received size.
+
+    The upload row is locked while writing, so concurrent chunks for the
+    same upload are applied one at a time. A chunk that does not start at
+    the received size raises UploadOffsetMismatch, telling the client where
+    to resume.
+    """
+    with transaction.atomic():
+        upload = AttachmentUpload.objects.select_for_update().get(pk=upload.pk)
+        if offset != upload.received_size:
+            raise UploadOffsetMismatch(upload.received_size)
+        if upload.received_size + chunk.size > upload.total_size:
+            raise ValueError('Chunk extends past the declared file size')
+
+        path = _staging_path(upload.id)
+        with open(path, 'r+b') as staged:
+            # Drop bytes left by a chunk whose transaction did not commit
+            staged.truncate(upload.received_size)
+            staged.seek(upload.received_size)
+            for piece in chunk.chunks():
+                staged.write(piece)
+
+        upload.received_size += chunk.size
+        upload.save(update_fields=['received_size', 'updated_at'])
+        return upload.received_size
+
+
+def discard_upload(upload):
+    try:
+        os.remove(_staging_path(upload.id))
+    except FileNotFoundError:
+        pass
+    upload.delete()
+
+
+def complete_upload(upload):
+    """Turn a fully received upload into an attachment and drop the staged file"""
+    if upload.received_size != upload.total_size:
+        raise ValueError('Upload is incomplete')
+
+    with open(_staging_path(upload.id), 'rb') as staged:
+        attachment = store_attachment(
+            upload.meeting,
+            upload.uploaded_by,
+            staged,
+            upload.filename,
+            upload.content_type
+        )
+    discard_upload(upload)
+    return attachment
+
+
+def cleanup_attachment_storage(now=None):
+    """Delete unreferenced blobs and stale uploads; returns (blobs, uploads) removed"""
+    now = now or timezone.now()
+
+    removed_blobs = 0
+    for sha256 in list(AttachmentBlob.objects.filter(ref_count=0).values_list('sha256', flat=True)):
+        with transaction.atomic():
+            # Re-check under the lock: an upload may have just reused the content
+            blob = AttachmentBlob.objects.select_for_update().filter(sha256=sha256, ref_count=0).first()
+            if blob is None or blob.attachments.exists():
+                continue
+            name = blob.file.name
+            blob.delete()
+            transaction.on_commit(lambda name=name: default_storage.delete(name))
+            removed_blobs += 1
+
+    cutoff = now - timedelta(hours=STALE_UPLOAD_HOURS)
+    removed_uploads = 0
+    for upload in AttachmentUpload.objects.filter(updated_at__lt=cutoff):
+        discard_upload(upload)
+        removed_uploads += 1
+
+    # Staged files whose upload row went away with its meeting
+    directory = os.path.dirname(_staging_path('-'))
+    if os.path.isdir(directory):
+        live = {str(upload_id) for upload_id in AttachmentUpload.objects.values_list('id', flat=True)}
+        for entry in os.scandir(directory):
+            if entry.name not in live and entry.stat().st_mtime < cutoff.timestamp():
+                os.remove(entry.path)
+                removed_uploads += 1
+    return removed_blobs, removed_uploads
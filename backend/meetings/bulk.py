@@ -0,0 +1,159 @@
+"""
+Bulk meeting operations.
+
+Cancelling, confirming or shifting many of an organizer's meetings runs one
+UPDATE per operation instead of loading and saving each meeting. Because
+queryset updates skip model signals, the derived state the Meeting receivers
+normally maintain (counters, per-day booking counts, round-robin load, slot
+caches and statistics) is brought up to date here from the locked rows'
+before and after states, and invitee emails are queued as one batch.
+"""
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from availability.slots import BUSY_MEETING_STATUSES
+from utils.helpers import validate_meeting_time_slots
+from .counters import apply_meeting_changes
+from .models import Meeting
+
+BULK_ACTIONS = ['cancel', 'confirm', 'shift']
+
+MAX_BULK_MEETINGS = 200
+
+# Meetings each action applies to; the rest of the selection is skipped
+ELIGIBLE = {
+    'cancel': ~Q(status='cancelled'),
+    'confirm': Q(status='pending'),
+    'shift': Q(status__in=BUSY_MEETING_STATUSES),
+}
+
+STATE_FIELDS = ['id', 'organizer_id', 'event_type_id', 'status', 'start_time', 'end_time', 'created_at']
+
+
+class BulkShiftConflict(Exception):
+    """Shifted meetings would overlap other busy meetings"""
+
+    def __init__(self, conflicts):
+        super().__init__('Shifted meetings would conflict with existing meetings')
+        self.conflicts = conflicts
+
+
+def _changes(action, reason, shift, now):
+    if action == 'cancel':
+        return {'status': 'cancelled', 'cancellation_reason': reason, 'cancelled_at': now}
+    if action == 'confirm':
+        return {'status': 'confirmed', 'confirmation_sent': True}
+    return {'start_time': F('start_time') + shift, 'end_time': F('end_time') + shift}
+
+
+def _after(row, action, shift):
+    if action == 'cancel':
+        return dict(row, status='cancelled')
+    if action == 'confirm':
+        return dict(row, status='confirmed')
+    return dict(row, start_time=row['start_time'] + shift, end_time=row['end_time'] + shift)
+
+
+def _check_shift(user, rows, shift):
+    results = validate_meeting_time_slots(user, [
+        {
+            'start_time': row['start_time'] + shift,
+            'end_time': row['end_time'] + shift,
+            'meeting_id': row['id'],
+        }
+        for row in rows
+    ])
+    conflicts = [
+        {'meeting_id': rows[result['index']]['id'], 'conflicts': result['conflicts']}
+        for result in results if not result['is_valid']
+    ]
+    if conflicts:
+        raise BulkShiftConflict(conflicts)
+
+
+def sync_derived_state(pairs, release_load=True):
+    """
+    What the Meeting post_save receivers would have done for each
+    (before, after) pair of meeting state dicts.
+
+    release_load=False keeps round-robin load for bookings that stop being
+    busy, for meetings that took place rather than being called off.
+    """
+    from events.day_counts import adjust_day_counts, booking_day
+    from events.models import EventType
+    from events.round_robin import release_assignment
+
+    apply_meeting_changes([(before, after) for before, after in pairs])
+
+    event_types = EventType.objects.select_related('user').in_bulk(
+        {state['event_type_id'] for pair in pairs for state in pair}
+    )
+    day_deltas = {}
+    for before, after in pairs:
+        for state, sign in ((before, -1), (after, 1)):
+            if state['status'] in BUSY_MEETING_STATUSES:
+                event_type = event_types[state['event_type_id']]
+                key = (event_type.id, booking_day(event_type, state['start_time']))
+                day_deltas[key] = day_deltas.get(key, 0) + sign
+        was_busy = before['status'] in BUSY_MEETING_STATUSES
+        is_busy = after['status'] in BUSY_MEETING_STATUSES
+        if release_load and was_busy and not is_busy and event_types[before['event_type_id']].is_round_robin:
+            release_assignment(before['event_type_id'], before['organizer_id'], before['created_at'])
+    adjust_day_counts(day_deltas)
+
+
+def _after_commit(user_id, action, pairs):
+    """Cache invalidation and notifications the receivers defer to commit"""
+    from availability.bitmaps import apply_meeting_change as apply_busy_change
+    from availability.materialized import invalidate_days
+    from availability.slot_cache import bump_version
+    from .stats import invalidate_meeting_stats
+    from .tasks import send_bulk_meeting_notifications
+
+    def snapshot(state):
+        return {field: state[field] for field in ('organizer_id', 'status', 'start_time', 'end_time')}
+
+    for before, after in pairs:
+        apply_busy_change(snapshot(after), snapshot(before))
+    bump_version(user_id)
+    starts = [state['start_time'] for pair in pairs for state in pair]
+    ends = [state['end_time'] for pair in pairs for state in pair]
+    invalidate_days({user_id}, min(starts).date() - timedelta(days=7), max(ends).date() + timedelta(days=7))
+    invalidate_meeting_stats({user_id})
+    send_bulk_meeting_notifications.delay(action, [after['id'] for before, after in pairs])
+
+
+def bulk_update_meetings(user, action, meeting_ids, reason='', shift_minutes=0, now=None):
+    """
+    Apply one action to many of an organizer's meetings.
+
+    Returns (updated_ids, skipped_ids); meetings that are not the user's or
+    not eligible for the action are skipped. Raises BulkShiftConflict when a
+    shift would make any meeting overlap another busy meeting, in which
+    case nothing is changed.
+    """
+    now = now or timezone.now()
+    shift = timedelta(minutes=shift_minutes)
+    with transaction.atomic():
+        rows = list(
+            Meeting.objects.select_for_update().filter(
+                ELIGIBLE[action], organizer=user, id__in=meeting_ids
+            ).order_by('id').values(*STATE_FIELDS)
+        )
+        updated_ids = [row['id'] for row in rows]
+        skipped_ids = sorted(set(meeting_ids) - set(updated_ids))
+        if not rows:
+            return updated_ids, skipped_ids
+        if action == 'shift':
+            _check_shift(user, rows, shift)
+
+        Meeting.objects.filter(id__in=updated_ids).update(
+            updated_at=now, **_changes(action, reason, shift, now)
+        )
+        pairs = [(row, _after(row, action, shift)) for row in rows]
+        sync_derived_state(pairs)
+        transaction.on_commit(lambda: _after_commit(user.id, action, pairs))
+    return updated_ids, skipped_ids
@@ -0,0 +1,120 @@
+"""
+Per-user iCalendar subscription feed.
+
+Calendar clients poll the feed often, so every request first computes cheap
+validators (latest Meeting.updated_at and the meeting count in one aggregate
+query) and answers 304 when the client's copy is current. Otherwise VEVENTs
+are streamed from a chunked queryset iterator without building the whole
+calendar in memory.
+"""
+import hashlib
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+
+from django.db.models import Count, Max
+from django.utils import timezone
+
+from utils.helpers import create_calendar_event_data
+from .models import Meeting
+
+# Past meetings kept in the feed
+FEED_PAST_DAYS = 90
+
+# Meetings fetched per database round trip while streaming
+FEED_CHUNK_SIZE = 200
+
+ICS_STATUSES = {
+    'pending': 'TENTATIVE',
+    'confirmed': 'CONFIRMED',
+    'cancelled': 'CANCELLED',
+    'completed': 'CONFIRMED',
+    'no_show': 'CONFIRMED',
+}
+
+
+def _feed_start(now=None):
+    first_day = timezone.localdate(now or timezone.now()) - timedelta(days=FEED_PAST_DAYS)
+    return timezone.make_aware(datetime.combine(first_day, time.min))
+
+
+def feed_meetings(user, now=None):
+    """Meetings included in a user's feed, from FEED_PAST_DAYS ago onwards"""
+    return Meeting.objects.filter(organizer=user, start_time__gte=_feed_start(now))
+
+
+def feed_validators(user, now=None):
+    """(etag, last_modified) for a user's feed from one aggregate query"""
+    since = _feed_start(now)
+    values = Meeting.objects.filter(organizer=user, start_time__gte=since).aggregate(
+        latest=Max('updated_at'),
+        count=Count('id')
+    )
+    latest = values['latest'] or user.date_joined
+    # The count changes when meetings are deleted or leave the window, which updated_at cannot show
+    digest = hashlib.md5(
+        f"{user.id}:{since.isoformat()}:{values['count']}:{latest.isoformat()}".encode()
+    ).hexdigest()
+    return f'"{digest}"', latest
+
+
+def _escape(value):
+    return (
+        str(value or '')
+        .replace('\\', '\\\\')
+        .replace(';', '\\;')
+        .replace(',', '\\,')
+        .replace('\r\n', '\\n')
+        .replace('\n', '\\n')
+    )
+
+
+def _fold(line):
+    """Fold a content line at 75 octets as RFC 5545 requires"""
+    encoded = line.encode()
+    if len(encoded) <= 75:
+        return line + '\r\n'
+    parts = []
+    while encoded:
+        limit = 75 if not parts else 74
+        # Never split inside a multi-byte character
+        while limit < len(encoded) and (encoded[limit] & 0xC0) == 0x80:
+            limit -= 1
+        parts.append(encoded[:limit].decode())
+        encoded = encoded[limit:]
+    return '\r\n '.join(parts) + '\r\n'
+
+
+def _ics_time(value):
+    return datetime.fromisoformat(value).astimezone(dt_timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+
+def meeting_vevent(meeting):
+    """A VEVENT block for one meeting built from its calendar event data"""
+    data = create_calendar_event_data(meeting)
+    lines = [
+        'BEGIN:VEVENT',
+        f'UID:meeting-{meeting.pk}@meetxccelerate',
+        f'DTSTAMP:{meeting.updated_at.astimezone(dt_timezone.utc).strftime("%Y%m%dT%H%M%SZ")}',
+        f'DTSTART:{_ics_time(data["start"]["dateTime"])}',
+        f'DTEND:{_ics_time(data["end"]["dateTime"])}',
+        f'SUMMARY:{_escape(data["summary"])}',
+        f'STATUS:{ICS_STATUSES.get(meeting.status, "CONFIRMED")}',
+    ]
+    if data['description']:
+        lines.append(f'DESCRIPTION:{_escape(data["description"])}')
+    if data['location']:
+        lines.append(f'LOCATION:{_escape(data["location"])}')
+    organizer, invitee = data['attendees'][1], data['attendees'][0]
+    lines.append(f'ORGANIZER;CN={_escape(organizer["displayName"])}:mailto:{organizer["email"]}')
+    lines.append(f'ATTENDEE;CN={_escape(invitee["displayName"])}:mailto:{invitee["email"]}')
+    lines.append('END:VEVENT')
+    return ''.join(_fold(line) for line in lines)
+
+
+def iter_feed(user, now=None):
+    """Yield the iCalendar document for a user piece by piece"""
+    yield _fold('BEGIN:VCALENDAR') + _fold('VERSION:2.0') + _fold('PRODID:-//MeetXccelerate//Meetings//EN')
+    yield _fold(f'X-WR-CALNAME:{_escape(user.full_name)} meetings')
+    meetings = feed_meetings(user, now).select_related('organizer').order_by('start_time')
+    for meeting in meetings.iterator(chunk_size=FEED_CHUNK_SIZE):
+        yield meeting_vevent(meeting)
+    yield _fold('END:VCALENDAR')
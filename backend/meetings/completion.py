@@ -0,0 +1,92 @@
+"""
+Auto-completion of ended meetings.
+
+Confirmed meetings whose end_time has passed are moved to completed in
+chunks. Each chunk is read through the (status, end_time) index in end_time
+order, locked, changed with one UPDATE and committed on its own, so a run
+touches at most max_batches * batch_size rows however large the table is;
+the next run picks up where this one stopped. Completed meetings are
+handed to meeting_completed workflows as one batch per chunk.
+"""
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from .bulk import STATE_FIELDS, sync_derived_state
+from .models import Meeting
+
+COMPLETION_BATCH_SIZE = 500
+
+# Chunks per run, bounding the runtime of one sweep
+COMPLETION_MAX_BATCHES = 20
+
+# Meetings often overrun; leave them confirmed for a while after their end
+COMPLETION_GRACE_MINUTES = 30
+
+
+def _workflow_batch(rows):
+    """(workflow_id, trigger_data) for every meeting_completed workflow of the organizers"""
+    from workflows.models import Workflow
+
+    workflows = {}
+    for workflow_id, user_id in Workflow.objects.filter(
+        user_id__in={row['organizer_id'] for row in rows},
+        trigger_type='meeting_completed',
+        status='active',
+        is_active=True
+    ).values_list('id', 'user_id'):
+        workflows.setdefault(user_id, []).append(workflow_id)
+
+    return [
+        (workflow_id, {
+            'trigger': 'meeting_completed',
+            'meeting_id': row['id'],
+            'event_type_id': row['event_type_id'],
+            'ended_at': row['end_time'].isoformat(),
+        })
+        for row in rows
+        for workflow_id in workflows.get(row['organizer_id'], [])
+    ]
+
+
+def _complete_batch(cutoff, batch_size, now):
+    from utils.tasks import process_workflow_executions
+    from .stats import invalidate_meeting_stats
+
+    with transaction.atomic():
+        rows = list(
+            Meeting.objects.select_for_update(skip_locked=True).filter(
+                status='confirmed',
+                end_time__lte=cutoff
+            ).order_by('end_time').values(*STATE_FIELDS)[:batch_size]
+        )
+        if not rows:
+            return 0
+
+        Meeting.objects.filter(id__in=[row['id'] for row in rows]).update(
+            status='completed',
+            updated_at=now
+        )
+        # Completed meetings still count towards a host's round-robin load
+        sync_derived_state([(row, dict(row, status='completed')) for row in rows], release_load=False)
+
+        organizer_ids = {row['organizer_id'] for row in rows}
+        executions = _workflow_batch(rows)
+        transaction.on_commit(lambda: invalidate_meeting_stats(organizer_ids))
+        if executions:
+            transaction.on_commit(lambda: process_workflow_executions.delay(executions))
+    return len(rows)
+
+
+def complete_ended_meetings(now=None, batch_size=COMPLETION_BATCH_SIZE, max_batches=COMPLETION_MAX_BATCHES):
+    """Mark ended confirmed meetings completed; returns the number changed"""
+    now = now or timezone.now()
+    cutoff = now - timedelta(minutes=COMPLETION_GRACE_MINUTES)
+    completed = 0
+    for _ in range(max_batches):
+        changed = _complete_batch(cutoff, batch_size, now)
+        completed += changed
+        if changed < batch_size:
+            break
+    return completed
@@ -0,0 +1,229 @@
+"""
+Denormalized meeting counters.
+
+MeetingCounters (per organizer) and EventTypeMeetingCounters (per event
+type) hold totals by status plus today, upcoming and this-month counts.
+Meeting signals apply the difference between a meeting's previous and new
+state as a single F() update inside the meeting's save transaction; writes
+never read or lock the row beforehand, so concurrent bookings only contend
+for the duration of that update. Dashboard reads are a primary-key fetch.
+
+Rows without counts (counts_date is null) are recounted from meetings on
+first read, and date-relative counts are rebased on the first read of a new
+day. Recounts are stored only if the row's version is unchanged, so a write
+that lands mid-recount is never overwritten. A nightly reconciliation
+recomputes every row.
+"""
+from datetime import datetime, time, timedelta
+
+from django.db.models import Case, Count, F, IntegerField, Q, When
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from availability.slots import BUSY_MEETING_STATUSES
+from .models import Meeting, MeetingCounters, EventTypeMeetingCounters
+
+STATUS_FIELDS = ['pending', 'confirmed', 'cancelled', 'completed', 'no_show']
+DATE_FIELDS = ['todays', 'upcoming', 'this_month']
+
+# Counter model and the Meeting field that owns its rows
+OWNERS = [
+    (MeetingCounters, 'organizer_id'),
+    (EventTypeMeetingCounters, 'event_type_id'),
+]
+
+
+def _day_start(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def meeting_state(meeting):
+    """The parts of a meeting the counters depend on"""
+    return {
+        'organizer_id': meeting.organizer_id,
+        'event_type_id': meeting.event_type_id,
+        'status': meeting.status,
+        'start_time': meeting.start_time,
+    }
+
+
+def _aggregates(today, date_fields_only=False):
+    day_start = _day_start(today)
+    aggregates = {
+        'todays': Count('id', filter=Q(
+            status__in=BUSY_MEETING_STATUSES,
+            start_time__gte=day_start,
+            start_time__lt=_day_start(today + timedelta(days=1))
+        )),
+        'upcoming': Count('id', filter=Q(status__in=BUSY_MEETING_STATUSES, start_time__gte=day_start)),
+        'this_month': Count('id', filter=Q(status='confirmed', start_time__gte=_day_start(today.replace(day=1)))),
+    }
+    if not date_fields_only:
+        aggregates['total'] = Count('id')
+        for status in STATUS_FIELDS:
+            aggregates[status] = Count('id', filter=Q(status=status))
+    return aggregates
+
+
+def _contribution(state, today):
+    """Counter fields one meeting state adds to, relative to today"""
+    if state is None or state['status'] not in STATUS_FIELDS:
+        return {}
+    fields = {'total': 1, state['status']: 1}
+    start_day = timezone.localtime(state['start_time']).date()
+    if state['status'] in BUSY_MEETING_STATUSES:
+        if start_day == today:
+            fields['todays'] = 1
+        if start_day >= today:
+            fields['upcoming'] = 1
+    if state['status'] == 'confirmed' and start_day >= today.replace(day=1):
+        fields['this_month'] = 1
+    return fields
+
+
+def _recount(owner_field, owner_id, today, date_fields_only=False):
+    """Counter values of an owner from meetings; date fields only scan from the start of the month"""
+    meetings = Meeting.objects.filter(**{owner_field: owner_id})
+    if date_fields_only:
+        meetings = meetings.filter(start_time__gte=_day_start(today.replace(day=1)))
+    return meetings.aggregate(**_aggregates(today, date_fields_only))
+
+
+def _store(model, row, values, today):
+    """Save recounted values onto a row unless a write bumped its version since it was read"""
+    model.objects.filter(pk=row.pk, version=row.version).update(
+        counts_date=today, version=F('version') + 1, updated_at=timezone.now(), **values
+    )
+    for field, value in values.items():
+        setattr(row, field, value)
+    row.counts_date = today
+    return row
+
+
+def _refresh(model, owner_field, row, today):
+    if row.counts_date is None:
+        return _store(model, row, _recount(owner_field, row.pk, today), today)
+    if row.counts_date != today:
+        return _store(model, row, _recount(owner_field, row.pk, today, date_fields_only=True), today)
+    return row
+
+
+def _shift(field, delta, condition):
+    # Drifted rows are clamped at zero rather than failing the meeting write;
+    # reconciliation restores the exact count
+    return Case(
+        When(condition, then=Greatest(F(field) + delta, 0, output_field=IntegerField())),
+        default=F(field),
+        output_field=IntegerField()
+    )
+
+
+def _apply(model, owner_field, owner_id, deltas, adds, today):
+    # Status totals only move on counted rows, date counts only while they
+    # are for today; anything else is recounted on the next read
+    updates = {
+        field: _shift(field, delta, Q(counts_date=today) if field in DATE_FIELDS else Q(counts_date__isnull=False))
+        for field, delta in deltas.items() if delta
+    }
+    if not updates:
+        return
+    updated = model.objects.filter(pk=owner_id).update(
+        version=F('version') + 1, updated_at=timezone.now(), **updates
+    )
+    if not updated and adds:
+        # First meeting of this owner: an uncounted row, recounted on first
+        # read once this transaction has committed. Removals never create
+        # rows, which also keeps cascade deletes of the owner from
+        # recreating a counter row it is about to drop.
+        model.objects.bulk_create([model(**{owner_field: owner_id})], ignore_conflicts=True)
+
+
+def apply_meeting_changes(changes, today=None):
+    """
+    Move the contribution of several meetings from their previous state to
+    their current one, given (previous, current) pairs.
+
+    Deltas are summed per counter row first, so a batch touching many
+    meetings of one owner costs one update for that row.
+    """
+    today = today or timezone.localdate()
+    for model, owner_field in OWNERS:
+        deltas = {}
+        adds = set()
+        for previous, current in changes:
+            for state, sign in ((previous, -1), (current, 1)):
+                if state is None:
+                    continue
+                owner_deltas = deltas.setdefault(state[owner_field], {})
+                for field, value in _contribution(state, today).items():
+                    owner_deltas[field] = owner_deltas.get(field, 0) + sign * value
+                if sign > 0:
+                    adds.add(state[owner_field])
+        for owner_id in sorted(deltas):
+            _apply(model, owner_field, owner_id, deltas[owner_id], owner_id in adds, today)
+
+
+def apply_meeting_change(previous, current, today=None):
+    """Move one meeting's contribution from its previous state to its current one"""
+    apply_meeting_changes([(previous, current)], today)
+
+
+def get_counters(model, owner_field, owner_id, today=None):
+    """A counter row with its date fields valid for today, created on first use"""
+    today = today or timezone.localdate()
+    row = model.objects.filter(pk=owner_id).first()
+    if row is None:
+        model.objects.bulk_create([model(**{owner_field: owner_id})], ignore_conflicts=True)
+        row = model.objects.get(pk=owner_id)
+    return _refresh(model, owner_field, row, today)
+
+
+def get_event_type_counters(event_type_ids, today=None):
+    """Counter rows for several event types, initialising any that are missing"""
+    today = today or timezone.localdate()
+    rows = {row.pk: row for row in EventTypeMeetingCounters.objects.filter(pk__in=event_type_ids)}
+    for event_type_id in event_type_ids:
+        if event_type_id in rows:
+            _refresh(EventTypeMeetingCounters, 'event_type_id', rows[event_type_id], today)
+        else:
+            rows[event_type_id] = get_counters(EventTypeMeetingCounters, 'event_type_id', event_type_id, today)
+    return [rows[event_type_id] for event_type_id in event_type_ids]
+
+
+def reconcile_counters(today=None):
+    """
+    Recount every counter row and fix the ones that drifted.
+
+    Uses one grouped query per counter table. Row versions are read before
+    counting and a fix is only stored if the version is unchanged, so it
+    never overwrites a concurrent update with an older count. Returns the
+    number of rows fixed.
+    """
+    today = today or timezone.localdate()
+    status_fields = ['total'] + STATUS_FIELDS
+    fields = status_fields + DATE_FIELDS
+    fixed = 0
+    for model, owner_field in OWNERS:
+        stored = list(model.objects.values('pk', 'version', 'counts_date', *fields))
+        computed = {
+            row[owner_field]: {field: row[field] for field in fields}
+            for row in Meeting.objects.values(owner_field).annotate(**_aggregates(today)).order_by()
+        }
+        zeros = {field: 0 for field in fields}
+        for row in stored:
+            expected = computed.get(row['pk'], zeros)
+            compared = fields if row['counts_date'] == today else status_fields
+            if row['counts_date'] is not None and all(row[field] == expected[field] for field in compared):
+                continue
+            fixed += model.objects.filter(pk=row['pk'], version=row['version']).update(
+                counts_date=today, version=F('version') + 1, updated_at=timezone.now(), **expected
+            )
+
+        seen = {row['pk'] for row in stored}
+        missing = [
+            model(pk=owner_id, counts_date=today, **values)
+            for owner_id, values in computed.items() if owner_id not in seen
+        ]
+        model.objects.bulk_create(missing, ignore_conflicts=True)
+        fixed += len(missing)
+    return fixed
@@ -0,0 +1,147 @@
+"""
+Attachment download responses.
+
+After the permission check the transfer is handed to the front server when
+ATTACHMENT_SENDFILE_BACKEND is set: 'nginx' answers with X-Accel-Redirect
+to the internal ATTACHMENT_ACCEL_REDIRECT_PREFIX location, 'apache' with
+X-Sendfile. The front server then serves the bytes, including range
+requests, without holding a Python worker. Without a backend the file is
+streamed from a memory map in fixed-size slices with single-range
+Range/If-Range support, so players can seek in large recordings.
+"""
+import mmap
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import content_disposition_header
+
+STREAM_BLOCK_SIZE = 256 * 1024
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def _etag(attachment):
+    # Blob digests identify the content exactly; legacy files fall back to name and size
+    if attachment.blob_id:
+        return f'"{attachment.blob_id}"'
+    return f'"{attachment.pk}-{attachment.file_size}"'
+
+
+def parse_range(header, size):
+    """
+    (start, end) inclusive byte range requested by a Range header.
+
+    Returns None to serve the whole file (no header, an unsupported unit or
+    several ranges) and raises ValueError when the range is unsatisfiable.
+    """
+    match = RANGE_RE.match((header or '').strip())
+    if not match or not any(match.groups()):
+        return None
+    first, last = match.groups()
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0:
+            raise ValueError('Empty suffix range')
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError('Range not satisfiable')
+    return start, end
+
+
+def _offloaded_response(attachment, backend):
+    response = HttpResponse(content_type=attachment.content_type or 'application/octet-stream')
+    if backend == 'nginx':
+        prefix = getattr(settings, 'ATTACHMENT_ACCEL_REDIRECT_PREFIX', '/protected-media/')
+        response['X-Accel-Redirect'] = prefix.rstrip('/') + '/' + quote(attachment.file.name)
+    else:
+        response['X-Sendfile'] = attachment.file.path
+    return response
+
+
+def _iter_mapped(path, start, end):
+    """Yield bytes start..end of a file from a memory map without copying it whole"""
+    with open(path, 'rb') as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            position = start
+            while position <= end:
+                stop = min(position + STREAM_BLOCK_SIZE, end + 1)
+                yield mapped[position:stop]
+                position = stop
+
+
+def _iter_storage(attachment, start, end):
+    """Yield bytes start..end from storage backends without local paths"""
+    with attachment.file.open('rb') as handle:
+        handle.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            block = handle.read(min(STREAM_BLOCK_SIZE, remaining))
+            if not block:
+                break
+            remaining -= len(block)
+            yield block
+
+
+def _streamed_response(request, attachment, etag):
+    try:
+        path = attachment.file.path
+        size = os.path.getsize(path)
+    except NotImplementedError:
+        path = None
+        size = attachment.file.size
+
+    byte_range = None
+    if_range = request.headers.get('If-Range')
+    if not if_range or if_range == etag:
+        try:
+            byte_range = parse_range(request.headers.get('Range'), size)
+        except ValueError:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            return response
+
+    start, end = byte_range or (0, size - 1)
+    if size == 0:
+        content = iter([b''])
+    elif path:
+        content = _iter_mapped(path, start, end)
+    else:
+        content = _iter_storage(attachment, start, end)
+
+    response = StreamingHttpResponse(
+        content,
+        status=206 if byte_range else 200,
+        content_type=attachment.content_type or 'application/octet-stream'
+    )
+    response['Content-Length'] = str(end - start + 1 if size else 0)
+    if byte_range:
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+    return response
+
+
+def attachment_response(request, attachment):
+    """The response that sends an attachment the requester may read"""
+    etag = _etag(attachment)
+    conditional = get_conditional_response(request, etag=etag)
+    if conditional is not None:
+        conditional['ETag'] = etag
+        return conditional
+
+    backend = getattr(settings, 'ATTACHMENT_SENDFILE_BACKEND', '')
+    if backend in ('nginx', 'apache'):
+        response = _offloaded_response(attachment, backend)
+    else:
+        response = _streamed_response(request, attachment, etag)
+
+    response['ETag'] = etag
+    response['Accept-Ranges'] = 'bytes'
+    response['Cache-Control'] = 'private'
+    response['Content-Disposition'] = content_disposition_header(True, os.path.basename(attachment.filename))
+    return response
@@ -1,4 +1,6 @@
-from django.db import models
+import uuid
+
+from django.db import models, transaction
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from events.models import EventType
@@ -6,6 +8,20 @@ from events.models import EventType
 User = get_user_model()
 
 
+class MeetingQuerySet(models.QuerySet):
+    def for_list(self):
+        """Load the relations MeetingListSerializer reads"""
+        return self.select_related('event_type', 'organizer')
+
+    def for_detail(self):
+        """Load everything MeetingSerializer reads in a fixed number of queries"""
+        return self.for_list().prefetch_related(
+            models.Prefetch('notes', queryset=MeetingNote.objects.select_related('author')),
+            models.Prefetch('attachments', queryset=MeetingAttachment.objects.select_related('uploaded_by')),
+            models.Prefetch('reschedule_requests', queryset=MeetingRescheduleRequest.objects.select_related('requested_by')),
+        )
+
+
 class Meeting(models.Model):
     """Meeting/Appointment model"""
     
@@ -58,12 +74,34 @@ class Meeting(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     cancelled_at = models.DateTimeField(blank=True, null=True)
 
+    objects = MeetingQuerySet.as_manager()
+
     class Meta:
         ordering = ['-start_time']
+        indexes = [
+            # Conflict checks: organizer and status equality, then the time range
+            models.Index(fields=['organizer', 'status', 'start_time', 'end_time']),
+            # Keyset pagination of an organizer's meetings
+            models.Index(fields=['organizer', '-start_time']),
+            # Auto-completion sweep of ended meetings
+            models.Index(fields=['status', 'end_time']),
+            # Reminder scheduler: unsent reminders by start time
+            models.Index(fields=['reminder_sent', 'start_time']),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.start_time.strftime('%Y-%m-%d %H:%M')} ({self.status})"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Keep the persisted values so signal handlers can see what changed
+        instance._loaded_values = {
+            name: value for name, value in zip(field_names, values)
+            if value is not models.DEFERRED
+        }
+        return instance
+
     @property
     def duration_minutes(self):
         """Duration of the meeting in minutes"""
@@ -96,7 +134,15 @@ class Meeting(models.Model):
         if self.status == 'cancelled' and not self.cancelled_at:
             self.cancelled_at = timezone.now()
         
-        super().save(*args, **kwargs)
+        # Signal handlers update denormalized counters in the same transaction
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+        
+        # The saved state is the baseline for the next change
+        self._loaded_values = {
+            field.attname: getattr(self, field.attname)
+            for field in self._meta.concrete_fields
+        }
 
 
 class MeetingNote(models.Model):
@@ -116,10 +162,24 @@ class MeetingNote(models.Model):
         return f"Note for {self.meeting.title} by {self.author.full_name}"
 
 
+class AttachmentBlob(models.Model):
+    """Attachment content stored once per SHA-256 digest and shared by reference"""
+    sha256 = models.CharField(max_length=64, primary_key=True)
+    file = models.FileField(upload_to='meeting_attachments/blobs/')
+    size = models.PositiveBigIntegerField()
+    ref_count = models.PositiveIntegerField(default=0, help_text="Attachments using this content")
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.sha256} ({self.ref_count} references)"
+
+
 class MeetingAttachment(models.Model):
     """File attachments for meetings"""
     meeting = models.ForeignKey(Meeting, on_delete=models.CASCADE, related_name='attachments')
     uploaded_by = models.ForeignKey(User, on_delete=models.CASCADE)
+    blob = models.ForeignKey(AttachmentBlob, on_delete=models.PROTECT, blank=True, null=True, related_name='attachments')
     file = models.FileField(upload_to='meeting_attachments/')
     filename = models.CharField(max_length=255)
     file_size = models.PositiveIntegerField()
@@ -131,12 +191,33 @@ class MeetingAttachment(models.Model):
         return f"{self.filename} - {self.meeting.title}"
 
     def save(self, *args, **kwargs):
-        if self.file:
+        if self.blob_id:
+            # Shared content: point at the blob and keep the uploaded filename
+            self.file.name = self.blob.file.name
+            self.file_size = self.blob.size
+        elif self.file:
             self.filename = self.file.name
             self.file_size = self.file.size
         super().save(*args, **kwargs)
 
 
+class AttachmentUpload(models.Model):
+    """A resumable chunked upload staged on disk until it is complete"""
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    meeting = models.ForeignKey(Meeting, on_delete=models.CASCADE, related_name='attachment_uploads')
+    uploaded_by = models.ForeignKey(User, on_delete=models.CASCADE)
+    filename = models.CharField(max_length=255)
+    content_type = models.CharField(max_length=100, blank=True)
+    total_size = models.PositiveBigIntegerField()
+    received_size = models.PositiveBigIntegerField(default=0)
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.filename} ({self.received_size}/{self.total_size} bytes)"
+
+
 class MeetingRescheduleRequest(models.Model):
     """Reschedule requests for meetings"""
     
@@ -164,4 +245,55 @@ class MeetingRescheduleRequest(models.Model):
         ordering = ['-created_at']
 
     def __str__(self):
-        return f"Reschedule request for {self.meeting.title} - {self.status}"
\ No newline at end of file
+        return f"Reschedule request for {self.meeting.title} - {self.status}"
+
+class SlotLock(models.Model):
+    """Lock row for one organizer time bucket, held while a booking is written"""
+    organizer = models.ForeignKey(User, on_delete=models.CASCADE, related_name='slot_locks')
+    bucket_start = models.DateTimeField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ['organizer', 'bucket_start']
+
+    def __str__(self):
+        return f"{self.organizer.full_name} - {self.bucket_start}"
+
+
+class MeetingCounterFields(models.Model):
+    """Meeting totals maintained on write by meeting signals"""
+    total = models.PositiveIntegerField(default=0)
+    pending = models.PositiveIntegerField(default=0)
+    confirmed = models.PositiveIntegerField(default=0)
+    cancelled = models.PositiveIntegerField(default=0)
+    completed = models.PositiveIntegerField(default=0)
+    no_show = models.PositiveIntegerField(default=0)
+    
+    # Date-relative counts, valid for counts_date (null until first computed)
+    counts_date = models.DateField(blank=True, null=True)
+    todays = models.PositiveIntegerField(default=0, help_text="Pending or confirmed meetings on counts_date")
+    upcoming = models.PositiveIntegerField(default=0, help_text="Pending or confirmed meetings from counts_date on")
+    this_month = models.PositiveIntegerField(default=0, help_text="Confirmed meetings from the start of the month of counts_date on")
+    
+    # Bumped by every write so recounts can tell whether the row moved under them
+    version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        abstract = True
+
+
+class MeetingCounters(MeetingCounterFields):
+    """Denormalized meeting counters of one organizer"""
+    organizer = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name='meeting_counters')
+
+    def __str__(self):
+        return f"Meeting counters for {self.organizer.full_name}"
+
+
+class EventTypeMeetingCounters(MeetingCounterFields):
+    """Denormalized meeting counters of one event type"""
+    event_type = models.OneToOneField(EventType, on_delete=models.CASCADE, primary_key=True, related_name='meeting_counters')
+
+    def __str__(self):
+        return f"Meeting counters for {self.event_type.name}"
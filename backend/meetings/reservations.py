@@ -0,0 +1,85 @@
+"""
+Race-free meeting reservation.
+
+Each organizer's calendar is divided into fixed buckets with one SlotLock row
+per bucket. A booking locks only the buckets its meeting covers, in order,
+then checks for conflicts and inserts the meeting in the same transaction.
+Overlapping bookings always share a bucket and are serialized, while
+bookings at other times or for other organizers proceed in parallel. The
+per-day booking counter is locked after the buckets, so the lock order is
+always the same.
+"""
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.db import transaction
+
+from availability.holds import is_held, release_hold
+from availability.slots import SLOT_GRANULARITY
+from events.day_counts import booking_day, lock_day_count
+from utils.helpers import validate_meeting_time_slot
+from .models import SlotLock
+
+LOCK_BUCKET_MINUTES = SLOT_GRANULARITY
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+class SlotUnavailable(Exception):
+    """The requested time conflicts with an existing meeting"""
+
+
+class DayFullyBooked(SlotUnavailable):
+    """The event type has reached max_bookings_per_day on the requested day"""
+
+
+def lock_buckets(start, end):
+    """Start times of the lock buckets covering [start, end)"""
+    size = timedelta(minutes=LOCK_BUCKET_MINUTES)
+    bucket = _EPOCH + ((start - _EPOCH) // size) * size
+    buckets = []
+    while bucket < end:
+        buckets.append(bucket)
+        bucket += size
+    return buckets
+
+
+def acquire_slot_locks(organizer_id, start, end):
+    """Lock an organizer's buckets for [start, end) until the transaction ends"""
+    buckets = lock_buckets(start, end)
+    SlotLock.objects.bulk_create(
+        [SlotLock(organizer_id=organizer_id, bucket_start=bucket) for bucket in buckets],
+        ignore_conflicts=True
+    )
+    # Always lock in bucket order so concurrent bookings cannot deadlock
+    return list(
+        SlotLock.objects.select_for_update()
+        .filter(organizer_id=organizer_id, bucket_start__in=buckets)
+        .order_by('bucket_start')
+        .values_list('id', flat=True)
+    )
+
+
+def reserve_meeting(organizer, start, end, create, hold_token=None, event_type=None):
+    """
+    Run create() while holding the organizer's locks for [start, end).
+
+    Raises SlotUnavailable if a confirmed or pending meeting already
+    overlaps the range once the locks are held, or if the time is held by
+    another invitee. With an event type, its counter for the booking day is
+    locked last and DayFullyBooked is raised once max_bookings_per_day is
+    reached. The caller's own hold is released after commit.
+    """
+    with transaction.atomic():
+        acquire_slot_locks(organizer.id, start, end)
+        if not validate_meeting_time_slot(start, end, organizer):
+            raise SlotUnavailable()
+        if is_held(organizer.id, start, end, except_token=hold_token):
+            raise SlotUnavailable()
+        if event_type is not None:
+            day = booking_day(event_type, start)
+            if lock_day_count(event_type.id, day) >= event_type.max_bookings_per_day:
+                raise DayFullyBooked()
+        meeting = create()
+        if hold_token:
+            transaction.on_commit(lambda: release_hold(hold_token))
+        return meeting
@@ -1,6 +1,12 @@
 from rest_framework import serializers
+from django.contrib.auth import get_user_model
+from django.urls import reverse
 from django.utils import timezone
-from .models import Meeting, MeetingNote, MeetingAttachment, MeetingRescheduleRequest
+from datetime import datetime
+from .attachments import max_attachment_bytes, max_chunk_bytes
+from .bulk import BULK_ACTIONS, MAX_BULK_MEETINGS
+from .models import Meeting, MeetingNote, MeetingAttachment, MeetingRescheduleRequest, AttachmentUpload
+from events.models import EventType
 from events.serializers import EventTypeListSerializer
 
 
@@ -15,11 +21,44 @@ class MeetingNoteSerializer(serializers.ModelSerializer):
 
 class MeetingAttachmentSerializer(serializers.ModelSerializer):
     uploaded_by_name = serializers.CharField(source='uploaded_by.full_name', read_only=True)
+    download_url = serializers.SerializerMethodField()
     
     class Meta:
         model = MeetingAttachment
         fields = '__all__'
-        read_only_fields = ('meeting', 'uploaded_by', 'filename', 'file_size', 'content_type', 'created_at')
+        read_only_fields = ('meeting', 'uploaded_by', 'blob', 'filename', 'file_size', 'content_type', 'created_at')
+        # Uploads only; reads go through download_url and its access check
+        extra_kwargs = {'file': {'write_only': True}}
+
+    def get_download_url(self, obj):
+        url = reverse('meeting-attachment-download', args=[obj.meeting_id, obj.pk])
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request else url
+
+
+class AttachmentUploadSerializer(serializers.ModelSerializer):
+    """Serializer for starting and resuming a chunked attachment upload"""
+    
+    class Meta:
+        model = AttachmentUpload
+        fields = ['id', 'filename', 'content_type', 'total_size', 'received_size', 'created_at']
+        read_only_fields = ('id', 'received_size', 'created_at')
+
+    def validate_total_size(self, value):
+        if value > max_attachment_bytes():
+            raise serializers.ValidationError(f"Attachments are limited to {max_attachment_bytes()} bytes")
+        return value
+
+
+class AttachmentChunkSerializer(serializers.Serializer):
+    """Serializer for one chunk of a resumable attachment upload"""
+    offset = serializers.IntegerField(min_value=0)
+    chunk = serializers.FileField()
+
+    def validate_chunk(self, value):
+        if value.size > max_chunk_bytes():
+            raise serializers.ValidationError(f"Chunks are limited to {max_chunk_bytes()} bytes")
+        return value
 
 
 class MeetingRescheduleRequestSerializer(serializers.ModelSerializer):
@@ -131,15 +170,20 @@ class MeetingListSerializer(serializers.ModelSerializer):
 
 class PublicMeetingBookingSerializer(serializers.ModelSerializer):
     """Serializer for public booking (no authentication required)"""
+    ROUND_ROBIN_ATTEMPTS = 3
+
+    hold_token = serializers.CharField(write_only=True, required=False)
+
     class Meta:
         model = Meeting
         fields = [
             'event_type', 'title', 'description', 'start_time', 'timezone',
             'invitee_name', 'invitee_email', 'invitee_phone', 'invitee_timezone',
-            'custom_responses'
+            'custom_responses', 'hold_token'
         ]
 
     def create(self, validated_data):
+        hold_token = validated_data.pop('hold_token', None)
         event_type = validated_data['event_type']
         validated_data['organizer'] = event_type.user
         validated_data['location_type'] = event_type.location_type
@@ -150,7 +194,55 @@ class PublicMeetingBookingSerializer(serializers.ModelSerializer):
         start_time = validated_data['start_time']
         validated_data['end_time'] = start_time + timedelta(minutes=event_type.duration)
         
-        return super().create(validated_data)
+        from .reservations import reserve_meeting, DayFullyBooked, SlotUnavailable
+        create_meeting = super().create
+        end_time = validated_data['end_time']
+        
+        # A live hold for this exact slot pins the host it was placed for
+        from availability.holds import get_hold
+        hold = get_hold(hold_token)
+        if hold and (
+            hold['event_type_id'] != event_type.id
+            or datetime.fromisoformat(hold['start_time']) != start_time
+        ):
+            hold = None
+        
+        if hold or not event_type.is_round_robin:
+            organizer = event_type.user
+            if hold and hold['organizer_id'] != organizer.id:
+                organizer = get_user_model().objects.get(id=hold['organizer_id'])
+            validated_data['organizer'] = organizer
+            try:
+                return reserve_meeting(
+                    organizer, start_time, end_time,
+                    lambda: create_meeting(validated_data),
+                    hold_token=hold_token if hold else None,
+                    event_type=event_type
+                )
+            except DayFullyBooked:
+                raise serializers.ValidationError("This day is fully booked")
+            except SlotUnavailable:
+                raise serializers.ValidationError("The selected time is no longer available")
+        
+        # Round-robin event types go to the least-loaded available host; a
+        # host taken concurrently is skipped on the next attempt
+        from events.round_robin import select_host
+        for attempt in range(self.ROUND_ROBIN_ATTEMPTS):
+            host = select_host(event_type, start_time, end_time)
+            if host is None:
+                break
+            validated_data['organizer'] = host
+            try:
+                return reserve_meeting(
+                    host, start_time, end_time,
+                    lambda: create_meeting(validated_data),
+                    event_type=event_type
+                )
+            except DayFullyBooked:
+                raise serializers.ValidationError("This day is fully booked")
+            except SlotUnavailable:
+                continue
+        raise serializers.ValidationError("No host is available at the selected time")
 
     def validate(self, attrs):
         start_time = attrs.get('start_time')
@@ -158,4 +250,34 @@ class PublicMeetingBookingSerializer(serializers.ModelSerializer):
         if start_time and start_time < timezone.now():
             raise serializers.ValidationError("Meeting cannot be scheduled in the past")
         
-        return attrs
\ No newline at end of file
+        return attrs
+
+
+class MeetingBulkActionSerializer(serializers.Serializer):
+    """Serializer for cancelling, confirming or shifting many meetings at once"""
+    action = serializers.ChoiceField(choices=BULK_ACTIONS)
+    meeting_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False,
+        max_length=MAX_BULK_MEETINGS
+    )
+    reason = serializers.CharField(required=False, allow_blank=True, default='')
+    shift_minutes = serializers.IntegerField(required=False, default=0)
+
+    def validate(self, attrs):
+        if attrs['action'] == 'shift' and not attrs['shift_minutes']:
+            raise serializers.ValidationError("shift_minutes is required to shift meetings")
+        return attrs
+
+
+class SlotHoldSerializer(serializers.Serializer):
+    """Serializer for holding a public booking slot"""
+    event_type = serializers.PrimaryKeyRelatedField(
+        queryset=EventType.objects.filter(is_active=True).select_related('user')
+    )
+    start_time = serializers.DateTimeField()
+
+    def validate_start_time(self, value):
+        if value < timezone.now():
+            raise serializers.ValidationError("Cannot hold a time in the past")
+        return value
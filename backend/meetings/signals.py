@@ -0,0 +1,41 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .attachments import release_blob
+from .counters import apply_meeting_change, meeting_state
+from .models import Meeting, MeetingAttachment
+from .stats import invalidate_meeting_stats
+
+
+@receiver(post_save, sender=Meeting)
+@receiver(post_delete, sender=Meeting)
+def invalidate_stats(sender, instance, **kwargs):
+    """Drop cached statistics of the organizers a meeting write affects"""
+    previous = getattr(instance, '_loaded_values', None) or {}
+    user_ids = {instance.organizer_id, previous.get('organizer_id', instance.organizer_id)}
+    transaction.on_commit(lambda: invalidate_meeting_stats(user_ids))
+
+
+@receiver(post_save, sender=Meeting)
+def update_meeting_counters(sender, instance, created, **kwargs):
+    """Apply a meeting write to the denormalized counters in the same transaction"""
+    current = meeting_state(instance)
+    previous = None
+    if not created:
+        loaded = getattr(instance, '_loaded_values', None) or {}
+        previous = {field: loaded.get(field, value) for field, value in current.items()}
+    if previous != current:
+        apply_meeting_change(previous, current)
+
+
+@receiver(post_delete, sender=Meeting)
+def release_meeting_counters(sender, instance, **kwargs):
+    """Remove a deleted meeting from the denormalized counters"""
+    apply_meeting_change(meeting_state(instance), None)
+
+
+@receiver(post_delete, sender=MeetingAttachment)
+def release_attachment_blob(sender, instance, **kwargs):
+    """Drop the deleted attachment's reference to its shared content"""
+    if instance.blob_id:
+        release_blob(instance.blob_id)
@@ -0,0 +1,53 @@
+"""
+Per-user meeting statistics.
+
+Counters are read from the organizer's MeetingCounters row and cached
+briefly. Meeting signals drop the cached entry of the organizer whenever one
+of their meetings changes.
+"""
+from django.core.cache import cache
+from django.utils import timezone
+
+from .counters import get_counters
+from .models import MeetingCounters
+
+STATS_CACHE_TIMEOUT = 60
+
+
+def _stats_key(user_id):
+    return f'meeting_stats:{user_id}'
+
+
+def compute_meeting_stats(user, now=None):
+    """Meeting counters for an organizer from their denormalized counter row"""
+    now = now or timezone.now()
+    today = timezone.localdate(now)
+    counters = get_counters(MeetingCounters, 'organizer_id', user.id, today)
+
+    return {
+        'total_meetings': counters.total,
+        'confirmed_meetings': counters.confirmed,
+        'pending_meetings': counters.pending,
+        'cancelled_meetings': counters.cancelled,
+        'completed_meetings': counters.completed,
+        'todays_meetings': counters.todays,
+        'upcoming_meetings': counters.upcoming,
+        'this_month_meetings': counters.this_month,
+    }
+
+
+def get_meeting_stats(user):
+    """Cached meeting counters, recomputed at most every STATS_CACHE_TIMEOUT seconds"""
+    now = timezone.now()
+    cached = cache.get(_stats_key(user.id))
+    # Day-based counters must not be served across midnight
+    if cached and cached['date'] == now.date().isoformat():
+        return cached['stats']
+
+    stats = compute_meeting_stats(user, now)
+    cache.set(_stats_key(user.id), {'date': now.date().isoformat(), 'stats': stats}, STATS_CACHE_TIMEOUT)
+    return stats
+
+
+def invalidate_meeting_stats(user_ids):
+    cache.delete_many([_stats_key(user_id) for user_id in user_ids])
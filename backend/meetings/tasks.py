@@ -0,0 +1,72 @@
+from celery import shared_task
+from django.utils import timezone
+from datetime import timedelta
+
+
+@shared_task
+def cleanup_slot_locks():
+    """Delete booking lock rows for buckets that are already in the past"""
+    from .models import SlotLock
+
+    cutoff = timezone.now() - timedelta(days=1)
+    deleted_count = SlotLock.objects.filter(bucket_start__lt=cutoff).delete()[0]
+    return f"Cleaned up {deleted_count} slot locks"
+
+
+@shared_task
+def reconcile_meeting_counters():
+    """Recount denormalized meeting counters and fix drift"""
+    from .counters import reconcile_counters
+
+    fixed = reconcile_counters()
+    return f"Reconciled {fixed} meeting counter rows"
+
+
+@shared_task
+def send_bulk_meeting_notifications(action, meeting_ids):
+    """Email invitees about a bulk cancel, confirm or shift over one mail connection"""
+    from django.conf import settings
+    from django.core.mail import EmailMessage, get_connection
+    from .models import Meeting
+
+    subjects = {
+        'cancel': 'Meeting Cancelled',
+        'confirm': 'Meeting Confirmed',
+        'shift': 'Meeting Rescheduled',
+    }
+    messages = []
+    for meeting in Meeting.objects.filter(id__in=meeting_ids).select_related('organizer'):
+        lines = [
+            f"Meeting: {meeting.title}",
+            f"Date & Time: {meeting.start_time}",
+            f"Organizer: {meeting.organizer.full_name}",
+        ]
+        if action == 'cancel' and meeting.cancellation_reason:
+            lines.append(f"Reason: {meeting.cancellation_reason}")
+        messages.append(EmailMessage(
+            subject=f"{subjects[action]}: {meeting.title}",
+            body='\n'.join(lines),
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to=[meeting.invitee_email],
+        ))
+
+    sent = get_connection(fail_silently=True).send_messages(messages)
+    return f"Sent {sent or 0} {action} notifications"
+
+
+@shared_task
+def complete_ended_meetings():
+    """Move confirmed meetings that have ended to completed"""
+    from .completion import complete_ended_meetings as complete
+
+    completed = complete()
+    return f"Completed {completed} meetings"
+
+
+@shared_task
+def cleanup_attachment_storage():
+    """Delete unreferenced attachment content and abandoned chunked uploads"""
+    from .attachments import cleanup_attachment_storage as cleanup
+
+    blobs, uploads = cleanup()
+    return f"Removed {blobs} unused attachment blobs and {uploads} stale uploads"
@@ -0,0 +1,246 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from events.models import EventType
+from utils.pagination import StartTimeCursorPagination
+from utils.tasks import process_workflow_executions
+from workflows.models import Workflow
+from .completion import complete_ended_meetings
+from .counters import get_counters
+from .models import (
+    AttachmentBlob, Meeting, MeetingAttachment, MeetingCounters, MeetingNote,
+    MeetingRescheduleRequest
+)
+
+User = get_user_model()
+
+# Session and user lookups made by SessionAuthentication on every request
+AUTH_QUERIES = 2
+
+
+class MeetingQueryCountTests(APITestCase):
+    """Meeting list and detail endpoints issue a fixed number of queries"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username='organizer',
+            email='organizer@example.com',
+            password='password',
+            first_name='Olive',
+            last_name='Organizer'
+        )
+        cls.event_type = EventType.objects.create(user=cls.user, name='Intro call')
+        start = timezone.now() + timedelta(days=1)
+        cls.meetings = [
+            Meeting.objects.create(
+                event_type=cls.event_type,
+                organizer=cls.user,
+                title=f'Meeting {index}',
+                start_time=start + timedelta(hours=index),
+                end_time=start + timedelta(hours=index, minutes=30),
+                invitee_name=f'Invitee {index}',
+                invitee_email=f'invitee{index}@example.com'
+            )
+            for index in range(25)
+        ]
+
+        meeting = cls.meetings[0]
+        blob = AttachmentBlob.objects.create(
+            sha256='a' * 64,
+            file='meeting_attachments/blobs/aa/' + 'a' * 64,
+            size=1024,
+            ref_count=3
+        )
+        for index in range(3):
+            MeetingNote.objects.create(meeting=meeting, author=cls.user, content=f'Note {index}')
+            MeetingAttachment.objects.create(
+                meeting=meeting,
+                uploaded_by=cls.user,
+                blob=blob,
+                filename=f'deck-{index}.pdf',
+                content_type='application/pdf'
+            )
+            MeetingRescheduleRequest.objects.create(
+                meeting=meeting,
+                requested_by=cls.user,
+                new_start_time=meeting.start_time + timedelta(days=1),
+                new_end_time=meeting.end_time + timedelta(days=1)
+            )
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_list_query_count_does_not_depend_on_page_size(self):
+        for page_size in (5, 20):
+            with self.subTest(page_size=page_size):
+                with mock.patch.object(StartTimeCursorPagination, 'page_size', page_size):
+                    # The meeting page, with event type and organizer joined
+                    with self.assertNumQueries(AUTH_QUERIES + 1):
+                        response = self.client.get(reverse('meeting-list-create'))
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(len(response.data['results']), page_size)
+
+    def test_detail_query_count_does_not_depend_on_related_rows(self):
+        meeting = self.meetings[0]
+        # The meeting, then one prefetch each for notes, attachments and reschedule requests
+        with self.assertNumQueries(AUTH_QUERIES + 4):
+            response = self.client.get(reverse('meeting-detail', args=[meeting.pk]))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['notes']), 3)
+        self.assertEqual(len(response.data['attachments']), 3)
+        self.assertEqual(len(response.data['reschedule_requests']), 3)
+
+    def test_attachments_expose_only_the_download_url(self):
+        meeting = self.meetings[0]
+        response = self.client.get(reverse('meeting-attachments', args=[meeting.pk]))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['results']), 3)
+        for attachment in response.data['results']:
+            self.assertNotIn('file', attachment)
+            self.assertIn('download_url', attachment)
+
+
+class CalendarFeedTests(APITestCase):
+    """The iCalendar feed serves clients that only accept text/calendar"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username='subscriber',
+            email='subscriber@example.com',
+            password='password',
+            first_name='Sam',
+            last_name='Subscriber',
+            calendar_feed_token='feed-token'
+        )
+        event_type = EventType.objects.create(user=cls.user, name='Intro call')
+        start = timezone.now() + timedelta(days=1)
+        Meeting.objects.create(
+            event_type=event_type,
+            organizer=cls.user,
+            title='Intro call with Ivy',
+            start_time=start,
+            end_time=start + timedelta(minutes=30),
+            invitee_name='Ivy Invitee',
+            invitee_email='ivy@example.com'
+        )
+
+    def test_feed_is_served_to_text_calendar_clients(self):
+        url = reverse('meeting-calendar-feed', args=['feed-token'])
+        response = self.client.get(url, HTTP_ACCEPT='text/calendar')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/calendar'))
+        body = b''.join(response.streaming_content).decode()
+        self.assertIn('BEGIN:VCALENDAR', body)
+        self.assertIn('Intro call with Ivy', body)
+
+        response = self.client.get(url, HTTP_ACCEPT='text/calendar', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_unknown_token_is_not_found(self):
+        response = self.client.get(
+            reverse('meeting-calendar-feed', args=['missing']),
+            HTTP_ACCEPT='text/calendar'
+        )
+        self.assertEqual(response.status_code, 404)
+
+
+class MeetingCountersTests(TestCase):
+    """Meeting writes keep the organizer's counter row in step"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='counted',
+            email='counted@example.com',
+            password='password',
+            first_name='Cora',
+            last_name='Counted'
+        )
+        self.event_type = EventType.objects.create(user=self.user, name='Intro call')
+
+    def create_meeting(self):
+        start = timezone.now() + timedelta(days=1)
+        return Meeting.objects.create(
+            event_type=self.event_type,
+            organizer=self.user,
+            title='Intro call',
+            start_time=start,
+            end_time=start + timedelta(minutes=30),
+            invitee_name='Ivy Invitee',
+            invitee_email='ivy@example.com'
+        )
+
+    def test_status_change_moves_counts(self):
+        meeting = self.create_meeting()
+        counters = get_counters(MeetingCounters, 'organizer_id', self.user.id)
+        self.assertEqual((counters.total, counters.pending, counters.upcoming), (1, 1, 1))
+
+        meeting.status = 'confirmed'
+        meeting.save()
+        counters = MeetingCounters.objects.get(pk=self.user.id)
+        self.assertEqual((counters.total, counters.pending, counters.confirmed), (1, 0, 1))
+        self.assertEqual(counters.upcoming, 1)
+
+        meeting.status = 'cancelled'
+        meeting.save()
+        counters = MeetingCounters.objects.get(pk=self.user.id)
+        self.assertEqual((counters.confirmed, counters.cancelled, counters.upcoming), (0, 1, 0))
+
+    def test_first_meeting_creates_a_row_counted_on_read(self):
+        self.create_meeting()
+        self.create_meeting()
+        self.assertIsNone(MeetingCounters.objects.get(pk=self.user.id).counts_date)
+        counters = get_counters(MeetingCounters, 'organizer_id', self.user.id)
+        self.assertEqual((counters.total, counters.pending), (2, 2))
+        self.assertEqual(MeetingCounters.objects.get(pk=self.user.id).total, 2)
+
+
+class MeetingCompletionTests(TestCase):
+    """The completion sweep completes ended meetings and runs their workflows"""
+
+    def test_completed_meetings_run_meeting_completed_workflows(self):
+        user = User.objects.create_user(
+            username='swept',
+            email='swept@example.com',
+            password='password',
+            first_name='Sid',
+            last_name='Swept'
+        )
+        event_type = EventType.objects.create(user=user, name='Intro call')
+        workflow = Workflow.objects.create(
+            user=user,
+            name='Follow up',
+            trigger_type='meeting_completed',
+            status='active',
+            actions=[{'type': 'send_email'}]
+        )
+        start = timezone.now() - timedelta(hours=2)
+        meeting = Meeting.objects.create(
+            event_type=event_type,
+            organizer=user,
+            title='Intro call',
+            start_time=start,
+            end_time=start + timedelta(minutes=30),
+            status='confirmed',
+            invitee_name='Ivy Invitee',
+            invitee_email='ivy@example.com'
+        )
+
+        with mock.patch.object(process_workflow_executions, 'delay', side_effect=process_workflow_executions):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.assertEqual(complete_ended_meetings(), 1)
+
+        meeting.refresh_from_db()
+        self.assertEqual(meeting.status, 'completed')
+        execution = workflow.executions.get()
+        self.assertEqual(execution.status, 'completed')
+        self.assertEqual(execution.trigger_data['meeting_id'], meeting.pk)
+        workflow.refresh_from_db()
+        self.assertEqual(workflow.execution_count, 1)
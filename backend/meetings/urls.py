@@ -7,6 +7,7 @@ urlpatterns = [
     path('<int:pk>/', views.MeetingDetailView.as_view(), name='meeting-detail'),
     path('<int:pk>/cancel/', views.cancel_meeting, name='meeting-cancel'),
     path('<int:pk>/confirm/', views.confirm_meeting, name='meeting-confirm'),
+    path('bulk/', views.bulk_meeting_action, name='meeting-bulk-action'),
     
     # Meeting views
     path('upcoming/', views.UpcomingMeetingsView.as_view(), name='upcoming-meetings'),
@@ -18,8 +19,19 @@ urlpatterns = [
     
     # Meeting attachments
     path('<int:meeting_id>/attachments/', views.MeetingAttachmentListCreateView.as_view(), name='meeting-attachments'),
+    path('<int:meeting_id>/attachments/<int:pk>/download/', views.download_attachment, name='meeting-attachment-download'),
+    path('<int:meeting_id>/attachments/uploads/', views.start_attachment_upload, name='meeting-attachment-upload-start'),
+    path('<int:meeting_id>/attachments/uploads/<uuid:upload_id>/', views.attachment_upload_detail, name='meeting-attachment-upload'),
+    path('<int:meeting_id>/attachments/uploads/<uuid:upload_id>/complete/', views.complete_attachment_upload, name='meeting-attachment-upload-complete'),
+    
+    # Calendar subscription feed
+    path('feed/token/', views.rotate_calendar_feed_token, name='meeting-calendar-feed-token'),
+    path('feed/<str:token>.ics', views.calendar_feed, name='meeting-calendar-feed'),
     
     # Public booking
     path('book/', views.PublicBookingView.as_view(), name='public-booking'),
+    path('holds/', views.create_slot_hold, name='slot-hold-create'),
+    path('holds/<str:token>/', views.release_slot_hold, name='slot-hold-release'),
     path('availability/<int:event_type_id>/', views.public_event_availability, name='public-availability'),
+    path('availability/<int:event_type_id>/stream/', views.public_event_availability_stream, name='public-availability-stream'),
 ]
\ No newline at end of file
@@ -1,29 +1,55 @@
 from rest_framework import generics, permissions, status
 from rest_framework.decorators import api_view, permission_classes
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.filters import SearchFilter, OrderingFilter
+from rest_framework.filters import SearchFilter
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+from django.urls import reverse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from django.contrib.auth import get_user_model
 from django.utils import timezone
 from django.db.models import Q, Count
-from .models import Meeting, MeetingNote, MeetingAttachment, MeetingRescheduleRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from datetime import datetime, timedelta
+import json
+from .models import Meeting, MeetingNote, MeetingAttachment, MeetingRescheduleRequest, AttachmentUpload
+from .stats import get_meeting_stats
+from .calendar_feed import feed_validators, iter_feed
+from .downloads import attachment_response
 from .serializers import (
     MeetingSerializer, MeetingCreateSerializer, MeetingUpdateSerializer,
     MeetingListSerializer, MeetingNoteSerializer, MeetingAttachmentSerializer,
-    MeetingRescheduleRequestSerializer, PublicMeetingBookingSerializer
+    MeetingRescheduleRequestSerializer, PublicMeetingBookingSerializer,
+    SlotHoldSerializer, MeetingBulkActionSerializer, AttachmentUploadSerializer,
+    AttachmentChunkSerializer
 )
+from .attachments import (
+    UploadOffsetMismatch, append_chunk, complete_upload, max_attachment_bytes,
+    start_upload, store_attachment
+)
+from .bulk import BulkShiftConflict, bulk_update_meetings
 from events.models import EventType
+from availability.slots import get_booking_window
+from availability.holds import place_hold, release_hold
+from availability.slot_cache import get_cached_slots, iter_daily_slots
+from utils.helpers import generate_api_key
+from utils.pagination import StartTimeCursorPagination
+from utils.timezones import get_zone, is_valid_timezone, localize_slots
 
 
 class MeetingListCreateView(generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    pagination_class = StartTimeCursorPagination
+    # No OrderingFilter: the cursor only works on the indexed start_time ordering
+    filter_backends = [DjangoFilterBackend, SearchFilter]
     filterset_fields = ['status', 'event_type', 'is_today']
     search_fields = ['title', 'invitee_name', 'invitee_email']
-    ordering_fields = ['start_time', 'created_at', 'status']
-    ordering = ['-start_time']
 
     def get_queryset(self):
-        return Meeting.objects.filter(organizer=self.request.user)
+        return Meeting.objects.filter(organizer=self.request.user).for_list()
 
     def get_serializer_class(self):
         if self.request.method == 'POST':
@@ -35,7 +61,10 @@ class MeetingDetailView(generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        return Meeting.objects.filter(organizer=self.request.user)
+        queryset = Meeting.objects.filter(organizer=self.request.user)
+        if self.request.method in ['PUT', 'PATCH', 'DELETE']:
+            return queryset
+        return queryset.for_detail()
 
     def get_serializer_class(self):
         if self.request.method in ['PUT', 'PATCH']:
@@ -52,7 +81,7 @@ class UpcomingMeetingsView(generics.ListAPIView):
             organizer=self.request.user,
             start_time__gte=timezone.now(),
             status__in=['pending', 'confirmed']
-        ).order_by('start_time')[:10]
+        ).for_list().order_by('start_time')[:10]
 
 
 class TodaysMeetingsView(generics.ListAPIView):
@@ -65,7 +94,7 @@ class TodaysMeetingsView(generics.ListAPIView):
             organizer=self.request.user,
             start_time__date=today,
             status__in=['pending', 'confirmed']
-        ).order_by('start_time')
+        ).for_list().order_by('start_time')
 
 
 class MeetingNoteListCreateView(generics.ListCreateAPIView):
@@ -77,7 +106,7 @@ class MeetingNoteListCreateView(generics.ListCreateAPIView):
         return MeetingNote.objects.filter(
             meeting_id=meeting_id,
             meeting__organizer=self.request.user
-        )
+        ).select_related('author')
 
     def perform_create(self, serializer):
         meeting_id = self.kwargs.get('meeting_id')
@@ -94,12 +123,17 @@ class MeetingAttachmentListCreateView(generics.ListCreateAPIView):
         return MeetingAttachment.objects.filter(
             meeting_id=meeting_id,
             meeting__organizer=self.request.user
-        )
+        ).select_related('uploaded_by')
 
     def perform_create(self, serializer):
         meeting_id = self.kwargs.get('meeting_id')
         meeting = Meeting.objects.get(id=meeting_id, organizer=self.request.user)
-        serializer.save(meeting=meeting, uploaded_by=self.request.user)
+        upload = serializer.validated_data['file']
+        if upload.size > max_attachment_bytes():
+            raise ValidationError({'file': f'Attachments are limited to {max_attachment_bytes()} bytes'})
+        serializer.instance = store_attachment(
+            meeting, self.request.user, upload, upload.name, upload.content_type
+        )
 
 
 class PublicBookingView(generics.CreateAPIView):
@@ -127,7 +161,7 @@ class PublicBookingView(generics.CreateAPIView):
 def cancel_meeting(request, pk):
     """Cancel a meeting"""
     try:
-        meeting = Meeting.objects.get(pk=pk, organizer=request.user)
+        meeting = Meeting.objects.for_detail().get(pk=pk, organizer=request.user)
         
         if meeting.status == 'cancelled':
             return Response(
@@ -159,7 +193,7 @@ def cancel_meeting(request, pk):
 def confirm_meeting(request, pk):
     """Confirm a pending meeting"""
     try:
-        meeting = Meeting.objects.get(pk=pk, organizer=request.user)
+        meeting = Meeting.objects.for_detail().get(pk=pk, organizer=request.user)
         
         if meeting.status != 'pending':
             return Response(
@@ -187,72 +221,383 @@ def confirm_meeting(request, pk):
 
 @api_view(['GET'])
 @permission_classes([permissions.IsAuthenticated])
-def meeting_stats(request):
-    """Get meeting statistics for the user"""
-    user = request.user
-    meetings = Meeting.objects.filter(organizer=user)
-    
-    # Basic counts
-    total_meetings = meetings.count()
-    confirmed_meetings = meetings.filter(status='confirmed').count()
-    pending_meetings = meetings.filter(status='pending').count()
-    cancelled_meetings = meetings.filter(status='cancelled').count()
-    completed_meetings = meetings.filter(status='completed').count()
-    
-    # Today's meetings
-    today = timezone.now().date()
-    todays_meetings = meetings.filter(
-        start_time__date=today,
-        status__in=['confirmed', 'pending']
-    ).count()
-    
-    # Upcoming meetings
-    upcoming_meetings = meetings.filter(
-        start_time__gte=timezone.now(),
-        status__in=['confirmed', 'pending']
-    ).count()
-    
-    # This month's meetings
-    current_month = timezone.now().replace(day=1)
-    this_month_meetings = meetings.filter(
-        start_time__gte=current_month,
-        status='confirmed'
-    ).count()
-    
+def download_attachment(request, meeting_id, pk):
+    """Send an attachment of one of the organizer's meetings"""
+    try:
+        attachment = MeetingAttachment.objects.get(
+            pk=pk,
+            meeting_id=meeting_id,
+            meeting__organizer=request.user
+        )
+    except MeetingAttachment.DoesNotExist:
+        return Response(
+            {'error': 'Attachment not found'}, 
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    return attachment_response(request, attachment)
+
+
+@api_view(['POST'])
+@permission_classes([permissions.IsAuthenticated])
+def start_attachment_upload(request, meeting_id):
+    """Start a resumable chunked upload of a meeting attachment"""
+    try:
+        meeting = Meeting.objects.get(id=meeting_id, organizer=request.user)
+    except Meeting.DoesNotExist:
+        return Response(
+            {'error': 'Meeting not found'}, 
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    serializer = AttachmentUploadSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    upload = start_upload(
+        meeting,
+        request.user,
+        serializer.validated_data['filename'],
+        serializer.validated_data['total_size'],
+        serializer.validated_data.get('content_type', '')
+    )
+    return Response(AttachmentUploadSerializer(upload).data, status=status.HTTP_201_CREATED)
+
+
+def _get_upload(request, meeting_id, upload_id):
+    return AttachmentUpload.objects.select_related('meeting', 'uploaded_by').get(
+        id=upload_id,
+        meeting_id=meeting_id,
+        meeting__organizer=request.user
+    )
+
+
+@api_view(['GET', 'PUT'])
+@permission_classes([permissions.IsAuthenticated])
+def attachment_upload_detail(request, meeting_id, upload_id):
+    """Get the resume offset of an upload, or append a chunk at an offset"""
+    try:
+        upload = _get_upload(request, meeting_id, upload_id)
+    except AttachmentUpload.DoesNotExist:
+        return Response(
+            {'error': 'Upload not found'}, 
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    if request.method == 'GET':
+        return Response(AttachmentUploadSerializer(upload).data)
+
+    serializer = AttachmentChunkSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        upload.received_size = append_chunk(
+            upload,
+            serializer.validated_data['offset'],
+            serializer.validated_data['chunk']
+        )
+    except UploadOffsetMismatch as e:
+        return Response(
+            {'error': 'Chunk does not start at the received size', 'received_size': e.args[0]}, 
+            status=status.HTTP_409_CONFLICT
+        )
+    except ValueError as e:
+        return Response(
+            {'error': str(e)}, 
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    return Response(AttachmentUploadSerializer(upload).data)
+
+
+@api_view(['POST'])
+@permission_classes([permissions.IsAuthenticated])
+def complete_attachment_upload(request, meeting_id, upload_id):
+    """Finish a chunked upload and attach the file to the meeting"""
+    try:
+        upload = _get_upload(request, meeting_id, upload_id)
+    except AttachmentUpload.DoesNotExist:
+        return Response(
+            {'error': 'Upload not found'}, 
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    try:
+        attachment = complete_upload(upload)
+    except ValueError as e:
+        return Response(
+            {'error': str(e), 'received_size': upload.received_size}, 
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    return Response(MeetingAttachmentSerializer(attachment).data, status=status.HTTP_201_CREATED)
+
+
+@api_view(['POST'])
+@permission_classes([permissions.IsAuthenticated])
+def bulk_meeting_action(request):
+    """Cancel, confirm or shift many meetings with one update per operation"""
+    serializer = MeetingBulkActionSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    data = serializer.validated_data
+    try:
+        updated, skipped = bulk_update_meetings(
+            request.user,
+            data['action'],
+            data['meeting_ids'],
+            reason=data['reason'],
+            shift_minutes=data['shift_minutes']
+        )
+    except BulkShiftConflict as e:
+        return Response(
+            {'error': str(e), 'conflicts': e.conflicts}, 
+            status=status.HTTP_409_CONFLICT
+        )
+
     return Response({
-        'total_meetings': total_meetings,
-        'confirmed_meetings': confirmed_meetings,
-        'pending_meetings': pending_meetings,
-        'cancelled_meetings': cancelled_meetings,
-        'completed_meetings': completed_meetings,
-        'todays_meetings': todays_meetings,
-        'upcoming_meetings': upcoming_meetings,
-        'this_month_meetings': this_month_meetings,
+        'message': f'{len(updated)} meetings updated',
+        'updated': updated,
+        'skipped': skipped
     })
 
 
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated])
+def meeting_stats(request):
+    """Get meeting statistics for the user"""
+    return Response(get_meeting_stats(request.user))
+
+
 @api_view(['GET'])
 @permission_classes([permissions.AllowAny])
 def public_event_availability(request, event_type_id):
     """Get available time slots for public booking"""
     try:
-        event_type = EventType.objects.get(id=event_type_id, is_active=True)
-        
-        # TODO: Implement availability calculation logic
-        # This would check the organizer's availability, existing meetings, etc.
-        
-        return Response({
-            'event_type': {
-                'id': event_type.id,
-                'name': event_type.name,
-                'duration': event_type.duration,
-                'description': event_type.description,
-            },
-            'available_slots': [],  # TODO: Calculate available slots
-        })
-        
+        event_type = EventType.objects.select_related('user').get(id=event_type_id, is_active=True)
     except EventType.DoesNotExist:
         return Response(
             {'error': 'Event type not found'}, 
             status=status.HTTP_404_NOT_FOUND
-        )
\ No newline at end of file
+        )
+
+    # Dates are interpreted in the organizer's timezone
+    tz = get_zone(event_type.user.timezone)
+    now = timezone.now()
+    today = now.astimezone(tz).date()
+    last_bookable_day = get_booking_window(event_type, now)[1].astimezone(tz).date()
+
+    try:
+        start_date_str = request.GET.get('start_date')
+        end_date_str = request.GET.get('end_date')
+        start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date() if start_date_str else today
+        end_date = (
+            datetime.strptime(end_date_str, '%Y-%m-%d').date() if end_date_str
+            else start_date + timedelta(days=6)
+        )
+    except ValueError as e:
+        return Response(
+            {'error': f'Invalid date format: {str(e)}'}, 
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    # Slots can be rendered in the invitee's timezone
+    invitee_timezone = request.GET.get('timezone')
+    if invitee_timezone and not is_valid_timezone(invitee_timezone):
+        return Response(
+            {'error': f'Unknown timezone: {invitee_timezone}'}, 
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    start_date = max(start_date, today)
+    end_date = min(end_date, last_bookable_day)
+
+    available_slots = []
+    if start_date <= end_date:
+        available_slots = get_cached_slots(event_type, start_date, end_date, now)
+        if invitee_timezone:
+            available_slots = localize_slots(available_slots, invitee_timezone)
+
+    return Response({
+        'event_type': {
+            'id': event_type.id,
+            'name': event_type.name,
+            'duration': event_type.duration,
+            'description': event_type.description,
+        },
+        'timezone': str(tz),
+        'invitee_timezone': invitee_timezone or 'UTC',
+        'start_date': start_date,
+        'end_date': end_date,
+        'available_slots': available_slots,
+    })
+
+
+@require_GET
+def public_event_availability_stream(request, event_type_id):
+    """
+    Stream available time slots day by day as newline-delimited JSON.
+
+    A plain Django view: DRF content negotiation would reject clients that
+    ask for application/x-ndjson, the type this view actually returns.
+    """
+    try:
+        event_type = EventType.objects.select_related('user').get(id=event_type_id, is_active=True)
+    except EventType.DoesNotExist:
+        return JsonResponse(
+            {'error': 'Event type not found'}, 
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    # Defaults to the whole booking horizon
+    tz = get_zone(event_type.user.timezone)
+    now = timezone.now()
+    today = now.astimezone(tz).date()
+    last_bookable_day = get_booking_window(event_type, now)[1].astimezone(tz).date()
+
+    try:
+        start_date_str = request.GET.get('start_date')
+        end_date_str = request.GET.get('end_date')
+        start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date() if start_date_str else today
+        end_date = (
+            datetime.strptime(end_date_str, '%Y-%m-%d').date() if end_date_str
+            else last_bookable_day
+        )
+    except ValueError as e:
+        return JsonResponse(
+            {'error': f'Invalid date format: {str(e)}'}, 
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    invitee_timezone = request.GET.get('timezone')
+    if invitee_timezone and not is_valid_timezone(invitee_timezone):
+        return JsonResponse(
+            {'error': f'Unknown timezone: {invitee_timezone}'}, 
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    start_date = max(start_date, today)
+    end_date = min(end_date, last_bookable_day)
+
+    def rows():
+        for day, slots in iter_daily_slots(event_type, start_date, end_date, now):
+            if invitee_timezone:
+                slots = localize_slots(slots, invitee_timezone)
+            yield json.dumps({'date': day, 'available_slots': slots}, cls=DjangoJSONEncoder) + '\n'
+
+    response = StreamingHttpResponse(rows(), content_type='application/x-ndjson')
+    response['Cache-Control'] = 'no-cache'
+    # Lets nginx pass rows through as they are produced
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+@api_view(['POST'])
+@permission_classes([permissions.AllowAny])
+def create_slot_hold(request):
+    """Hold a slot for a few minutes while the invitee fills in the booking form"""
+    serializer = SlotHoldSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    event_type = serializer.validated_data['event_type']
+    start_time = serializer.validated_data['start_time']
+    end_time = start_time + timedelta(minutes=event_type.duration)
+
+    # Only currently offered slots can be held
+    day = start_time.astimezone(get_zone(event_type.user.timezone)).date()
+    offered = {
+        datetime.fromisoformat(slot['start_time'])
+        for slot in get_cached_slots(event_type, day, day)
+    }
+    if start_time not in offered:
+        return Response(
+            {'error': 'The selected time is not available'}, 
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    organizer_id = event_type.user_id
+    if event_type.is_round_robin:
+        from events.round_robin import select_host
+        host = select_host(event_type, start_time, end_time)
+        if host is None:
+            return Response(
+                {'error': 'No host is available at the selected time'}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        organizer_id = host.id
+
+    hold = place_hold(organizer_id, event_type.id, start_time, end_time)
+    if hold is None:
+        return Response(
+            {'error': 'The selected time is being booked by someone else'}, 
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    return Response({
+        'hold_token': hold['token'],
+        'start_time': hold['start_time'],
+        'end_time': hold['end_time'],
+        'expires_at': hold['expires_at'],
+    }, status=status.HTTP_201_CREATED)
+
+
+@api_view(['DELETE'])
+@permission_classes([permissions.AllowAny])
+def release_slot_hold(request, token):
+    """Release a held slot before it expires"""
+    if not release_hold(token):
+        return Response(
+            {'error': 'Hold not found'}, 
+            status=status.HTTP_404_NOT_FOUND
+        )
+    return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+@api_view(['POST'])
+def rotate_calendar_feed_token(request):
+    """Issue a new calendar feed URL, revoking the previous one"""
+    user = request.user
+    user.calendar_feed_token = generate_api_key()
+    user.save(update_fields=['calendar_feed_token'])
+    return Response({
+        'feed_url': request.build_absolute_uri(
+            reverse('meeting-calendar-feed', args=[user.calendar_feed_token])
+        )
+    })
+
+
+@require_GET
+def calendar_feed(request, token):
+    """
+    Stream the organizer's meetings as an iCalendar subscription feed.
+
+    A plain Django view: DRF content negotiation would reject calendar
+    clients that ask for text/calendar, the type this view actually returns.
+    """
+    User = get_user_model()
+    try:
+        user = User.objects.get(calendar_feed_token=token)
+    except User.DoesNotExist:
+        return JsonResponse(
+            {'error': 'Calendar feed not found'}, 
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    etag, last_modified = feed_validators(user)
+    conditional = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified.timestamp())
+    )
+    if conditional is None:
+        response = StreamingHttpResponse(iter_feed(user), content_type='text/calendar; charset=utf-8')
+        response['Content-Disposition'] = 'inline; filename="meetings.ics"'
+    else:
+        response = conditional
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified.timestamp())
+    response['Cache-Control'] = 'private, no-cache'
+    return response
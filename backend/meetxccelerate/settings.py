@@ -86,6 +86,16 @@ DATABASES = {
     }
 }
 
+# Cache
+# Use a shared backend (e.g. django.core.cache.backends.redis.RedisCache) in
+# production so slot caches and counters are consistent across workers
+CACHES = {
+    'default': {
+        'BACKEND': config('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': config('CACHE_LOCATION', default='meetxccelerate'),
+    }
+}
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -160,6 +170,55 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
+CELERY_BEAT_SCHEDULE = {
+    'refresh-materialized-slots': {
+        'task': 'availability.tasks.refresh_materialized_slots',
+        'schedule': 5 * 60,
+    },
+    'rebuild-event-type-day-counts': {
+        'task': 'events.tasks.rebuild_event_type_day_counts',
+        'schedule': 24 * 60 * 60,
+    },
+    'schedule-meeting-reminders': {
+        'task': 'notifications.tasks.schedule_meeting_reminders',
+        'schedule': 60,
+    },
+    'complete-ended-meetings': {
+        'task': 'meetings.tasks.complete_ended_meetings',
+        'schedule': 10 * 60,
+    },
+    'reconcile-meeting-counters': {
+        'task': 'meetings.tasks.reconcile_meeting_counters',
+        'schedule': 24 * 60 * 60,
+    },
+    'cleanup-attachment-storage': {
+        'task': 'meetings.tasks.cleanup_attachment_storage',
+        'schedule': 24 * 60 * 60,
+    },
+    'cleanup-slot-locks': {
+        'task': 'meetings.tasks.cleanup_slot_locks',
+        'schedule': 24 * 60 * 60,
+    },
+}
+
+# Availability
+# Serve public booking slots from the cached per-organizer bitmap store
+AVAILABILITY_BITMAPS_ENABLED = config('AVAILABILITY_BITMAPS_ENABLED', default=False, cast=bool)
+# Busiest event types whose upcoming slots are precomputed (0 disables)
+SLOT_MATERIALIZATION_EVENT_TYPES = config('SLOT_MATERIALIZATION_EVENT_TYPES', default=50, cast=int)
+SLOT_MATERIALIZATION_DAYS = config('SLOT_MATERIALIZATION_DAYS', default=60, cast=int)
+# How long a picked slot is held while the invitee fills in the booking form
+SLOT_HOLD_SECONDS = config('SLOT_HOLD_SECONDS', default=300, cast=int)
+
+# Meeting attachments
+ATTACHMENT_MAX_BYTES = config('ATTACHMENT_MAX_BYTES', default=100 * 1024 * 1024, cast=int)
+ATTACHMENT_MAX_CHUNK_BYTES = config('ATTACHMENT_MAX_CHUNK_BYTES', default=8 * 1024 * 1024, cast=int)
+# Staging directory for chunked uploads until they are complete
+ATTACHMENT_UPLOAD_DIR = config('ATTACHMENT_UPLOAD_DIR', default=str(MEDIA_ROOT / 'attachment_uploads'))
+# Hand downloads to the front server: '' (stream from Django), 'nginx' or 'apache'
+ATTACHMENT_SENDFILE_BACKEND = config('ATTACHMENT_SENDFILE_BACKEND', default='')
+# Internal nginx location aliasing MEDIA_ROOT, used with X-Accel-Redirect
+ATTACHMENT_ACCEL_REDIRECT_PREFIX = config('ATTACHMENT_ACCEL_REDIRECT_PREFIX', default='/protected-media/')
 
 # Email Configuration
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
@@ -116,6 +116,7 @@ class Notification(models.Model):
             models.Index(fields=['recipient', 'status']),
             models.Index(fields=['recipient', 'category']),
             models.Index(fields=['scheduled_at']),
+            models.Index(fields=['recipient', '-created_at']),
         ]
 
     def __str__(self):
@@ -0,0 +1,82 @@
+"""
+Time-bucketed meeting reminders.
+
+Every REMINDER_BUCKET_SECONDS the scheduler picks up the meetings whose
+reminder window (NotificationPreference.reminder_time_before, or
+DEFAULT_REMINDER_MINUTES without preferences) opens before the end of the
+next bucket. Meetings are read per distinct reminder lead through the
+(reminder_sent, start_time) index, so each query only scans that lead's
+window. Reminders are written with one bulk insert, the meetings are marked
+with one UPDATE, and emails for the whole bucket go out as one task.
+"""
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from availability.slots import BUSY_MEETING_STATUSES
+from .models import Notification, NotificationPreference
+
+REMINDER_BUCKET_SECONDS = 60
+
+DEFAULT_REMINDER_MINUTES = NotificationPreference._meta.get_field('reminder_time_before').default
+
+
+def _due_meetings(now, bucket_end):
+    """Unsent reminders due before bucket_end as (meeting, lead minutes) pairs"""
+    from meetings.models import Meeting
+
+    leads = set(NotificationPreference.objects.values_list('reminder_time_before', flat=True).distinct())
+    leads.add(DEFAULT_REMINDER_MINUTES)
+
+    due = []
+    for lead in sorted(leads):
+        owners = Q(organizer__notification_preferences__reminder_time_before=lead)
+        if lead == DEFAULT_REMINDER_MINUTES:
+            owners |= Q(organizer__notification_preferences__isnull=True)
+        meetings = Meeting.objects.select_for_update(skip_locked=True, of=('self',)).filter(
+            owners,
+            reminder_sent=False,
+            status__in=BUSY_MEETING_STATUSES,
+            start_time__gt=now,
+            start_time__lt=bucket_end + timedelta(minutes=lead)
+        ).select_related('organizer')
+        due.extend((meeting, lead) for meeting in meetings)
+    return due
+
+
+def schedule_reminders(now=None):
+    """Create reminder notifications for the next bucket; returns their number"""
+    from meetings.models import Meeting
+    from .tasks import send_reminder_emails
+
+    now = now or timezone.now()
+    bucket_end = now + timedelta(seconds=REMINDER_BUCKET_SECONDS)
+    with transaction.atomic():
+        due = _due_meetings(now, bucket_end)
+        if not due:
+            return 0
+
+        Notification.objects.bulk_create([
+            Notification(
+                recipient=meeting.organizer,
+                title=f"Reminder: {meeting.title}",
+                message=(
+                    f"You have a meeting with {meeting.invitee_name} in "
+                    f"{max(round((meeting.start_time - now).total_seconds() / 60), 1)} minutes."
+                ),
+                category='reminders',
+                priority='high',
+                meeting=meeting,
+                scheduled_at=meeting.start_time - timedelta(minutes=lead)
+            )
+            for meeting, lead in due
+        ])
+        meeting_ids = [meeting.id for meeting, lead in due]
+        Meeting.objects.filter(id__in=meeting_ids).update(reminder_sent=True)
+
+        email_ids = [meeting.id for meeting, lead in due if meeting.organizer.email_notifications]
+        if email_ids:
+            transaction.on_commit(lambda: send_reminder_emails.delay(email_ids))
+    return len(due)
@@ -0,0 +1,30 @@
+from celery import shared_task
+
+
+@shared_task
+def schedule_meeting_reminders():
+    """Create reminders for meetings whose reminder window opens in the next bucket"""
+    from .reminders import schedule_reminders
+
+    scheduled = schedule_reminders()
+    return f"Scheduled {scheduled} meeting reminders"
+
+
+@shared_task
+def send_reminder_emails(meeting_ids):
+    """Email organizers a batch of meeting reminders over one mail connection"""
+    from django.conf import settings
+    from django.core.mail import EmailMessage, get_connection
+    from meetings.models import Meeting
+
+    messages = [
+        EmailMessage(
+            subject=f"Reminder: {meeting.title}",
+            body=f"You have a meeting with {meeting.invitee_name} starting at {meeting.start_time}.",
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to=[meeting.organizer.email],
+        )
+        for meeting in Meeting.objects.filter(id__in=meeting_ids).select_related('organizer')
+    ]
+    sent = get_connection(fail_silently=True).send_messages(messages)
+    return f"Sent {sent or 0} reminder emails"
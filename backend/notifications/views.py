@@ -2,7 +2,7 @@ from rest_framework import generics, permissions, status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.filters import SearchFilter, OrderingFilter
+from rest_framework.filters import SearchFilter
 from django.utils import timezone
 from django.db.models import Q, Count
 from .models import (
@@ -14,15 +14,16 @@ from .serializers import (
     NotificationPreferenceSerializer, NotificationCreateSerializer,
     NotificationBatchSerializer, BulkNotificationSerializer
 )
+from utils.pagination import CreatedAtCursorPagination
 
 
 class NotificationListCreateView(generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    pagination_class = CreatedAtCursorPagination
+    # No OrderingFilter: the cursor only works on the indexed created_at ordering
+    filter_backends = [DjangoFilterBackend, SearchFilter]
     filterset_fields = ['category', 'priority', 'status', 'channel']
     search_fields = ['title', 'message']
-    ordering_fields = ['created_at', 'priority', 'scheduled_at']
-    ordering = ['-created_at']
 
     def get_queryset(self):
         return Notification.objects.filter(recipient=self.request.user)
@@ -44,6 +45,8 @@ class NotificationDetailView(generics.RetrieveUpdateDestroyAPIView):
 class UnreadNotificationsView(generics.ListAPIView):
     serializer_class = NotificationListSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = CreatedAtCursorPagination
+    filter_backends = []
 
     def get_queryset(self):
         return Notification.objects.filter(
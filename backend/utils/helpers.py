@@ -1,5 +1,5 @@
 from django.utils import timezone
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, tzinfo
 import uuid
 import secrets
 import string
@@ -66,27 +66,28 @@ def get_next_business_day(date):
 
 def convert_timezone(dt, from_tz, to_tz):
     """Convert datetime from one timezone to another"""
-    import pytz
+    from .timezones import get_zone
     
-    if isinstance(from_tz, str):
-        from_tz = pytz.timezone(from_tz)
-    if isinstance(to_tz, str):
-        to_tz = pytz.timezone(to_tz)
+    if not isinstance(from_tz, tzinfo):
+        from_tz = get_zone(from_tz)
+    if not isinstance(to_tz, tzinfo):
+        to_tz = get_zone(to_tz)
     
     # Localize if naive
     if dt.tzinfo is None:
-        dt = from_tz.localize(dt)
+        dt = dt.replace(tzinfo=from_tz)
     
     return dt.astimezone(to_tz)
 
 
 def get_user_local_time(user, dt=None):
     """Get current time or specific datetime in user's timezone"""
+    from .timezones import get_zone
+    
     if dt is None:
         dt = timezone.now()
     
-    user_tz = user.timezone
-    return convert_timezone(dt, 'UTC', str(user_tz))
+    return dt.astimezone(get_zone(user.timezone))
 
 
 def validate_meeting_time_slot(start_time, end_time, user, exclude_meeting_id=None):
@@ -106,6 +107,53 @@ def validate_meeting_time_slot(start_time, end_time, user, exclude_meeting_id=No
     return not conflicts.exists()
 
 
+def validate_meeting_time_slots(user, proposals):
+    """
+    Validate a batch of proposed meetings against an organizer's calendar.
+
+    proposals is a list of dicts with start_time, end_time and an optional
+    meeting_id for meetings being moved. Existing meetings are loaded with one
+    query and indexed in an interval tree together with the batch, so every
+    proposal is checked in O(log n). Returns one result per proposal with the
+    conflicting meeting ids and the indexes of overlapping proposals.
+    """
+    from meetings.models import Meeting
+    from availability.slots import BUSY_MEETING_STATUSES
+    from .interval_tree import IntervalTree
+
+    if not proposals:
+        return []
+
+    moved_ids = {proposal['meeting_id'] for proposal in proposals if proposal.get('meeting_id')}
+    existing = Meeting.objects.filter(
+        organizer=user,
+        status__in=BUSY_MEETING_STATUSES,
+        start_time__lt=max(proposal['end_time'] for proposal in proposals),
+        end_time__gt=min(proposal['start_time'] for proposal in proposals)
+    ).exclude(id__in=moved_ids).values_list('start_time', 'end_time', 'id')
+
+    meetings = IntervalTree(existing)
+    batch = IntervalTree(
+        (proposal['start_time'], proposal['end_time'], index)
+        for index, proposal in enumerate(proposals)
+    )
+
+    results = []
+    for index, proposal in enumerate(proposals):
+        conflicts = meetings.overlapping(proposal['start_time'], proposal['end_time'])
+        overlaps = [
+            other for other in batch.overlapping(proposal['start_time'], proposal['end_time'])
+            if other != index
+        ]
+        results.append({
+            'index': index,
+            'is_valid': not conflicts and not overlaps,
+            'conflicts': conflicts,
+            'overlapping_proposals': overlaps,
+        })
+    return results
+
+
 def send_notification_email(user, subject, message, html_content=None):
     """Send notification email to user"""
     from django.core.mail import send_mail
@@ -0,0 +1,58 @@
+"""
+Static interval tree for overlap queries.
+
+Intervals are sorted by start once and laid out as an implicit balanced tree
+over the sorted array, with each node keeping the largest end in its
+subtree. Building costs O(n log n) and each query O(log n + k) for k hits,
+so checking n proposals against m intervals is O((n + m) log m + k).
+"""
+from bisect import bisect_left
+
+
+class IntervalTree:
+    """Overlap queries over half-open [start, end) intervals with payloads"""
+
+    def __init__(self, intervals=()):
+        self.intervals = sorted(intervals, key=lambda item: (item[0], item[1]))
+        self.starts = [start for start, end, payload in self.intervals]
+        self.max_ends = [None] * len(self.intervals)
+        if self.intervals:
+            self._build(0, len(self.intervals) - 1)
+
+    def __len__(self):
+        return len(self.intervals)
+
+    def _build(self, low, high):
+        middle = (low + high) // 2
+        max_end = self.intervals[middle][1]
+        if low < middle:
+            max_end = max(max_end, self._build(low, middle - 1))
+        if middle < high:
+            max_end = max(max_end, self._build(middle + 1, high))
+        self.max_ends[middle] = max_end
+        return max_end
+
+    def overlapping(self, start, end):
+        """Payloads of intervals overlapping [start, end), ordered by start"""
+        # Only intervals starting before end can overlap
+        limit = bisect_left(self.starts, end) - 1
+        found = []
+        stack = [(0, len(self.intervals) - 1)] if limit >= 0 else []
+        while stack:
+            low, high = stack.pop()
+            if low > high or low > limit:
+                continue
+            middle = (low + high) // 2
+            if self.max_ends[middle] <= start:
+                continue
+            if middle <= limit:
+                interval_start, interval_end, payload = self.intervals[middle]
+                if interval_end > start:
+                    found.append((middle, payload))
+                stack.append((middle + 1, high))
+            stack.append((low, middle - 1))
+        found.sort(key=lambda item: item[0])
+        return [payload for position, payload in found]
+
+    def overlaps(self, start, end):
+        return bool(self.overlapping(start, end))
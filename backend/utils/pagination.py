@@ -0,0 +1,16 @@
+from rest_framework.pagination import CursorPagination
+
+
+class CreatedAtCursorPagination(CursorPagination):
+    """Keyset pagination on newest first, without COUNT or OFFSET queries"""
+    ordering = '-created_at'
+
+
+class StartTimeCursorPagination(CursorPagination):
+    """Keyset pagination on latest start time first"""
+    ordering = '-start_time'
+
+
+class StartedAtCursorPagination(CursorPagination):
+    """Keyset pagination on most recently started first"""
+    ordering = '-started_at'
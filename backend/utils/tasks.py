@@ -147,6 +147,24 @@ def process_workflow_execution(workflow_id, trigger_data):
         return f"Workflow {workflow_id} not found"
 
 
+@shared_task
+def process_workflow_executions(executions):
+    """Process a batch of (workflow_id, trigger_data) workflow executions in one task"""
+    from workflows.models import Workflow
+    
+    # Workflows deleted since the batch was queued are skipped
+    existing = set(Workflow.objects.filter(
+        id__in={workflow_id for workflow_id, trigger_data in executions}
+    ).values_list('id', flat=True))
+    processed = 0
+    for workflow_id, trigger_data in executions:
+        if workflow_id in existing:
+            process_workflow_execution(workflow_id, trigger_data)
+            processed += 1
+    
+    return f"Processed {processed} workflow executions"
+
+
 @shared_task
 def cleanup_old_notifications():
     """Clean up old notifications"""
@@ -0,0 +1,118 @@
+"""
+Cached timezone conversion.
+
+Zone objects and per-zone UTC offset transition tables are cached, so
+converting a list of timestamps is a binary search into a small table plus
+datetime arithmetic instead of a timezone lookup per item.
+"""
+from bisect import bisect_right
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+UTC = dt_timezone.utc
+
+# Offset changes are never closer together than this
+_SAMPLE_STEP = 24 * 60 * 60
+
+
+@lru_cache(maxsize=512)
+def get_zone(name):
+    """Return a cached zoneinfo object for a timezone name"""
+    return ZoneInfo(str(name))
+
+
+def is_valid_timezone(name):
+    """Check that a timezone name can be loaded"""
+    try:
+        get_zone(name)
+    except (ZoneInfoNotFoundError, ValueError, OSError):
+        # OSError covers names of tzdata directories such as "America"
+        return False
+    return True
+
+
+@lru_cache(maxsize=4096)
+def _fixed_offset(offset):
+    return dt_timezone(offset)
+
+
+def _month_start(day):
+    return day.replace(day=1)
+
+
+def _next_month_start(day):
+    return (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+@lru_cache(maxsize=1024)
+def transition_table(name, start_day, end_day):
+    """
+    UTC offset transitions for a zone between two dates.
+
+    Returns a tuple of (utc_timestamp, offset) pairs sorted by timestamp; each
+    offset applies from its timestamp until the next entry. Offsets are
+    sampled once per day and each change is located exactly by bisection.
+    """
+    zone = get_zone(name)
+
+    def offset_at(timestamp):
+        return datetime.fromtimestamp(timestamp, zone).utcoffset()
+
+    start_ts = int(datetime.combine(start_day, time.min, tzinfo=UTC).timestamp())
+    end_ts = int(datetime.combine(end_day, time.min, tzinfo=UTC).timestamp())
+
+    table = [(start_ts, offset_at(start_ts))]
+    previous_ts, previous_offset = table[0]
+    timestamp = start_ts + _SAMPLE_STEP
+    while timestamp <= end_ts:
+        offset = offset_at(timestamp)
+        if offset != previous_offset:
+            low, high = previous_ts, timestamp
+            while high - low > 1:
+                middle = (low + high) // 2
+                if offset_at(middle) == previous_offset:
+                    low = middle
+                else:
+                    high = middle
+            table.append((high, offset))
+        previous_ts, previous_offset = timestamp, offset
+        timestamp += _SAMPLE_STEP
+    return tuple(table)
+
+
+def convert_many(values, name):
+    """
+    Convert aware datetimes to a timezone in one pass.
+
+    The transition table for the covered months is computed once and cached,
+    so DST boundaries inside the range are handled without per-item lookups.
+    Results carry fixed-offset tzinfo with the correct offset for each instant.
+    """
+    if not values:
+        return []
+
+    timestamps = [value.timestamp() for value in values]
+    first = datetime.fromtimestamp(min(timestamps), UTC).date()
+    last = datetime.fromtimestamp(max(timestamps), UTC).date()
+    table = transition_table(str(name), _month_start(first), _next_month_start(last))
+    starts = [timestamp for timestamp, offset in table]
+
+    converted = []
+    for value, timestamp in zip(values, timestamps):
+        index = max(bisect_right(starts, timestamp) - 1, 0)
+        offset = table[index][1]
+        converted.append(
+            (value.astimezone(UTC) + offset).replace(tzinfo=_fixed_offset(offset))
+        )
+    return converted
+
+
+def localize_slots(slots, name):
+    """Render a list of {'start_time', 'end_time'} ISO slots in a timezone"""
+    starts = convert_many([datetime.fromisoformat(slot['start_time']) for slot in slots], name)
+    ends = convert_many([datetime.fromisoformat(slot['end_time']) for slot in slots], name)
+    return [
+        {'start_time': start.isoformat(), 'end_time': end.isoformat()}
+        for start, end in zip(starts, ends)
+    ]
@@ -73,6 +73,9 @@ class WorkflowExecution(models.Model):
 
     class Meta:
         ordering = ['-started_at']
+        indexes = [
+            models.Index(fields=['workflow', '-started_at']),
+        ]
 
     def __str__(self):
         return f"{self.workflow.name} execution - {self.status}"
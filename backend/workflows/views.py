@@ -11,6 +11,7 @@ from .serializers import (
     WorkflowActionSerializer, WorkflowTriggerSerializer,
     WorkflowFromTemplateSerializer
 )
+from utils.pagination import StartedAtCursorPagination
 
 
 class WorkflowListCreateView(generics.ListCreateAPIView):
@@ -41,9 +42,9 @@ class WorkflowDetailView(generics.RetrieveUpdateDestroyAPIView):
 class WorkflowExecutionListView(generics.ListAPIView):
     serializer_class = WorkflowExecutionSerializer
     permission_classes = [permissions.IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    pagination_class = StartedAtCursorPagination
+    filter_backends = [DjangoFilterBackend]
     filterset_fields = ['status', 'workflow']
-    ordering = ['-started_at']
 
     def get_queryset(self):
         workflow_id = self.kwargs.get('workflow_id')